@@ -0,0 +1,169 @@
+"""
+Browser Cache Module
+Disk cache Chrome bersama (persisten, dibatasi ukurannya) untuk asset statis
+"""
+
+from typing import Dict, List, Tuple
+import os
+import shutil
+import subprocess
+import threading
+import uuid
+
+
+class BrowserCache:
+    """
+    Disk cache Chrome yang dipakai bersama oleh semua driver
+
+    Chrome mengunci directory cache-nya, jadi setiap driver mendapat salinan
+    copy-on-write dari cache bersama (``cp --reflink=auto``: tanpa salinan data di
+    filesystem yang mendukung reflink, salinan biasa di filesystem lain). Saat driver
+    ditutup, entry baru dari salinan digabung kembali ke cache bersama, lalu entry
+    paling lama dibuang sampai ukuran cache di bawah ``max_size_mb``.
+
+    Struktur directory:
+        shared/            - cache bersama (persisten antar run)
+        workers/<id>/      - salinan per driver (dihapus saat check-in)
+
+    Hit rate dihitung dari Resource Timing di browser (lihat record_page).
+    """
+
+    # Index simple cache Chrome dibangun ulang dari entry jika tidak cocok
+    _INDEX_NAMES = ('index', 'index-dir')
+
+    def __init__(self, cache_dir: str = ".browser_cache", max_size_mb: float = 500.0):
+        """
+        Args:
+            cache_dir: Directory cache (persisten antar run)
+            max_size_mb: Batas ukuran cache bersama (MB)
+        """
+        self.cache_dir = cache_dir
+        self.max_size_mb = max_size_mb
+        self.shared_dir = os.path.join(cache_dir, 'shared')
+        self.workers_dir = os.path.join(cache_dir, 'workers')
+        os.makedirs(self.shared_dir, exist_ok=True)
+        os.makedirs(self.workers_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {'pages': 0, 'resources': 0, 'cache_hits': 0,
+                       'transferred_bytes': 0, 'cached_bytes': 0}
+
+    # ------------------------------------------------------------------
+    # Chrome
+    # ------------------------------------------------------------------
+
+    def chrome_arguments(self, worker_dir: str) -> List[str]:
+        """Argumen Chrome untuk memakai salinan cache worker"""
+        return [
+            f'--disk-cache-dir={os.path.abspath(worker_dir)}',
+            f'--disk-cache-size={int(self.max_size_mb * 1024 * 1024)}'
+        ]
+
+    # ------------------------------------------------------------------
+    # Check-out / check-in
+    # ------------------------------------------------------------------
+
+    def checkout(self) -> str:
+        """Buat salinan copy-on-write cache bersama untuk satu driver"""
+        worker_dir = os.path.join(self.workers_dir, uuid.uuid4().hex[:12])
+        with self._lock:
+            try:
+                subprocess.run(
+                    ['cp', '-a', '--reflink=auto', self.shared_dir, worker_dir],
+                    check=True, capture_output=True
+                )
+            except (OSError, subprocess.CalledProcessError):
+                shutil.copytree(self.shared_dir, worker_dir)
+        return worker_dir
+
+    def checkin(self, worker_dir: str):
+        """Gabungkan entry baru dari salinan worker ke cache bersama, lalu hapus salinannya"""
+        if not worker_dir or not os.path.isdir(worker_dir):
+            return
+        with self._lock:
+            for root, _, files in os.walk(worker_dir):
+                relative = os.path.relpath(root, worker_dir)
+                if self._is_index(relative):
+                    continue
+                target_root = os.path.normpath(os.path.join(self.shared_dir, relative))
+                for filename in files:
+                    if filename in self._INDEX_NAMES:
+                        continue
+                    source = os.path.join(root, filename)
+                    target = os.path.join(target_root, filename)
+                    try:
+                        if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source):
+                            continue
+                        os.makedirs(target_root, exist_ok=True)
+                        shutil.copy2(source, target)
+                    except OSError:
+                        continue
+            # Index lama tidak lagi cocok dengan entry; Chrome membangunnya ulang
+            for root, dirs, files in os.walk(self.shared_dir, topdown=True):
+                for name in [d for d in dirs if d in self._INDEX_NAMES]:
+                    shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+                    dirs.remove(name)
+                for name in [f for f in files if f in self._INDEX_NAMES]:
+                    os.remove(os.path.join(root, name))
+            self._evict()
+        shutil.rmtree(worker_dir, ignore_errors=True)
+
+    def _is_index(self, relative_path: str) -> bool:
+        return any(part in self._INDEX_NAMES for part in relative_path.split(os.sep))
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.shared_dir):
+            for filename in files:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        """Buang entry paling lama sampai ukuran cache di bawah batas"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_size_mb * 1024 * 1024
+        if total <= limit:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= limit:
+                break
+
+    def size_mb(self) -> float:
+        """Ukuran cache bersama (MB)"""
+        with self._lock:
+            return sum(size for _, size, _ in self._entries()) / (1024 * 1024)
+
+    def clear(self):
+        """Hapus seluruh cache bersama"""
+        with self._lock:
+            shutil.rmtree(self.shared_dir, ignore_errors=True)
+            os.makedirs(self.shared_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Hit rate
+    # ------------------------------------------------------------------
+
+    def record_page(self, resource_stats: Dict[str, int]):
+        """Tambahkan statistik cache satu halaman (hasil dom_probe.resource_cache_stats)"""
+        with self._lock:
+            self._stats['pages'] += 1
+            for key in ('resources', 'cache_hits', 'transferred_bytes', 'cached_bytes'):
+                self._stats[key] += resource_stats.get(key, 0)
+
+    def stats(self) -> Dict[str, float]:
+        """Ringkasan hit rate dan byte yang tidak perlu diunduh"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['hit_rate'] = round(stats['cache_hits'] / stats['resources'], 3) if stats['resources'] else 0.0
+        return stats
@@ -3,13 +3,75 @@ Capability Analyzer Module
 Menganalisis data scraping untuk mendeteksi output capability
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
 from bs4 import BeautifulSoup
+import json
 import re
 
+from result_models import CapabilityVerdict, AggregatedCapability
+from page_fingerprint import cluster_fingerprints
+from url_sampler import SamplingPlan
+
+
+def _dimension(value: Any) -> float:
+    """Dimensi elemen sebagai angka (atribut HTML bisa berupa string seperti '400' atau '100%')"""
+    if isinstance(value, (int, float)):
+        return value
+    match = re.match(r'\s*(\d+(?:\.\d+)?)\s*(px)?\s*$', str(value or ''))
+    return float(match.group(1)) if match else 0
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Persentil q (0-100) dari list terurut, interpolasi linear antar nilai"""
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+# Persentil metrik performa per website
+PERFORMANCE_PERCENTILES = (50, 75, 95)
+
+# Tingkat kepercayaan dari rendah ke tinggi
+CONFIDENCE_LEVELS = ('rendah', 'sedang', 'tinggi')
+
+# Hasil detektor: (sinyal, teks bukti atau None, indicators)
+Finding = Tuple[str, Optional[str], Dict[str, Any]]
+
+
+class Detector:
+    """
+    Satu detektor sinyal capability
+    
+    ``cost`` adalah biaya relatif (scan seluruh HTML jauh lebih mahal dari membaca
+    hitungan DOM), ``signals`` adalah sinyal yang bisa dihasilkan beserta tingkat
+    kepercayaan minimum yang diberikan sinyal tersebut. Detektor ``structural`` hanya
+    bergantung pada struktur halaman (class, event handler), sehingga hasilnya bisa
+    dipakai ulang untuk halaman lain dengan template yang sama.
+    """
+    
+    __slots__ = ('name', 'cost', 'signals', 'detect', 'structural')
+    
+    def __init__(self, name: str, cost: int, signals: Dict[str, str],
+                 detect: Callable[[Dict[str, Any], Dict[str, Any]], List[Finding]],
+                 structural: bool = False):
+        self.name = name
+        self.cost = cost
+        self.signals = signals
+        self.detect = detect
+        self.structural = structural
+
 
 class CapabilityAnalyzer:
-    """Analyzer untuk mendeteksi output capability dari data scraping"""
+    """
+    Analyzer untuk mendeteksi output capability dari data scraping
+    
+    Setiap capability dievaluasi oleh sekumpulan Detector. Secara default detektor
+    dijalankan dari yang termurah dan evaluasi berhenti jika detektor yang tersisa
+    tidak bisa lagi mengubah verdict (supported dan confidence). Dengan
+    ``full_evidence=True`` semua detektor dijalankan sehingga daftar bukti lengkap
+    (untuk laporan).
+    """
     
     CAPABILITIES = [
         'output_grafik_chart',
@@ -20,7 +82,30 @@ class CapabilityAnalyzer:
         'output_berbasis_api'
     ]
     
-    def __init__(self):
+    def __init__(self, full_evidence: bool = False):
+        """
+        Args:
+            full_evidence: Jalankan semua detektor (bukti lengkap) walaupun verdict sudah pasti
+        """
+        self.full_evidence = full_evidence
+        self.cluster_stats = None
+        self.detectors = self._build_detectors()
+        self._signal_effects = {
+            capability: {signal: effect for detector in detectors for signal, effect in detector.signals.items()}
+            for capability, detectors in self.detectors.items()
+        }
+        # Urutan biaya dan sinyal yang masih mungkin muncul sebelum detektor ke-i
+        self._cost_order = {
+            capability: sorted(detectors, key=lambda detector: detector.cost)
+            for capability, detectors in self.detectors.items()
+        }
+        self._pending_signals = {}
+        for capability, detectors in self._cost_order.items():
+            pending = [set(detector.signals) for detector in detectors]
+            for index in range(len(pending) - 2, -1, -1):
+                pending[index] |= pending[index + 1]
+            self._pending_signals[capability] = pending
+        
         self.capability_names = {
             'output_grafik_chart': 'Output Grafik / Chart',
             'output_data_tabel': 'Output Data Tabel',
@@ -30,12 +115,16 @@ class CapabilityAnalyzer:
             'output_berbasis_api': 'Output Berbasis API'
         }
     
-    def analyze_all_capabilities(self, scrape_data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_all_capabilities(self, scrape_data: Dict[str, Any], full_evidence: bool = None) -> Dict[str, Any]:
         """
         Analisis semua capability dari data scraping
         
+        Args:
+            scrape_data: Hasil scraping satu URL
+            full_evidence: Jalankan semua detektor (default: setting analyzer)
+        
         Returns:
-            Dict dengan key capability dan value berisi:
+            Dict dengan key capability dan value CapabilityVerdict berisi:
             - supported: bool
             - confidence: 'tinggi' | 'sedang' | 'rendah'
             - evidence: List[str] bukti teknis
@@ -45,186 +134,307 @@ class CapabilityAnalyzer:
         if 'error' in scrape_data:
             return self._empty_capabilities()
         
-        results = {}
+        if full_evidence is None:
+            full_evidence = self.full_evidence
+        return self._analyze_page(scrape_data, full_evidence)[0]
+    
+    def _analyze_page(
+        self,
+        scrape_data: Dict[str, Any],
+        full_evidence: bool,
+        template: Dict[str, List[Finding]] = None
+    ) -> Tuple[Dict[str, CapabilityVerdict], Dict[str, List[Finding]]]:
+        """
+        Analisis satu halaman
         
-        # Analisis setiap capability
-        results['output_grafik_chart'] = self._analyze_chart_output(scrape_data)
-        results['output_data_tabel'] = self._analyze_table_output(scrape_data)
-        results['output_file'] = self._analyze_file_output(scrape_data)
-        results['output_dinamis_realtime'] = self._analyze_realtime_output(scrape_data)
-        results['output_interaktif'] = self._analyze_interactive_output(scrape_data)
-        results['output_berbasis_api'] = self._analyze_api_output(scrape_data)
+        Args:
+            template: Hasil detektor struktural halaman lain dengan struktur sama
+                (dipakai tanpa menjalankan ulang detektornya)
         
-        return results
+        Returns:
+            (verdict per capability, hasil detektor struktural halaman ini)
+        """
+        # Hasil antara yang dipakai beberapa detektor (misalnya HTML yang sudah di-parse)
+        context = {'template': template or {}, 'structural': {}}
+        verdicts = {
+            capability: self._evaluate(capability, scrape_data, context, full_evidence)
+            for capability in self.CAPABILITIES
+        }
+        return verdicts, context['structural']
     
-    def _empty_capabilities(self) -> Dict[str, Any]:
+    def _empty_capabilities(self) -> Dict[str, CapabilityVerdict]:
         """Return empty capabilities untuk error case"""
+        return {cap: CapabilityVerdict() for cap in self.CAPABILITIES}
+    
+    # ------------------------------------------------------------------
+    # Evaluasi detektor
+    # ------------------------------------------------------------------
+    
+    def _build_detectors(self) -> Dict[str, List[Detector]]:
+        """Detektor per capability (urutan = urutan bukti di laporan)"""
         return {
-            cap: {
-                'supported': False,
-                'confidence': 'rendah',
-                'evidence': [],
-                'indicators': {}
-            }
-            for cap in self.CAPABILITIES
+            'output_grafik_chart': [
+                Detector('canvas', 1, {'canvas': 'rendah'}, self._detect_canvas),
+                Detector('svg', 1, {'svg': 'rendah'}, self._detect_svg),
+                Detector('chart_libraries', 1, {'chart_library': 'tinggi'}, self._detect_chart_libraries),
+                Detector('large_charts', 2, {'large_chart': 'sedang'}, self._detect_large_charts),
+                Detector('chart_classes', 50, {'chart_class': 'sedang'}, self._detect_chart_classes,
+                         structural=True),
+            ],
+            'output_data_tabel': [
+                Detector('tables', 2, {'tables': 'rendah', 'significant_tables': 'sedang',
+                                       'tables_with_header': 'tinggi'}, self._detect_tables),
+                Detector('table_libraries', 1, {'table_library': 'tinggi'}, self._detect_table_libraries),
+                Detector('grid_classes', 50, {'grid_class': 'rendah'}, self._detect_grid_classes,
+                         structural=True),
+            ],
+            'output_file': [
+                Detector('download_elements', 2, {'download_elements': 'rendah', 'file_types': 'tinggi'},
+                         self._detect_download_elements),
+                Detector('download_requests', 3, {'download_requests': 'sedang'}, self._detect_download_requests),
+            ],
+            'output_dinamis_realtime': [
+                # Biaya 0: hasil pengukuran harus diketahui sebelum early exit, karena
+                # 'no_measured_updates' bisa membatalkan sinyal statis di bawah
+                Detector('measured_updates', 0, {'measured_updates': 'tinggi', 'no_measured_updates': 'rendah'},
+                         self._detect_measured_updates),
+                Detector('websocket', 1, {'websocket': 'tinggi', 'websocket_frames': 'tinggi',
+                                          'websocket_connection': 'sedang'}, self._detect_websocket),
+                Detector('sse', 2, {'sse': 'tinggi'}, self._detect_sse),
+                Detector('polling', 3, {'polling': 'sedang'}, self._detect_polling),
+                Detector('realtime_logs', 3, {'realtime_logs': 'rendah'}, self._detect_realtime_logs),
+            ],
+            'output_interaktif': [
+                Detector('inputs', 1, {'inputs': 'rendah', 'input_variety': 'sedang'}, self._detect_inputs),
+                Detector('forms', 1, {'forms': 'rendah'}, self._detect_forms),
+                Detector('xhr_interaction', 2, {'xhr_interaction': 'tinggi'}, self._detect_xhr_interaction),
+                Detector('event_handlers', 50, {'event_handlers': 'sedang'}, self._detect_event_handlers,
+                         structural=True),
+            ],
+            'output_berbasis_api': [
+                Detector('api_requests', 3, {'api_requests': 'rendah', 'successful_api': 'tinggi'},
+                         self._detect_api_requests),
+                Detector('json_responses', 10, {'json_responses': 'tinggi'}, self._detect_json_responses),
+                Detector('http_libraries', 1, {'http_library': 'rendah'}, self._detect_http_libraries),
+            ],
         }
     
-    def _analyze_chart_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output Grafik / Chart"""
+    # Sinyal minimum agar capability dianggap didukung
+    SUPPORT_RULES = {
+        'output_grafik_chart': lambda s: bool(s & {'canvas', 'svg', 'chart_library'}),
+        'output_data_tabel': lambda s: 'table_library' in s or (
+            'tables' in s and bool(s & {'significant_tables', 'grid_class'})),
+        'output_file': lambda s: bool(s),
+        # Jika update diukur dan tidak ada, pola kode (WebSocket, log) saja tidak cukup
+        'output_dinamis_realtime': lambda s: bool(s & {'measured_updates', 'websocket_frames', 'sse', 'polling'}) or (
+            'no_measured_updates' not in s and bool(s & {'websocket', 'websocket_connection', 'realtime_logs'})),
+        'output_interaktif': lambda s: 'inputs' in s,
+        'output_berbasis_api': lambda s: 'api_requests' in s,
+    }
+    
+    def _decide(self, capability: str, signals: Set[str]) -> Tuple[bool, str]:
+        """Verdict (supported, confidence) dari sinyal yang ditemukan"""
+        if not self.SUPPORT_RULES[capability](signals):
+            return False, 'rendah'
+        effects = self._signal_effects[capability]
+        return True, max((effects[s] for s in signals), key=CONFIDENCE_LEVELS.index, default='rendah')
+    
+    def _evaluate(self, capability: str, data: Dict[str, Any], context: Dict[str, Any],
+                  full_evidence: bool) -> CapabilityVerdict:
+        """
+        Jalankan detektor satu capability
+        
+        Mode full_evidence menjalankan semua detektor sesuai urutan. Mode cepat
+        menjalankan detektor termurah dahulu dan berhenti jika sinyal yang tersisa
+        (dianggap semuanya ditemukan) tidak bisa mengubah verdict.
+        """
+        detectors = self.detectors[capability]
+        if not full_evidence:
+            detectors = self._cost_order[capability]
         
+        signals: Set[str] = set()
         evidence = []
         indicators = {}
-        confidence = 'rendah'
-        
-        dom = data.get('dom_elements', {})
-        js_libs = data.get('javascript_libraries', [])
-        
-        # Cek canvas dan SVG
-        canvas_count = dom.get('canvas_count', 0)
-        svg_count = dom.get('svg_count', 0)
-        chart_containers = dom.get('chart_containers', [])
-        
+        for index, detector in enumerate(detectors):
+            if not full_evidence:
+                pending = self._pending_signals[capability][index]
+                if self._decide(capability, signals) == self._decide(capability, signals | pending):
+                    break
+            for signal, text, details in self._run_detector(detector, data, context):
+                signals.add(signal)
+                if text:
+                    evidence.append(text)
+                indicators.update(details)
+        
+        supported, confidence = self._decide(capability, signals)
+        return CapabilityVerdict(
+            supported=supported,
+            confidence=confidence,
+            evidence=evidence,
+            indicators=indicators
+        )
+    
+    def _run_detector(self, detector: Detector, data: Dict[str, Any], context: Dict[str, Any]) -> List[Finding]:
+        """Jalankan detektor; detektor struktural memakai hasil template jika ada"""
+        if not detector.structural:
+            return detector.detect(data, context)
+        template = context.get('template', {})
+        if detector.name in template:
+            findings = template[detector.name]
+        else:
+            findings = detector.detect(data, context)
+        context.setdefault('structural', {})[detector.name] = findings
+        return findings
+    
+    def _soup(self, data: Dict[str, Any], context: Dict[str, Any]) -> Optional[BeautifulSoup]:
+        """HTML halaman yang sudah di-parse (sekali per halaman); None jika HTML tidak ada"""
+        if 'soup' not in context:
+            html = data.get('html', '')
+            context['soup'] = BeautifulSoup(html, 'html.parser') if html else None
+        return context['soup']
+    
+    def _analyze_chart_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output Grafik / Chart"""
+        return self._evaluate('output_grafik_chart', data, {}, self.full_evidence)
+    
+    def _analyze_table_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output Data Tabel"""
+        return self._evaluate('output_data_tabel', data, {}, self.full_evidence)
+    
+    def _analyze_file_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output File (Download)"""
+        return self._evaluate('output_file', data, {}, self.full_evidence)
+    
+    def _analyze_realtime_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output Dinamis / Real-time"""
+        return self._evaluate('output_dinamis_realtime', data, {}, self.full_evidence)
+    
+    def _analyze_interactive_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output Interaktif"""
+        return self._evaluate('output_interaktif', data, {}, self.full_evidence)
+    
+    def _analyze_api_output(self, data: Dict[str, Any]) -> CapabilityVerdict:
+        """Deteksi Output Berbasis API"""
+        return self._evaluate('output_berbasis_api', data, {}, self.full_evidence)
+    
+    # ------------------------------------------------------------------
+    # Detektor: Output Grafik / Chart
+    # ------------------------------------------------------------------
+    
+    def _detect_canvas(self, data, context) -> List[Finding]:
+        canvas_count = data.get('dom_elements', {}).get('canvas_count', 0)
         if canvas_count > 0:
-            evidence.append(f"Ditemukan {canvas_count} elemen <canvas>")
-            indicators['canvas_count'] = canvas_count
-        
+            return [('canvas', f"Ditemukan {canvas_count} elemen <canvas>", {'canvas_count': canvas_count})]
+        return []
+    
+    def _detect_svg(self, data, context) -> List[Finding]:
+        svg_count = data.get('dom_elements', {}).get('svg_count', 0)
         if svg_count > 0:
-            evidence.append(f"Ditemukan {svg_count} elemen <svg>")
-            indicators['svg_count'] = svg_count
-        
-        # Cek chart libraries
-        chart_libs = [lib for lib in js_libs if any(x in lib.lower() for x in 
+            return [('svg', f"Ditemukan {svg_count} elemen <svg>", {'svg_count': svg_count})]
+        return []
+    
+    def _detect_chart_libraries(self, data, context) -> List[Finding]:
+        chart_libs = [lib for lib in data.get('javascript_libraries', []) if any(x in lib.lower() for x in
                      ['chart', 'd3', 'highchart', 'echarts', 'apex', 'plotly', 'google charts'])]
-        
         if chart_libs:
-            evidence.append(f"Terdeteksi library chart: {', '.join(chart_libs)}")
-            indicators['chart_libraries'] = chart_libs
-            confidence = 'tinggi'
-        
-        # Analisis chart containers
-        if chart_containers:
-            large_charts = [c for c in chart_containers if c.get('width', 0) > 200 and c.get('height', 0) > 200]
-            if large_charts:
-                evidence.append(f"Ditemukan {len(large_charts)} chart dengan dimensi signifikan")
-                indicators['large_charts'] = len(large_charts)
-                if confidence == 'rendah':
-                    confidence = 'sedang'
-        
-        # Cek HTML untuk class/id chart
-        html = data.get('html', '')
-        if html:
-            soup = BeautifulSoup(html, 'html.parser')
-            chart_elements = soup.find_all(class_=re.compile(r'chart|graph|plot|visualization', re.I))
-            if chart_elements:
-                evidence.append(f"Ditemukan {len(chart_elements)} elemen dengan class chart/graph")
-                indicators['chart_css_classes'] = len(chart_elements)
-                if confidence == 'rendah':
-                    confidence = 'sedang'
-        
-        supported = len(evidence) > 0 and (canvas_count > 0 or svg_count > 0 or len(chart_libs) > 0)
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
-        }
+            return [('chart_library', f"Terdeteksi library chart: {', '.join(chart_libs)}",
+                     {'chart_libraries': chart_libs})]
+        return []
     
-    def _analyze_table_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output Data Tabel"""
-        
-        evidence = []
-        indicators = {}
-        confidence = 'rendah'
-        
-        dom = data.get('dom_elements', {})
-        js_libs = data.get('javascript_libraries', [])
-        
-        # Cek tabel dari DOM analysis
-        tables = dom.get('tables', [])
-        table_count = dom.get('table_count', 0)
-        
-        if tables:
-            # Filter tabel dengan data signifikan
-            significant_tables = [t for t in tables if t.get('rows', 0) > 2 and t.get('cols', 0) > 2]
-            
-            if significant_tables:
-                evidence.append(f"Ditemukan {len(significant_tables)} tabel dengan data signifikan")
-                indicators['significant_tables'] = len(significant_tables)
-                confidence = 'sedang'
-                
-                # Cek header
-                tables_with_header = [t for t in significant_tables if t.get('has_header', False)]
-                if tables_with_header:
-                    evidence.append(f"{len(tables_with_header)} tabel memiliki header")
-                    indicators['tables_with_header'] = len(tables_with_header)
-                    confidence = 'tinggi'
-        
-        # Cek table/grid libraries
-        table_libs = [lib for lib in js_libs if any(x in lib.lower() for x in 
+    def _detect_large_charts(self, data, context) -> List[Finding]:
+        chart_containers = data.get('dom_elements', {}).get('chart_containers', [])
+        large_charts = [c for c in chart_containers
+                        if _dimension(c.get('width')) > 200 and _dimension(c.get('height')) > 200]
+        if large_charts:
+            return [('large_chart', f"Ditemukan {len(large_charts)} chart dengan dimensi signifikan",
+                     {'large_charts': len(large_charts)})]
+        return []
+    
+    def _detect_chart_classes(self, data, context) -> List[Finding]:
+        # Class/id chart dari HTML (atau hitungan dari browser jika HTML tidak disimpan)
+        soup = self._soup(data, context)
+        if soup is not None:
+            chart_class_count = len(soup.find_all(class_=re.compile(r'chart|graph|plot|visualization', re.I)))
+        else:
+            chart_class_count = data.get('dom_elements', {}).get('chart_class_count') or 0
+        if chart_class_count:
+            return [('chart_class', f"Ditemukan {chart_class_count} elemen dengan class chart/graph",
+                     {'chart_css_classes': chart_class_count})]
+        return []
+    
+    # ------------------------------------------------------------------
+    # Detektor: Output Data Tabel
+    # ------------------------------------------------------------------
+    
+    def _detect_tables(self, data, context) -> List[Finding]:
+        tables = data.get('dom_elements', {}).get('tables', [])
+        if not tables:
+            return []
+        findings = [('tables', None, {})]
+        
+        # Filter tabel dengan data signifikan
+        significant_tables = [t for t in tables if t.get('rows', 0) > 2 and t.get('cols', 0) > 2]
+        if significant_tables:
+            findings.append(('significant_tables',
+                             f"Ditemukan {len(significant_tables)} tabel dengan data signifikan",
+                             {'significant_tables': len(significant_tables)}))
+            tables_with_header = [t for t in significant_tables if t.get('has_header', False)]
+            if tables_with_header:
+                findings.append(('tables_with_header', f"{len(tables_with_header)} tabel memiliki header",
+                                 {'tables_with_header': len(tables_with_header)}))
+        return findings
+    
+    def _detect_table_libraries(self, data, context) -> List[Finding]:
+        table_libs = [lib for lib in data.get('javascript_libraries', []) if any(x in lib.lower() for x in
                      ['datatable', 'ag grid', 'gridstack'])]
-        
         if table_libs:
-            evidence.append(f"Terdeteksi library tabel/grid: {', '.join(table_libs)}")
-            indicators['table_libraries'] = table_libs
-            confidence = 'tinggi'
-        
-        # Cek class CSS untuk grid/table
-        html = data.get('html', '')
-        if html:
-            soup = BeautifulSoup(html, 'html.parser')
-            grid_elements = soup.find_all(class_=re.compile(r'grid|datatable|table-responsive', re.I))
-            if grid_elements and len(grid_elements) > 0:
-                evidence.append(f"Ditemukan {len(grid_elements)} elemen dengan class grid/datatable")
-                indicators['grid_css_classes'] = len(grid_elements)
-        
-        supported = len(evidence) > 0 and (len(tables) > 0 or len(table_libs) > 0)
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
-        }
+            return [('table_library', f"Terdeteksi library tabel/grid: {', '.join(table_libs)}",
+                     {'table_libraries': table_libs})]
+        return []
     
-    def _analyze_file_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output File (Download)"""
-        
-        evidence = []
-        indicators = {}
-        confidence = 'rendah'
-        
-        dom = data.get('dom_elements', {})
-        network = data.get('network_requests', [])
-        
-        # Cek download elements dari DOM
-        download_elements = dom.get('download_elements', [])
-        
-        if download_elements:
-            evidence.append(f"Ditemukan {len(download_elements)} elemen download")
-            indicators['download_elements'] = len(download_elements)
-            
-            # Group by file type
-            file_types = set()
-            for elem in download_elements:
-                href = elem.get('href', '').lower()
-                if '.csv' in href or 'csv' in elem.get('text', '').lower():
-                    file_types.add('CSV')
-                if '.xls' in href or 'excel' in elem.get('text', '').lower():
-                    file_types.add('Excel')
-                if '.pdf' in href or 'pdf' in elem.get('text', '').lower():
-                    file_types.add('PDF')
-                if any(ext in href for ext in ['.jpg', '.png', '.gif', '.svg']):
-                    file_types.add('Image')
-            
-            if file_types:
-                evidence.append(f"Jenis file: {', '.join(file_types)}")
-                indicators['file_types'] = list(file_types)
-                confidence = 'tinggi'
-        
-        # Cek network requests untuk download
+    def _detect_grid_classes(self, data, context) -> List[Finding]:
+        soup = self._soup(data, context)
+        if soup is not None:
+            grid_class_count = len(soup.find_all(class_=re.compile(r'grid|datatable|table-responsive', re.I)))
+        else:
+            grid_class_count = data.get('dom_elements', {}).get('grid_class_count') or 0
+        if grid_class_count:
+            return [('grid_class', f"Ditemukan {grid_class_count} elemen dengan class grid/datatable",
+                     {'grid_css_classes': grid_class_count})]
+        return []
+    
+    # ------------------------------------------------------------------
+    # Detektor: Output File
+    # ------------------------------------------------------------------
+    
+    def _detect_download_elements(self, data, context) -> List[Finding]:
+        download_elements = data.get('dom_elements', {}).get('download_elements', [])
+        if not download_elements:
+            return []
+        findings = [('download_elements', f"Ditemukan {len(download_elements)} elemen download",
+                     {'download_elements': len(download_elements)})]
+        
+        # Group by file type
+        file_types = set()
+        for elem in download_elements:
+            href = elem.get('href', '').lower()
+            if '.csv' in href or 'csv' in elem.get('text', '').lower():
+                file_types.add('CSV')
+            if '.xls' in href or 'excel' in elem.get('text', '').lower():
+                file_types.add('Excel')
+            if '.pdf' in href or 'pdf' in elem.get('text', '').lower():
+                file_types.add('PDF')
+            if any(ext in href for ext in ['.jpg', '.png', '.gif', '.svg']):
+                file_types.add('Image')
+        
+        if file_types:
+            findings.append(('file_types', f"Jenis file: {', '.join(file_types)}",
+                             {'file_types': list(file_types)}))
+        return findings
+    
+    def _detect_download_requests(self, data, context) -> List[Finding]:
         download_requests = []
-        for req in network:
+        for req in data.get('network_requests', []):
             content_type = req.get('content_type', '').lower()
             url = req.get('url', '').lower()
             
@@ -244,257 +454,391 @@ class CapabilityAnalyzer:
                 download_requests.append(req)
         
         if download_requests:
-            evidence.append(f"Ditemukan {len(download_requests)} request download di network")
-            indicators['download_requests'] = len(download_requests)
-            if confidence == 'rendah':
-                confidence = 'sedang'
-        
-        supported = len(evidence) > 0
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
+            return [('download_requests', f"Ditemukan {len(download_requests)} request download di network",
+                     {'download_requests': len(download_requests)})]
+        return []
+    
+    # ------------------------------------------------------------------
+    # Detektor: Output Dinamis / Real-time
+    # ------------------------------------------------------------------
+    
+    # Update per detik minimum (dan jumlah update minimum) agar halaman dianggap live
+    MIN_UPDATES_PER_SECOND = 0.1
+    MIN_UPDATES = 2
+    
+    def _detect_measured_updates(self, data, context) -> List[Finding]:
+        update_rate = data.get('update_rate')
+        if not update_rate:
+            return []
+        indicators = {
+            'updates_per_second': update_rate.get('updates_per_second', 0),
+            'canvas_changes': update_rate.get('canvas_changes', 0),
+            'observed_seconds': round(update_rate.get('duration_ms', 0) / 1000, 1)
         }
+        latency = update_rate.get('latency_ms')
+        if latency:
+            indicators['update_latency_p50_ms'] = latency['p50']
+        if update_rate.get('updates', 0) < self.MIN_UPDATES \
+                or indicators['updates_per_second'] < self.MIN_UPDATES_PER_SECOND:
+            return [('no_measured_updates', None, indicators)]
+        
+        text = (f"Terukur {indicators['updates_per_second']} update/detik selama "
+                f"{indicators['observed_seconds']:g} detik")
+        top = update_rate.get('elements') or []
+        if top:
+            text += f" (tersering: {top[0]['element']}, {top[0]['per_second']}/detik)"
+        if latency:
+            text += f", latensi data ke tampilan p50 {latency['p50']} ms"
+        return [('measured_updates', text, indicators)]
     
-    def _analyze_realtime_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output Dinamis / Real-time"""
-        
-        evidence = []
-        indicators = {}
-        confidence = 'rendah'
-        
-        websocket = data.get('websocket_detected', False)
+    def _detect_websocket(self, data, context) -> List[Finding]:
+        stats = data.get('websocket_stats')
+        if stats is None:
+            # Tanpa pengukuran: hanya pola kode di HTML
+            if data.get('websocket_detected', False):
+                return [('websocket', "WebSocket terdeteksi", {'websocket': True})]
+            return []
+        
+        # Frame terukur (CDP) menggantikan pola kode
+        if not stats.get('connections'):
+            return []
+        indicators = {
+            'websocket_connections': stats['connections'],
+            'websocket_messages_per_second': stats.get('messages_per_second', 0)
+        }
+        if not stats.get('frames_received'):
+            return [('websocket_connection',
+                     f"{stats['connections']} koneksi WebSocket terbuka, tanpa pesan selama "
+                     f"{stats.get('window_seconds', 0):g} detik observasi", indicators)]
+        
+        text = (f"{stats['connections']} koneksi WebSocket, {stats['frames_received']} pesan diterima "
+                f"({stats['messages_per_second']}/detik)")
+        payload = stats.get('payload_bytes')
+        if payload:
+            indicators['websocket_payload_p50_bytes'] = payload['p50']
+            text += f", payload median {payload['p50']} byte (p95 {payload['p95']})"
+        return [('websocket_frames', text, indicators)]
+    
+    def _detect_sse(self, data, context) -> List[Finding]:
         network = data.get('network_requests', [])
-        
-        # Cek WebSocket
-        if websocket:
-            evidence.append("WebSocket terdeteksi")
-            indicators['websocket'] = True
-            confidence = 'tinggi'
-        
-        # Cek SSE (Server-Sent Events)
         sse_requests = [req for req in network if 'text/event-stream' in req.get('content_type', '')]
         if sse_requests:
-            evidence.append(f"Ditemukan {len(sse_requests)} koneksi Server-Sent Events")
-            indicators['sse_connections'] = len(sse_requests)
-            confidence = 'tinggi'
-        
-        # Cek polling (multiple requests ke endpoint yang sama)
+            return [('sse', f"Ditemukan {len(sse_requests)} koneksi Server-Sent Events",
+                     {'sse_connections': len(sse_requests)})]
+        return []
+    
+    def _detect_polling(self, data, context) -> List[Finding]:
+        # Polling: banyak request XHR/fetch ke endpoint yang sama
         url_counts = {}
-        for req in network:
+        for req in data.get('network_requests', []):
             if req.get('resource_type') in ['xhr', 'fetch']:
                 url = req.get('url', '')
                 url_counts[url] = url_counts.get(url, 0) + 1
         
         polling_urls = {url: count for url, count in url_counts.items() if count >= 3}
         if polling_urls:
-            evidence.append(f"Terdeteksi {len(polling_urls)} endpoint dengan polling pattern")
-            indicators['polling_endpoints'] = len(polling_urls)
-            if confidence == 'rendah':
-                confidence = 'sedang'
-        
-        # Cek dari console logs
-        console = data.get('console_logs', [])
+            return [('polling', f"Terdeteksi {len(polling_urls)} endpoint dengan polling pattern",
+                     {'polling_endpoints': len(polling_urls)})]
+        return []
+    
+    def _detect_realtime_logs(self, data, context) -> List[Finding]:
         realtime_keywords = ['websocket', 'socket.io', 'sse', 'realtime', 'live update']
-        realtime_logs = [log for log in console if any(kw in log.get('text', '').lower() for kw in realtime_keywords)]
-        
+        realtime_logs = [log for log in data.get('console_logs', [])
+                         if any(kw in log.get('text', '').lower() for kw in realtime_keywords)]
         if realtime_logs:
-            evidence.append(f"Ditemukan {len(realtime_logs)} log terkait real-time")
-            indicators['realtime_logs'] = len(realtime_logs)
-        
-        supported = len(evidence) > 0
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
-        }
+            return [('realtime_logs', f"Ditemukan {len(realtime_logs)} log terkait real-time",
+                     {'realtime_logs': len(realtime_logs)})]
+        return []
     
-    def _analyze_interactive_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output Interaktif"""
-        
-        evidence = []
-        indicators = {}
-        confidence = 'rendah'
-        
-        dom = data.get('dom_elements', {})
-        inputs = dom.get('inputs', {})
-        
-        # Hitung total interactive inputs
+    # ------------------------------------------------------------------
+    # Detektor: Output Interaktif
+    # ------------------------------------------------------------------
+    
+    def _detect_inputs(self, data, context) -> List[Finding]:
+        inputs = data.get('dom_elements', {}).get('inputs', {})
         total_inputs = sum(inputs.values())
-        
-        if total_inputs > 0:
-            evidence.append(f"Ditemukan {total_inputs} elemen input interaktif")
-            indicators['total_inputs'] = total_inputs
-            indicators['input_breakdown'] = inputs
-            
-            # Jika ada berbagai jenis input, lebih mungkin interaktif
-            input_types = [k for k, v in inputs.items() if v > 0]
-            if len(input_types) >= 2:
-                evidence.append(f"Beragam tipe input: {', '.join(input_types)}")
-                confidence = 'sedang'
-        
-        # Cek form elements
-        form_count = dom.get('form_count', 0)
+        if total_inputs <= 0:
+            return []
+        findings = [('inputs', f"Ditemukan {total_inputs} elemen input interaktif",
+                     {'total_inputs': total_inputs, 'input_breakdown': inputs})]
+        
+        # Jika ada berbagai jenis input, lebih mungkin interaktif
+        input_types = [k for k, v in inputs.items() if v > 0]
+        if len(input_types) >= 2:
+            findings.append(('input_variety', f"Beragam tipe input: {', '.join(input_types)}", {}))
+        return findings
+    
+    def _detect_forms(self, data, context) -> List[Finding]:
+        form_count = data.get('dom_elements', {}).get('form_count', 0)
         if form_count > 0:
-            evidence.append(f"Ditemukan {form_count} form")
-            indicators['form_count'] = form_count
-        
-        # Cek event listeners dari network (XHR/fetch setelah interaction)
+            return [('forms', f"Ditemukan {form_count} form", {'form_count': form_count})]
+        return []
+    
+    def _detect_xhr_interaction(self, data, context) -> List[Finding]:
+        # XHR/fetch pada halaman dengan input (kemungkinan dari interaksi)
+        if sum(data.get('dom_elements', {}).get('inputs', {}).values()) <= 0:
+            return []
         network = data.get('network_requests', [])
         xhr_requests = [req for req in network if req.get('resource_type') in ['xhr', 'fetch']]
-        
-        if xhr_requests and total_inputs > 0:
-            evidence.append(f"Ditemukan {len(xhr_requests)} XHR/Fetch request (kemungkinan dari interaksi)")
-            indicators['xhr_requests'] = len(xhr_requests)
-            confidence = 'tinggi'
-        
-        # Cek dari HTML untuk event handlers
-        html = data.get('html', '')
-        if html:
-            soup = BeautifulSoup(html, 'html.parser')
-            interactive_elements = soup.find_all(attrs={'onclick': True})
-            interactive_elements += soup.find_all(attrs={'onchange': True})
-            
-            if interactive_elements:
-                evidence.append(f"Ditemukan {len(interactive_elements)} elemen dengan event handler")
-                indicators['event_handlers'] = len(interactive_elements)
-                if confidence == 'rendah':
-                    confidence = 'sedang'
-        
-        supported = len(evidence) > 0 and total_inputs > 0
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
-        }
+        if xhr_requests:
+            return [('xhr_interaction',
+                     f"Ditemukan {len(xhr_requests)} XHR/Fetch request (kemungkinan dari interaksi)",
+                     {'xhr_requests': len(xhr_requests)})]
+        return []
     
-    def _analyze_api_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Deteksi Output Berbasis API"""
-        
-        evidence = []
-        indicators = {}
-        confidence = 'rendah'
-        
-        network = data.get('network_requests', [])
-        
-        # Filter API requests
-        api_requests = []
-        for req in network:
-            resource_type = req.get('resource_type', '')
-            content_type = req.get('content_type', '')
-            url = req.get('url', '')
-            
-            # Cek JSON API
-            if 'json' in content_type.lower():
-                api_requests.append(req)
-            # Cek XHR/Fetch
-            elif resource_type in ['xhr', 'fetch']:
-                api_requests.append(req)
-            # Cek URL pattern API
-            elif any(x in url.lower() for x in ['/api/', '/rest/', '/graphql', '/v1/', '/v2/']):
-                api_requests.append(req)
-        
-        if api_requests:
-            evidence.append(f"Ditemukan {len(api_requests)} API request")
-            indicators['api_request_count'] = len(api_requests)
-            
-            # Count successful responses
-            successful = [req for req in api_requests if req.get('status', 0) == 200]
-            if successful:
-                evidence.append(f"{len(successful)} API request berhasil (200 OK)")
-                indicators['successful_api_requests'] = len(successful)
-                confidence = 'tinggi'
-            
-            # Check for JSON responses with data
-            json_responses = []
-            for req in api_requests:
-                if 'response_body' in req:
-                    try:
-                        import json
-                        body = json.loads(req['response_body'])
-                        if isinstance(body, (dict, list)) and body:
-                            json_responses.append(req)
-                    except:
-                        pass
-            
-            if json_responses:
-                evidence.append(f"{len(json_responses)} response JSON dengan data")
-                indicators['json_responses_with_data'] = len(json_responses)
-                confidence = 'tinggi'
-        
-        # Cek dari JavaScript libraries
-        js_libs = data.get('javascript_libraries', [])
-        api_libs = [lib for lib in js_libs if any(x in lib.lower() for x in ['axios', 'fetch'])]
-        
+    def _detect_event_handlers(self, data, context) -> List[Finding]:
+        soup = self._soup(data, context)
+        if soup is not None:
+            event_handler_count = len(soup.find_all(attrs={'onclick': True}))
+            event_handler_count += len(soup.find_all(attrs={'onchange': True}))
+        else:
+            event_handler_count = data.get('dom_elements', {}).get('event_handler_count') or 0
+        if event_handler_count:
+            return [('event_handlers', f"Ditemukan {event_handler_count} elemen dengan event handler",
+                     {'event_handlers': event_handler_count})]
+        return []
+    
+    # ------------------------------------------------------------------
+    # Detektor: Output Berbasis API
+    # ------------------------------------------------------------------
+    
+    def _api_requests(self, data, context) -> List[Dict[str, Any]]:
+        """Request API (JSON, XHR/fetch atau URL API), dihitung sekali per halaman"""
+        if 'api_requests' not in context:
+            api_requests = []
+            for req in data.get('network_requests', []):
+                resource_type = req.get('resource_type', '')
+                content_type = req.get('content_type', '')
+                url = req.get('url', '')
+                
+                # Cek JSON API
+                if 'json' in content_type.lower():
+                    api_requests.append(req)
+                # Cek XHR/Fetch
+                elif resource_type in ['xhr', 'fetch']:
+                    api_requests.append(req)
+                # Cek URL pattern API
+                elif any(x in url.lower() for x in ['/api/', '/rest/', '/graphql', '/v1/', '/v2/']):
+                    api_requests.append(req)
+            context['api_requests'] = api_requests
+        return context['api_requests']
+    
+    def _detect_api_requests(self, data, context) -> List[Finding]:
+        api_requests = self._api_requests(data, context)
+        if not api_requests:
+            return []
+        findings = [('api_requests', f"Ditemukan {len(api_requests)} API request",
+                     {'api_request_count': len(api_requests)})]
+        
+        # Count successful responses
+        successful = [req for req in api_requests if req.get('status', 0) == 200]
+        if successful:
+            findings.append(('successful_api', f"{len(successful)} API request berhasil (200 OK)",
+                             {'successful_api_requests': len(successful)}))
+        return findings
+    
+    def _detect_json_responses(self, data, context) -> List[Finding]:
+        # Response JSON yang berisi data
+        json_responses = []
+        for req in self._api_requests(data, context):
+            if 'response_body' in req:
+                try:
+                    body = json.loads(req['response_body'])
+                    if isinstance(body, (dict, list)) and body:
+                        json_responses.append(req)
+                except (TypeError, ValueError):
+                    pass
+        
+        if json_responses:
+            return [('json_responses', f"{len(json_responses)} response JSON dengan data",
+                     {'json_responses_with_data': len(json_responses)})]
+        return []
+    
+    def _detect_http_libraries(self, data, context) -> List[Finding]:
+        api_libs = [lib for lib in data.get('javascript_libraries', [])
+                    if any(x in lib.lower() for x in ['axios', 'fetch'])]
         if api_libs:
-            evidence.append(f"Terdeteksi library HTTP: {', '.join(api_libs)}")
-            indicators['http_libraries'] = api_libs
-        
-        supported = len(api_requests) > 0
-        
-        return {
-            'supported': supported,
-            'confidence': confidence if supported else 'rendah',
-            'evidence': evidence,
-            'indicators': indicators
+            return [('http_library', f"Terdeteksi library HTTP: {', '.join(api_libs)}",
+                     {'http_libraries': api_libs})]
+        return []
+    
+    def analyze_pages(
+        self,
+        all_scrape_results: List[Dict[str, Any]],
+        cluster: bool = False,
+        max_distance: int = 3
+    ) -> List[Dict[str, CapabilityVerdict]]:
+        """
+        Analisis semua capability untuk setiap URL (satu kali per URL)
+        
+        Args:
+            all_scrape_results: Hasil scraping semua URL
+            cluster: Kelompokkan halaman berdasarkan fingerprint struktur
+                (DomStats.fingerprint). Representative setiap cluster dianalisis
+                lengkap; halaman lain memakai hasil detektor strukturalnya dan hanya
+                menjalankan ulang detektor yang bergantung pada data halaman.
+            max_distance: Jarak Hamming maksimum fingerprint dalam satu cluster
+        
+        Dengan cluster=True, ``self.cluster_stats`` berisi jumlah halaman, cluster dan
+        halaman yang memakai hasil representative (pages, clusters, shared).
+        """
+        if not cluster:
+            return [self.analyze_all_capabilities(result) for result in all_scrape_results]
+        
+        fingerprints = [
+            None if 'error' in result else (result.get('dom_elements') or {}).get('fingerprint')
+            for result in all_scrape_results
+        ]
+        clusters = cluster_fingerprints(fingerprints, max_distance)
+        analyses: List[Dict[str, CapabilityVerdict]] = [None] * len(all_scrape_results)
+        for members in clusters:
+            representative = members[0]
+            if 'error' in all_scrape_results[representative]:
+                analyses[representative] = self._empty_capabilities()
+                continue
+            analyses[representative], template = self._analyze_page(
+                all_scrape_results[representative], self.full_evidence
+            )
+            for index in members[1:]:
+                analyses[index] = self._analyze_page(
+                    all_scrape_results[index], self.full_evidence, template
+                )[0]
+        
+        self.cluster_stats = {
+            'pages': len(all_scrape_results),
+            'clusters': len(clusters),
+            'shared': sum(len(members) - 1 for members in clusters)
         }
+        return analyses
     
-    def aggregate_website_capabilities(self, all_scrape_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def aggregate_website_capabilities(
+        self,
+        all_scrape_results: List[Dict[str, Any]],
+        analyses: List[Dict[str, CapabilityVerdict]] = None,
+        sampling: SamplingPlan = None
+    ) -> Dict[str, AggregatedCapability]:
         """
         Agregasi capability dari multiple URLs untuk satu website
         
+        Args:
+            all_scrape_results: Hasil scraping semua URL website
+            analyses: Hasil analyze_pages() yang sudah ada (optional, dihitung jika tidak diisi)
+            sampling: Rencana sampling (optional). Hasil scraping adalah URL sampel
+                (sejajar dengan sampling.urls); jumlah URL per capability diestimasi
+                untuk seluruh URL per template
+        
         Returns:
-            Dict dengan key capability dan agregasi dari semua URL
+            Dict dengan key capability dan AggregatedCapability dari semua URL
         """
         
+        if analyses is None:
+            analyses = self.analyze_pages(all_scrape_results)
+        
         aggregated = {}
         
         for capability in self.CAPABILITIES:
-            # Collect all analyses for this capability
-            capability_results = []
             urls_with_evidence = []
             
-            for result in all_scrape_results:
-                analysis = self.analyze_all_capabilities(result)
-                cap_data = analysis.get(capability, {})
+            for result, analysis in zip(all_scrape_results, analyses):
+                cap_data = analysis.get(capability)
                 
-                if cap_data.get('supported', False):
-                    capability_results.append(cap_data)
-                    urls_with_evidence.append({
-                        'url': result.get('url'),
-                        'screenshot': result.get('screenshot_path'),
-                        'evidence': cap_data.get('evidence', []),
-                        'indicators': cap_data.get('indicators', {}),
-                        'confidence': cap_data.get('confidence', 'rendah')
-                    })
+                if cap_data is not None and cap_data.supported:
+                    # Screenshot elemen bukti jika ada, jika tidak screenshot viewport
+                    screenshot = (result.get('element_screenshots') or {}).get(capability)
+                    urls_with_evidence.append(cap_data.with_source(
+                        result.get('url'), screenshot or result.get('screenshot_path')
+                    ))
             
-            # Determine overall support
-            supported = len(capability_results) > 0
-            
-            # Determine overall confidence
-            if supported:
-                confidences = [r.get('confidence', 'rendah') for r in capability_results]
-                if 'tinggi' in confidences:
-                    overall_confidence = 'tinggi'
-                elif 'sedang' in confidences:
-                    overall_confidence = 'sedang'
-                else:
-                    overall_confidence = 'rendah'
-            else:
-                overall_confidence = 'rendah'
-            
-            aggregated[capability] = {
-                'supported': supported,
-                'confidence': overall_confidence,
-                'url_count': len(urls_with_evidence),
-                'urls_with_evidence': urls_with_evidence,
-                'total_urls_analyzed': len(all_scrape_results)
-            }
+            aggregated[capability] = self._aggregate_verdicts(urls_with_evidence, len(all_scrape_results))
         
+        if sampling is not None:
+            self.extrapolate(aggregated, all_scrape_results, analyses, sampling)
         return aggregated
+    
+    def extrapolate(
+        self,
+        aggregated: Dict[str, AggregatedCapability],
+        all_scrape_results: List[Dict[str, Any]],
+        analyses: List[Dict[str, CapabilityVerdict]],
+        sampling: SamplingPlan
+    ):
+        """Tambahkan estimasi jumlah URL (seluruh daftar) per capability dari sampel berstrata"""
+        sampled: Dict[str, int] = {}
+        for result, stratum in zip(all_scrape_results, sampling.strata):
+            # URL yang gagal di-scrape tidak dihitung sebagai sampel
+            if 'error' not in result:
+                sampled[stratum] = sampled.get(stratum, 0) + 1
+        
+        for capability, item in aggregated.items():
+            hits: Dict[str, int] = {}
+            for result, analysis, stratum in zip(all_scrape_results, analyses, sampling.strata):
+                verdict = analysis.get(capability)
+                if 'error' not in result and verdict is not None and verdict.supported:
+                    hits[stratum] = hits.get(stratum, 0) + 1
+            estimate, low, high = sampling.estimate(hits, sampled)
+            item.total_urls = sampling.total_urls
+            item.estimated_url_count = estimate
+            item.estimated_url_range = [low, high]
+    
+    def aggregate_verdicts(self, verdicts_by_capability: Dict[str, List[CapabilityVerdict]], total_urls: int) -> Dict[str, AggregatedCapability]:
+        """Agregasi dari verdict per URL yang sudah tersimpan (misalnya dari ResultStore)"""
+        return {
+            capability: self._aggregate_verdicts(
+                [v for v in verdicts_by_capability.get(capability, []) if v.supported],
+                total_urls
+            )
+            for capability in self.CAPABILITIES
+        }
+    
+    def aggregate_performance(self, all_scrape_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Persentil metrik performa (ScrapeResult.performance) untuk satu website
+        
+        Returns:
+            Dict {'pages': jumlah halaman dengan metrik, 'metrics': {metrik: {'p50', 'p75',
+            'p95', 'min', 'max', 'count'}}}. Metrik yang tidak tersedia di suatu halaman
+            (None) tidak dihitung untuk metrik tersebut.
+        """
+        values: Dict[str, List[float]] = {}
+        pages = 0
+        for result in all_scrape_results:
+            metrics = result.get('performance')
+            if 'error' in result or not metrics:
+                continue
+            pages += 1
+            for metric, value in metrics.items():
+                if isinstance(value, (int, float)):
+                    values.setdefault(metric, []).append(value)
+        
+        summary = {}
+        for metric, samples in values.items():
+            samples.sort()
+            summary[metric] = {f"p{q}": round(percentile(samples, q), 1) for q in PERFORMANCE_PERCENTILES}
+            summary[metric].update(min=samples[0], max=samples[-1], count=len(samples))
+        return {'pages': pages, 'metrics': summary}
+    
+    def _aggregate_verdicts(self, urls_with_evidence: List[CapabilityVerdict], total_urls: int) -> AggregatedCapability:
+        """Gabungkan verdict per URL yang mendukung capability menjadi satu hasil agregasi"""
+        
+        # Determine overall support
+        supported = len(urls_with_evidence) > 0
+        
+        # Determine overall confidence
+        if supported:
+            confidences = [v.confidence for v in urls_with_evidence]
+            if 'tinggi' in confidences:
+                overall_confidence = 'tinggi'
+            elif 'sedang' in confidences:
+                overall_confidence = 'sedang'
+            else:
+                overall_confidence = 'rendah'
+        else:
+            overall_confidence = 'rendah'
+        
+        return AggregatedCapability(
+            supported=supported,
+            confidence=overall_confidence,
+            url_count=len(urls_with_evidence),
+            urls_with_evidence=urls_with_evidence,
+            total_urls_analyzed=total_urls
+        )
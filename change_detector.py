@@ -0,0 +1,93 @@
+"""
+Change Detector Module
+Pre-check murah (HEAD / ETag / Last-Modified / hash konten) sebelum membuka browser
+"""
+
+from typing import Dict, Optional, Tuple
+import hashlib
+
+import requests
+
+
+class ChangeDetector:
+    """
+    Menentukan apakah konten URL berubah sejak run sebelumnya
+
+    Urutan pengecekan:
+    1. HEAD kondisional (If-None-Match / If-Modified-Since) - 304 berarti tidak berubah
+    2. Bandingkan ETag / Last-Modified dari response HEAD
+    3. Jika server tidak memberi validator, GET ringan dan bandingkan hash konten
+
+    Catatan: untuk SPA yang memuat data lewat API, HTML shell bisa tetap sama walau
+    datanya berubah. Mode incremental paling cocok untuk halaman yang kontennya
+    ikut berubah di HTML.
+    """
+
+    def __init__(self, timeout: float = 10.0, max_hash_bytes: int = 5 * 1024 * 1024):
+        self.timeout = timeout
+        self.max_hash_bytes = max_hash_bytes
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = (
+            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+            'Chrome/120.0 Safari/537.36'
+        )
+
+    def check(self, url: str, previous: Optional[Dict[str, Optional[str]]] = None) -> Tuple[bool, Dict[str, Optional[str]]]:
+        """
+        Cek perubahan satu URL
+
+        Args:
+            url: URL yang dicek
+            previous: Validator dari run sebelumnya (etag, last_modified, content_hash)
+
+        Returns:
+            (changed, validators baru). Jika pengecekan gagal, URL dianggap berubah.
+        """
+        previous = previous or {}
+        validators = {'etag': None, 'last_modified': None, 'content_hash': None}
+
+        try:
+            headers = {}
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+
+            response = self.session.head(url, headers=headers, timeout=self.timeout, allow_redirects=True)
+
+            if response.status_code == 304 and previous:
+                return False, dict(previous)
+
+            validators['etag'] = response.headers.get('ETag')
+            validators['last_modified'] = response.headers.get('Last-Modified')
+
+            # ETag weak (W/) tetap valid untuk perbandingan kesetaraan konten
+            if validators['etag'] or validators['last_modified']:
+                if not previous:
+                    return True, validators
+                unchanged = (
+                    validators['etag'] == previous.get('etag')
+                    and validators['last_modified'] == previous.get('last_modified')
+                )
+                return not unchanged, validators
+
+            validators['content_hash'] = self._content_hash(url)
+            changed = validators['content_hash'] != previous.get('content_hash')
+            return changed, validators
+
+        except requests.RequestException as e:
+            print(f"[INFO] Pre-check gagal untuk {url}: {e}")
+            return True, validators
+
+    def _content_hash(self, url: str) -> str:
+        """SHA-256 dari body response (dibatasi max_hash_bytes)"""
+        digest = hashlib.sha256()
+        read = 0
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                digest.update(chunk)
+                read += len(chunk)
+                if read >= self.max_hash_bytes:
+                    break
+        return digest.hexdigest()
@@ -0,0 +1,156 @@
+"""
+Checkpoint Module
+Menyimpan progres perbandingan ke disk supaya job panjang bisa dilanjutkan (resume)
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+import json
+import os
+import re
+
+from result_models import ScrapeResult, CapabilityVerdict
+
+
+class CheckpointManager:
+    """
+    Checkpoint berbasis file JSON di satu directory job
+
+    Struktur directory:
+        job.json                  - parameter job (URL, nama website, output, run_id)
+        stages.json               - stage yang sudah selesai beserta datanya
+        pages/<website>/<n>.json  - hasil scraping URL ke-n (ditulis setelah setiap URL)
+
+    Semua file ditulis atomik (file sementara + os.replace), jadi proses yang
+    mati di tengah penulisan tidak meninggalkan checkpoint rusak.
+    """
+
+    def __init__(self, checkpoint_dir: str):
+        self.checkpoint_dir = checkpoint_dir
+        os.makedirs(os.path.join(checkpoint_dir, 'pages'), exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.checkpoint_dir, *parts)
+
+    @staticmethod
+    def _write_json(path: str, data: Any):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_json(path: str, default: Any = None) -> Any:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default
+
+    def _site_dir(self, website_name: str) -> str:
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', website_name)
+        path = self._path('pages', safe_name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    # ------------------------------------------------------------------
+    # Job
+    # ------------------------------------------------------------------
+
+    def load_job(self) -> Optional[Dict[str, Any]]:
+        """Parameter job yang tersimpan (None jika checkpoint masih kosong)"""
+        return self._read_json(self._path('job.json'))
+
+    def save_job(self, job: Dict[str, Any]):
+        """Simpan parameter job"""
+        self._write_json(self._path('job.json'), job)
+
+    # ------------------------------------------------------------------
+    # Pages
+    # ------------------------------------------------------------------
+
+    def save_page(
+        self,
+        website_name: str,
+        index: int,
+        result: ScrapeResult,
+        verdicts: Dict[str, CapabilityVerdict] = None
+    ):
+        """Simpan hasil scraping satu URL (dan verdict jika sudah ada)"""
+        data = {'result': result.to_dict()}
+        if verdicts is not None:
+            data['verdicts'] = {cap: v.to_dict() for cap, v in verdicts.items()}
+        self._write_json(os.path.join(self._site_dir(website_name), f"{index}.json"), data)
+
+    def load_pages(self, website_name: str) -> Dict[int, Tuple[ScrapeResult, Optional[Dict[str, CapabilityVerdict]]]]:
+        """
+        Hasil scraping yang sudah berhasil untuk satu website
+
+        URL yang gagal tidak dikembalikan, sehingga akan di-scrape ulang saat resume.
+
+        Returns:
+            Dict index URL -> (ScrapeResult, verdict atau None)
+        """
+        site_dir = self._site_dir(website_name)
+        pages = {}
+        for filename in os.listdir(site_dir):
+            if not filename.endswith('.json'):
+                continue
+            data = self._read_json(os.path.join(site_dir, filename))
+            if not data or 'error' in data['result']:
+                continue
+            verdicts = None
+            if 'verdicts' in data:
+                verdicts = {cap: CapabilityVerdict.from_dict(v) for cap, v in data['verdicts'].items()}
+            pages[int(filename[:-len('.json')])] = (ScrapeResult.from_dict(data['result']), verdicts)
+        return pages
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _stages(self) -> Dict[str, Any]:
+        return self._read_json(self._path('stages.json'), {})
+
+    def is_complete(self, stage: str) -> bool:
+        """Apakah stage sudah selesai"""
+        return stage in self._stages()
+
+    def stage_data(self, stage: str) -> Any:
+        """Data yang disimpan saat stage selesai (None jika belum selesai)"""
+        return self._stages().get(stage)
+
+    def mark_complete(self, stage: str, data: Any = True):
+        """Tandai stage selesai"""
+        stages = self._stages()
+        stages[stage] = data
+        self._write_json(self._path('stages.json'), stages)
+
+    def invalidate(self, *stages: str):
+        """Batalkan status selesai stage (misalnya setelah input-nya berubah), satu kali tulis"""
+        saved = self._stages()
+        removed = [stage for stage in stages if saved.pop(stage, None) is not None]
+        if removed:
+            self._write_json(self._path('stages.json'), saved)
+
+    def save_analyses(self, website_name: str, analyses: List[Dict[str, CapabilityVerdict]]):
+        """Tandai stage analisis satu website selesai"""
+        self.mark_complete(
+            f"analysis:{website_name}",
+            [{cap: v.to_dict() for cap, v in analysis.items()} for analysis in analyses]
+        )
+
+    def load_analyses(self, website_name: str) -> Optional[List[Dict[str, CapabilityVerdict]]]:
+        """Hasil analisis satu website dari checkpoint (None jika belum ada)"""
+        data = self.stage_data(f"analysis:{website_name}")
+        if data is None:
+            return None
+        return [
+            {cap: CapabilityVerdict.from_dict(v) for cap, v in analysis.items()}
+            for analysis in data
+        ]
@@ -0,0 +1,330 @@
+"""
+Command Line Interface
+Jalankan perbandingan dari manifest YAML/JSON dengan opsi paralelisme, cache,
+timeout, format output dan profiling
+
+Contoh:
+    python cli.py compare manifest.yaml --workers 4 --browser-reuse tab --cache-dir .browser_cache
+    python cli.py resume output/checkpoint_a_vs_b
+    python cli.py report --store output/results.db --run-id 3
+    python cli.py worker --queue jobs.db --idle-timeout 60
+
+Format manifest (JSON, atau YAML jika PyYAML terpasang):
+    defaults:                 # opsional, nama key sama dengan flag (tanpa --, '-' jadi '_')
+      workers: 2
+      extraction_mode: browser
+    comparisons:
+      - website_a: {name: "Website A", urls: ["https://..."]}
+        website_b: {name: "Website B", seeds: ["https://..."]}  # seeds: URL ditemukan lewat crawl
+        output_pdf: output/a_vs_b.pdf      # opsional
+        checkpoint_dir: output/ckpt_a_b    # opsional
+
+Website dengan ``seeds`` (bukan ``urls``) di-crawl dulu: link same-site dan sitemap,
+dibatasi --crawl-max-pages/--crawl-max-depth dan jeda per host --crawl-delay.
+
+Manifest dengan satu perbandingan boleh menulis website_a/website_b langsung di
+top level. Flag command line selalu mengalahkan nilai di ``defaults``.
+"""
+
+from typing import Dict, List, Any
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+import time
+
+from report_renderers import REPORT_FORMATS
+
+
+# Nilai bawaan opsi (dipakai jika tidak ada di flag maupun manifest)
+DEFAULT_OPTIONS = {
+    'output_dir': 'output',
+    'screenshot_dir': 'screenshots',
+    'store': None,
+    'incremental': False,
+    'workers': 1,
+    'browser_reuse': None,
+    'extraction_mode': 'html',
+    'cache_dir': None,
+    'cache_size_mb': 500.0,
+    'job_queue': None,
+    'journal_mode': 'WAL',
+    'page_load_timeout': 30.0,
+    'body_wait_timeout': 10.0,
+    'max_attempts': 2,
+    'formats': 'pdf',
+    'report_workers': 1,
+    'full_evidence': True,
+    'cluster_pages': False,
+    'sample_per_group': None,
+    'observe_seconds': 0.0,
+    'crawl_max_pages': 50,
+    'crawl_max_depth': 3,
+    'crawl_delay': 1.0,
+}
+
+# Format output yang didukung
+OUTPUT_FORMATS = REPORT_FORMATS
+
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """Baca manifest JSON atau YAML"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    if path.lower().endswith(('.yaml', '.yml')):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit("[ERROR] Manifest YAML membutuhkan PyYAML (pip install pyyaml), "
+                             "atau gunakan manifest JSON")
+        manifest = yaml.safe_load(content) or {}
+    else:
+        manifest = json.loads(content)
+
+    if 'comparisons' not in manifest:
+        if 'website_a' not in manifest or 'website_b' not in manifest:
+            raise SystemExit("[ERROR] Manifest harus berisi 'comparisons' atau 'website_a'/'website_b'")
+        manifest = {
+            'defaults': manifest.get('defaults', {}),
+            'comparisons': [{key: value for key, value in manifest.items() if key != 'defaults'}]
+        }
+
+    for number, comparison in enumerate(manifest['comparisons'], 1):
+        for side in ('website_a', 'website_b'):
+            site = comparison.get(side)
+            if not site or not (site.get('urls') or site.get('seeds')):
+                raise SystemExit(f"[ERROR] Perbandingan #{number}: {side}.urls/seeds kosong")
+            site.setdefault('name', 'Website A' if side == 'website_a' else 'Website B')
+    return manifest
+
+
+def resolve_options(args: argparse.Namespace, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Gabungkan opsi: flag > defaults manifest > DEFAULT_OPTIONS"""
+    options = {}
+    for key, value in DEFAULT_OPTIONS.items():
+        flag = getattr(args, key, None)
+        if flag is not None:
+            options[key] = flag
+        elif key in defaults:
+            options[key] = defaults[key]
+        else:
+            options[key] = value
+
+    formats = options['formats']
+    if isinstance(formats, str):
+        formats = [f.strip().lower() for f in formats.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in OUTPUT_FORMATS]
+    if unknown:
+        raise SystemExit(f"[ERROR] Format output tidak dikenal: {', '.join(unknown)} "
+                         f"(didukung: {', '.join(OUTPUT_FORMATS)})")
+    options['formats'] = formats
+    return options
+
+
+def build_comparator(options: Dict[str, Any]):
+    """Buat WebsiteComparator dari opsi"""
+    from website_comparator import WebsiteComparator
+    from failure_policy import FailurePolicy
+
+    return WebsiteComparator(
+        screenshot_dir=options['screenshot_dir'],
+        output_dir=options['output_dir'],
+        store_path=options['store'],
+        extraction_mode=options['extraction_mode'],
+        max_workers=options['workers'],
+        browser_reuse=options['browser_reuse'],
+        cache_dir=options['cache_dir'],
+        cache_size_mb=options['cache_size_mb'],
+        job_queue_path=options['job_queue'],
+        job_queue_journal_mode=options['journal_mode'],
+        report_workers=options['report_workers'],
+        full_evidence=options['full_evidence'],
+        cluster_pages=options['cluster_pages'],
+        observe_seconds=options['observe_seconds'],
+        failure_policy=FailurePolicy(
+            max_attempts=options['max_attempts'],
+            page_load_timeout=options['page_load_timeout'],
+            body_wait_timeout=options['body_wait_timeout']
+        )
+    )
+
+
+def discover_urls(site: Dict[str, Any], options: Dict[str, Any]) -> List[str]:
+    """URL website: ``urls`` dari manifest, ditambah hasil crawl dari ``seeds``"""
+    urls = list(site.get('urls') or [])
+    if site.get('seeds'):
+        from url_crawler import URLCrawler
+
+        crawler = URLCrawler(
+            max_pages=options['crawl_max_pages'],
+            max_depth=options['crawl_max_depth'],
+            per_host_delay=options['crawl_delay'],
+            exclude_patterns=site.get('exclude')
+        )
+        print(f"[INFO] Crawl {site['name']} dari {len(site['seeds'])} seed URL...")
+        urls.extend(url for url in crawler.crawl(site['seeds']) if url not in urls)
+    return urls
+
+
+def run_compare(args: argparse.Namespace) -> int:
+    """Subcommand compare: jalankan semua perbandingan di manifest"""
+    manifest = load_manifest(args.manifest)
+    options = resolve_options(args, manifest.get('defaults', {}))
+    comparator = build_comparator(options)
+
+    failures = 0
+    summary = []
+    for number, comparison in enumerate(manifest['comparisons'], 1):
+        site_a, site_b = comparison['website_a'], comparison['website_b']
+        print(f"\n[INFO] Perbandingan {number}/{len(manifest['comparisons'])}: "
+              f"{site_a['name']} vs {site_b['name']}")
+        started = time.monotonic()
+        try:
+            result = comparator.compare(
+                website_a_urls=discover_urls(site_a, options),
+                website_b_urls=discover_urls(site_b, options),
+                website_a_name=site_a['name'],
+                website_b_name=site_b['name'],
+                output_pdf=comparison.get('output_pdf'),
+                incremental=options['incremental'],
+                checkpoint_dir=comparison.get('checkpoint_dir'),
+                formats=options['formats'],
+                sample_per_group=options['sample_per_group']
+            )
+            summary.append((site_a['name'], site_b['name'], result['reports'], time.monotonic() - started))
+        except Exception as e:
+            failures += 1
+            print(f"[ERROR] Perbandingan {site_a['name']} vs {site_b['name']} gagal: {e}")
+            summary.append((site_a['name'], site_b['name'], None, time.monotonic() - started))
+
+    print("\n" + "=" * 70)
+    for name_a, name_b, reports, elapsed in summary:
+        status = ', '.join(reports.values()) if reports is not None else "GAGAL"
+        print(f"{name_a} vs {name_b}: {status} ({elapsed:.1f} detik)")
+    print("=" * 70)
+    return 1 if failures else 0
+
+
+def run_resume(args: argparse.Namespace) -> int:
+    """Subcommand resume: lanjutkan perbandingan dari checkpoint"""
+    options = resolve_options(args, {})
+    build_comparator(options).resume(args.checkpoint_dir)
+    return 0
+
+
+def run_report(args: argparse.Namespace) -> int:
+    """Subcommand report: buat ulang laporan dari hasil yang tersimpan"""
+    options = resolve_options(args, {})
+    if not options['store']:
+        raise SystemExit("[ERROR] report membutuhkan --store")
+    reports = build_comparator(options).regenerate_report(
+        run_id=args.run_id, output_pdf=args.output, formats=options['formats']
+    )
+    for report_format, path in reports.items():
+        print(f"[INFO] {report_format.upper()}: {path}")
+    return 0
+
+
+def _add_common_options(parser: argparse.ArgumentParser):
+    """Flag yang sama untuk compare/resume/report (default None = pakai manifest/bawaan)"""
+    group = parser.add_argument_group("output")
+    group.add_argument('--output-dir', help="Directory laporan (default: output)")
+    group.add_argument('--screenshot-dir', help="Directory screenshot (default: screenshots)")
+    group.add_argument('--formats', help=f"Format laporan, dipisah koma ({', '.join(OUTPUT_FORMATS)})")
+    group.add_argument('--report-workers', type=int,
+                       help="Worker process untuk render section PDF (default: 1)")
+    group.add_argument('--fast-analysis', dest='full_evidence', action='store_const', const=False,
+                       help="Detektor berhenti begitu verdict pasti (bukti di laporan tidak lengkap)")
+    group.add_argument('--cluster-pages', action='store_true', default=None,
+                       help="Halaman dengan template sama memakai hasil analisis struktur satu halaman")
+    group.add_argument('--observe-seconds', type=float,
+                       help="Ukur update halaman (DOM/canvas) selama N detik per URL (default: 0 = tidak)")
+    group.add_argument('--store', help="Database SQLite riwayat hasil")
+    group.add_argument('--incremental', action='store_true', default=None,
+                       help="Hanya scrape ulang URL yang berubah (membutuhkan --store)")
+
+    group.add_argument('--sample-per-group', type=int,
+                       help="Mode sampling: scrape N URL per template path, jumlah URL diestimasi")
+
+    group = parser.add_argument_group("crawl (website dengan seeds)")
+    group.add_argument('--crawl-max-pages', type=int, help="Maksimum halaman per website (default: 50)")
+    group.add_argument('--crawl-max-depth', type=int, help="Kedalaman link dari seed (default: 3)")
+    group.add_argument('--crawl-delay', type=float, help="Jeda minimum antar request per host (detik, default: 1)")
+
+    group = parser.add_argument_group("paralelisme")
+    group.add_argument('--workers', type=int, help="Maksimum browser paralel (default: 1)")
+    group.add_argument('--browser-reuse', choices=['tab', 'context'],
+                       help="Satu browser per origin (tab atau browser context)")
+    group.add_argument('--job-queue', help="Database JobQueue; scraping dikerjakan oleh worker")
+    group.add_argument('--journal-mode', choices=['WAL', 'DELETE'],
+                       help="Journal mode --job-queue; DELETE untuk filesystem bersama (default: WAL)")
+    group.add_argument('--extraction-mode', choices=['html', 'browser'],
+                       help="Ekstraksi DOM via page_source (html) atau di browser")
+
+    group = parser.add_argument_group("cache")
+    group.add_argument('--cache-dir', help="Directory disk cache Chrome bersama")
+    group.add_argument('--cache-size-mb', type=float, help="Batas ukuran cache (default: 500)")
+    group.add_argument('--no-cache', dest='cache_dir', action='store_const', const='',
+                       help="Nonaktifkan cache walaupun diatur di manifest")
+
+    group = parser.add_argument_group("timeout dan retry")
+    group.add_argument('--page-load-timeout', type=float, help="Timeout page load (detik, default: 30)")
+    group.add_argument('--body-wait-timeout', type=float, help="Timeout menunggu <body> (detik, default: 10)")
+    group.add_argument('--max-attempts', type=int, help="Percobaan per URL (default: 2)")
+
+    parser.add_argument('--profile', metavar='FILE',
+                        help="Profil cProfile ke FILE dan tampilkan fungsi terberat")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Website Output Capability Comparison"
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    compare = subparsers.add_parser('compare', help="Jalankan perbandingan dari manifest")
+    compare.add_argument('manifest', help="Manifest YAML/JSON")
+    _add_common_options(compare)
+    compare.set_defaults(handler=run_compare)
+
+    resume = subparsers.add_parser('resume', help="Lanjutkan perbandingan dari checkpoint")
+    resume.add_argument('checkpoint_dir')
+    _add_common_options(resume)
+    resume.set_defaults(handler=run_resume)
+
+    report = subparsers.add_parser('report', help="Buat ulang laporan dari store")
+    report.add_argument('--run-id', type=int, help="Run (default: run terakhir yang selesai)")
+    report.add_argument('--output', help="Path laporan (ekstensi mengikuti format)")
+    _add_common_options(report)
+    report.set_defaults(handler=run_report)
+
+    subparsers.add_parser('worker', help="Jalankan worker JobQueue (lihat scrape_worker.py --help)",
+                          add_help=False)
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'worker':
+        from scrape_worker import main as worker_main
+        worker_main(argv[1:])
+        return 0
+
+    args = build_parser().parse_args(argv)
+    if not args.profile:
+        return args.handler(args)
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(args.handler, args)
+    finally:
+        profiler.dump_stats(args.profile)
+        print(f"\n[INFO] Profil disimpan: {args.profile}")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
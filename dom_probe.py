@@ -0,0 +1,758 @@
+"""
+DOM Probe Module
+Library JavaScript kecil untuk memeriksa banyak selector dalam satu round-trip WebDriver
+"""
+
+from typing import Dict, List, Any, Tuple
+
+
+# Didefinisikan sekali per dokumen (window.__webcmpProbe), panggilan berikutnya
+# hanya menjalankan run(spec). Selector yang diawali '/' atau '(' dianggap XPath.
+PROBE_SCRIPT = """
+if (!window.__webcmpProbe) {
+  window.__webcmpProbe = (function () {
+    function visible(el) {
+      if (!el || !el.isConnected) return false;
+      var style = window.getComputedStyle(el);
+      if (style.display === 'none' || style.visibility === 'hidden') return false;
+      var rect = el.getBoundingClientRect();
+      return rect.width > 0 && rect.height > 0;
+    }
+    function query(selector) {
+      try {
+        if (selector.charAt(0) === '/' || selector.charAt(0) === '(') {
+          var snap = document.evaluate(selector, document, null,
+                                       XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+          var nodes = [];
+          for (var i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+          return nodes;
+        }
+        return Array.prototype.slice.call(document.querySelectorAll(selector));
+      } catch (e) {
+        return [];
+      }
+    }
+    function describe(el, selector) {
+      var rect = el.getBoundingClientRect();
+      return {
+        element: el,
+        selector: selector,
+        tag: el.tagName.toLowerCase(),
+        text: ((el.innerText || el.value || '') + '').trim().slice(0, 80),
+        visible: visible(el),
+        enabled: !el.disabled,
+        rect: [Math.round(rect.left + window.scrollX), Math.round(rect.top + window.scrollY),
+               Math.round(rect.width), Math.round(rect.height)]
+      };
+    }
+    function first(selectors) {
+      for (var i = 0; i < selectors.length; i++) {
+        var nodes = query(selectors[i]);
+        if (nodes.length && visible(nodes[0])) return describe(nodes[0], selectors[i]);
+      }
+      return null;
+    }
+    function all(selector, limit) {
+      return query(selector).slice(0, limit).map(function (el) { return describe(el, selector); });
+    }
+    function run(spec) {
+      var result = {first: {}, all: {}, iframes: []};
+      var name;
+      for (name in (spec.first || {})) result.first[name] = first(spec.first[name]);
+      for (name in (spec.all || {})) result.all[name] = all(spec.all[name][0], spec.all[name][1]);
+      if (spec.iframes) {
+        result.iframes = query('iframe').map(function (f) { return f.getAttribute('src') || ''; });
+      }
+      return result;
+    }
+    return {run: run, visible: visible, query: query};
+  })();
+}
+return window.__webcmpProbe.run(arguments[0]);
+"""
+
+
+def probe(
+    driver,
+    first: Dict[str, List[str]] = None,
+    all: Dict[str, Tuple[str, int]] = None,
+    iframes: bool = False
+) -> Dict[str, Any]:
+    """
+    Jalankan probe dalam satu panggilan execute_script
+
+    Args:
+        first: Dict nama -> list selector (CSS atau XPath); untuk setiap nama dikembalikan
+            elemen pertama yang terlihat (urutan selector = prioritas), atau None
+        all: Dict nama -> (selector, limit); untuk setiap nama dikembalikan maksimal
+            ``limit`` elemen yang cocok beserta status visible/enabled/text
+        iframes: Sertakan daftar src semua iframe
+
+    Returns:
+        Dict {'first': {...}, 'all': {...}, 'iframes': [...]}. Setiap elemen berbentuk dict
+        dengan key element (WebElement), selector, tag, text, visible, enabled, rect.
+    """
+    spec = {
+        'first': first or {},
+        'all': {name: [selector, limit] for name, (selector, limit) in (all or {}).items()},
+        'iframes': iframes
+    }
+    return driver.execute_script(PROBE_SCRIPT, spec) or {'first': {}, 'all': {}, 'iframes': []}
+
+
+# Statistik DOM (struktur sama dengan WebScraper._analyze_dom) dihitung langsung
+# di browser, termasuk dimensi chart hasil render. Dipakai oleh extraction_mode='browser'.
+DOM_STATS_SCRIPT = """
+var maxInlineScript = arguments[0];
+function cls(el) {
+  var c = el.getAttribute('class');
+  return c ? c.trim().replace(/\\s+/g, ' ') : '';
+}
+function size(el) {
+  var rect = el.getBoundingClientRect();
+  return [Math.round(rect.width), Math.round(rect.height)];
+}
+function count(selector) {
+  return document.querySelectorAll(selector).length;
+}
+function limited(selector, limit) {
+  return Array.prototype.slice.call(document.querySelectorAll(selector), 0, limit);
+}
+
+var stats = {
+  canvas_count: count('canvas'),
+  svg_count: count('svg'),
+  table_count: count('table'),
+  chart_containers: [],
+  tables: [],
+  download_elements: [],
+  inputs: {
+    select: count('select'),
+    checkbox: count('input[type="checkbox" i]'),
+    radio: count('input[type="radio" i]'),
+    range: count('input[type="range" i]'),
+    date: count('input[type="date" i]')
+  },
+  form_count: count('form'),
+  chart_class_count: 0,
+  grid_class_count: 0,
+  event_handler_count: count('[onclick]') + count('[onchange]')
+};
+
+limited('canvas', 10).forEach(function (el) {
+  var s = size(el);
+  stats.chart_containers.push({
+    tag: 'canvas', id: el.id || '', 'class': cls(el),
+    parent_class: el.parentElement ? cls(el.parentElement) : '',
+    width: s[0], height: s[1]
+  });
+});
+limited('svg', 10).forEach(function (el) {
+  var s = size(el);
+  stats.chart_containers.push({tag: 'svg', id: el.id || '', 'class': cls(el), width: s[0], height: s[1]});
+});
+
+limited('table', 20).forEach(function (el) {
+  var rows = el.querySelectorAll('tr').length;
+  if (rows > 1) {
+    stats.tables.push({
+      rows: rows,
+      cols: el.querySelectorAll('th, td').length,
+      'class': cls(el), id: el.id || '',
+      has_header: el.querySelectorAll('thead, th').length > 0
+    });
+  }
+});
+
+function addDownload(el) {
+  stats.download_elements.push({
+    tag: el.tagName.toLowerCase(),
+    text: (el.textContent || '').slice(0, 50).trim(),
+    href: el.getAttribute('href') || el.getAttribute('data-url') || '',
+    download_attr: el.hasAttribute('download')
+  });
+}
+limited('a[href*="download" i]', 10).forEach(addDownload);
+limited('a[download]', 10).forEach(addDownload);
+limited('button[data-download]', 10).forEach(addDownload);
+var walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+var textPattern = /(download|unduh|export|ekspor)/i;
+var textMatches = 0;
+while (walker.nextNode() && textMatches < 10) {
+  var parent = walker.currentNode.parentElement;
+  if (parent && parent.tagName !== 'SCRIPT' && parent.tagName !== 'STYLE' && textPattern.test(walker.currentNode.nodeValue)) {
+    addDownload(parent);
+    textMatches++;
+  }
+}
+
+var chartClass = /chart|graph|plot|visualization/i;
+var gridClass = /grid|datatable|table-responsive/i;
+var all = document.querySelectorAll('[class]');
+for (var i = 0; i < all.length; i++) {
+  var c = all[i].getAttribute('class');
+  if (chartClass.test(c)) stats.chart_class_count++;
+  if (gridClass.test(c)) stats.grid_class_count++;
+}
+
+// Shingle struktur (sama dengan page_fingerprint.soup_shingles): tag-path 3 level
+// dengan class pertama dan setiap class, angka dihapus
+function classTokens(el) {
+  var c = el.getAttribute('class');
+  if (!c) return [];
+  return c.trim().split(/\\s+/).map(function (t) { return t.toLowerCase().replace(/\\d+/g, ''); })
+          .filter(function (t) { return t; });
+}
+function label(el) {
+  var tokens = classTokens(el);
+  return el.tagName.toLowerCase() + (tokens.length ? '.' + tokens[0] : '');
+}
+var structure = {};
+var elements = document.getElementsByTagName('*');
+for (var j = 0; j < elements.length && j < 20000; j++) {
+  var labels = [], node = elements[j];
+  while (node && node.nodeType === 1 && labels.length < 3) {
+    labels.unshift(label(node));
+    node = node.parentElement;
+  }
+  var path = 'p:' + labels.join('>');
+  structure[path] = (structure[path] || 0) + 1;
+  classTokens(elements[j]).forEach(function (t) { structure['c:' + t] = (structure['c:' + t] || 0) + 1; });
+}
+
+var scriptSrcs = [];
+var inline = [];
+var inlineLength = 0;
+limited('script', 10000).forEach(function (el) {
+  if (el.src) {
+    scriptSrcs.push(el.src);
+  } else if (inlineLength < maxInlineScript) {
+    var text = (el.textContent || '').slice(0, maxInlineScript - inlineLength);
+    inline.push(text);
+    inlineLength += text.length;
+  }
+});
+
+var globals = {
+  'Chart.js': window.Chart, 'Highcharts': window.Highcharts, 'ApexCharts': window.ApexCharts,
+  'ECharts': window.echarts, 'D3.js': window.d3, 'Plotly': window.Plotly,
+  'Google Charts': window.google && window.google.visualization,
+  'jQuery': window.jQuery, 'Vue.js': window.Vue, 'Angular': window.angular, 'Axios': window.axios
+};
+var globalLibraries = Object.keys(globals).filter(function (name) { return !!globals[name]; });
+
+return {
+  dom: stats,
+  script_srcs: scriptSrcs,
+  inline_scripts: inline.join('\\n'),
+  global_libraries: globalLibraries,
+  structure: structure
+};
+"""
+
+
+def extract_dom_stats(driver, max_inline_script: int = 512 * 1024) -> Dict[str, Any]:
+    """
+    Hitung statistik DOM di browser dalam satu panggilan execute_script
+
+    Returns:
+        Dict dengan key dom (struktur dom_elements), script_srcs, inline_scripts
+        (teks script inline, dibatasi max_inline_script karakter), global_libraries dan
+        structure (shingle struktur untuk page_fingerprint)
+    """
+    return driver.execute_script(DOM_STATS_SCRIPT, max_inline_script)
+
+
+# Scroll adaptif (execute_async_script): scroll per viewport dan tunggu sampai halaman
+# "tenang" - scrollHeight tidak bertambah, tidak ada request fetch/XHR yang berjalan atau
+# resource baru, dan elemen yang baru masuk viewport (IntersectionObserver) sudah diam
+# selama quietMs. Berhenti di dasar halaman yang stabil atau setelah maxMs.
+ADAPTIVE_SCROLL_SCRIPT = """
+var options = arguments[0];
+var done = arguments[arguments.length - 1];
+var quietMs = options.quietMs, maxMs = options.maxMs, pollMs = options.pollMs;
+var start = Date.now();
+
+if (!window.__webcmpNet) {
+  window.__webcmpNet = {inflight: 0, lastActivity: Date.now()};
+  var net = window.__webcmpNet;
+  var begin = function () { net.inflight++; net.lastActivity = Date.now(); };
+  var end = function () { net.inflight = Math.max(0, net.inflight - 1); net.lastActivity = Date.now(); };
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      begin();
+      return originalFetch.apply(this, arguments).then(
+        function (response) { end(); return response; },
+        function (error) { end(); throw error; });
+    };
+  }
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    begin();
+    this.addEventListener('loadend', end);
+    return originalSend.apply(this, arguments);
+  };
+}
+var net = window.__webcmpNet;
+
+var lastResourceCount = performance.getEntriesByType('resource').length;
+var lastHeight = document.documentElement.scrollHeight;
+var lastChange = Date.now();
+var newRequests = 0;
+var intersections = 0;
+
+var observer = null;
+if (window.IntersectionObserver) {
+  observer = new IntersectionObserver(function (entries) {
+    entries.forEach(function (entry) {
+      if (entry.isIntersecting) {
+        intersections++;
+        lastChange = Date.now();
+        observer.unobserve(entry.target);
+      }
+    });
+  });
+  var observeCandidates = function () {
+    var nodes = document.querySelectorAll(options.lazySelector);
+    for (var i = 0; i < nodes.length; i++) {
+      if (!nodes[i].__webcmpObserved) {
+        nodes[i].__webcmpObserved = true;
+        observer.observe(nodes[i]);
+      }
+    }
+  };
+  observeCandidates();
+}
+
+function settled() {
+  var now = Date.now();
+  var resourceCount = performance.getEntriesByType('resource').length;
+  if (resourceCount !== lastResourceCount) {
+    newRequests += resourceCount - lastResourceCount;
+    lastResourceCount = resourceCount;
+    lastChange = now;
+  }
+  var height = document.documentElement.scrollHeight;
+  if (height !== lastHeight) {
+    lastHeight = height;
+    lastChange = now;
+    if (observer) observeCandidates();
+  }
+  return net.inflight === 0 && now - Math.max(lastChange, net.lastActivity) >= quietMs;
+}
+
+var steps = 0;
+function atBottom() {
+  return window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 2;
+}
+function finish(reachedBottom) {
+  if (observer) observer.disconnect();
+  done({
+    steps: steps,
+    height: document.documentElement.scrollHeight,
+    elapsed_ms: Date.now() - start,
+    new_requests: newRequests,
+    lazy_elements: intersections,
+    reached_bottom: reachedBottom
+  });
+}
+function tick() {
+  if (Date.now() - start >= maxMs) return finish(atBottom());
+  if (!settled()) return setTimeout(tick, pollMs);
+  if (atBottom()) return finish(true);
+  window.scrollBy(0, window.innerHeight);
+  steps++;
+  lastChange = Date.now();
+  setTimeout(tick, pollMs);
+}
+tick();
+"""
+
+
+def adaptive_scroll(
+    driver,
+    quiet_ms: int = 500,
+    max_seconds: float = 30.0,
+    poll_ms: int = 100,
+    lazy_selector: str = "img, iframe, canvas, svg, [data-panelid], .panel-container, .react-grid-item"
+) -> Dict[str, Any]:
+    """
+    Scroll halaman per viewport sampai konten lazy-load selesai dimuat
+
+    Args:
+        quiet_ms: Lama halaman harus tenang (tanpa request, pertambahan tinggi atau
+            elemen lazy baru) sebelum scroll berikutnya
+        max_seconds: Batas total waktu scroll
+        poll_ms: Interval pengecekan di browser
+        lazy_selector: Elemen yang dipantau IntersectionObserver
+
+    Returns:
+        Dict steps, height, elapsed_ms, new_requests, lazy_elements, reached_bottom
+    """
+    driver.set_script_timeout(max_seconds + 5)
+    return driver.execute_async_script(ADAPTIVE_SCROLL_SCRIPT, {
+        'quietMs': quiet_ms,
+        'maxMs': int(max_seconds * 1000),
+        'pollMs': poll_ms,
+        'lazySelector': lazy_selector
+    })
+
+
+# Statistik cache dari Resource Timing: transferSize 0 dengan body > 0 berarti resource
+# diambil dari cache. Resource cross-origin tanpa Timing-Allow-Origin tidak bisa diukur.
+RESOURCE_CACHE_SCRIPT = """
+var stats = {resources: 0, cache_hits: 0, transferred_bytes: 0, cached_bytes: 0};
+performance.getEntriesByType('resource').forEach(function (entry) {
+  if (!entry.decodedBodySize) return;
+  stats.resources++;
+  if (entry.transferSize === 0) {
+    stats.cache_hits++;
+    stats.cached_bytes += entry.decodedBodySize;
+  } else {
+    stats.transferred_bytes += entry.transferSize;
+  }
+});
+return stats;
+"""
+
+
+def resource_cache_stats(driver) -> Dict[str, int]:
+    """Jumlah resource, cache hit dan byte (ditransfer / dari cache) halaman saat ini"""
+    return driver.execute_script(RESOURCE_CACHE_SCRIPT) or {}
+
+
+# Region bukti per capability: elemen terlihat terbesar yang cocok dengan selector,
+# dalam koordinat dokumen (CSS px) untuk clip Page.captureScreenshot.
+EVIDENCE_REGIONS_SCRIPT = """
+var selectors = arguments[0], minSize = arguments[1], padding = arguments[2];
+var docWidth = document.documentElement.scrollWidth;
+var docHeight = document.documentElement.scrollHeight;
+var regions = {};
+Object.keys(selectors).forEach(function (key) {
+  var best = null, bestArea = 0;
+  var nodes;
+  try { nodes = document.querySelectorAll(selectors[key]); } catch (e) { return; }
+  for (var i = 0; i < nodes.length && i < 200; i++) {
+    var el = nodes[i];
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility === 'hidden') continue;
+    var rect = el.getBoundingClientRect();
+    if (rect.width < minSize || rect.height < minSize) continue;
+    var area = rect.width * rect.height;
+    if (area > bestArea) { best = rect; bestArea = area; }
+  }
+  if (!best) return;
+  var x = Math.max(0, best.left + window.scrollX - padding);
+  var y = Math.max(0, best.top + window.scrollY - padding);
+  regions[key] = {
+    x: Math.floor(x),
+    y: Math.floor(y),
+    width: Math.ceil(Math.min(best.width + 2 * padding, docWidth - x)),
+    height: Math.ceil(Math.min(best.height + 2 * padding, docHeight - y))
+  };
+});
+return regions;
+"""
+
+
+def evidence_regions(
+    driver,
+    selectors: Dict[str, str],
+    min_size: int = 16,
+    padding: int = 8
+) -> Dict[str, Dict[str, int]]:
+    """
+    Region elemen bukti terbesar per key
+
+    Args:
+        selectors: Dict key (misalnya nama capability) -> CSS selector
+        min_size: Lebar/tinggi minimum elemen (px)
+        padding: Margin di sekitar elemen (px)
+
+    Returns:
+        Dict key -> {x, y, width, height}; key tanpa elemen terlihat tidak ada
+    """
+    return driver.execute_script(EVIDENCE_REGIONS_SCRIPT, selectors, min_size, padding) or {}
+
+
+# Observasi update selama durationMs (execute_async_script): MutationObserver untuk DOM
+# (perubahan style/class diabaikan - biasanya animasi/hover), sampling canvas per
+# requestAnimationFrame (hash thumbnail 16x16) dan waktu datangnya respons fetch/XHR
+# (Resource Timing). Semua buffer dibatasi: maxEvents timestamp update/respons dan
+# maxElements elemen; kelebihannya hanya dihitung.
+UPDATE_RATE_SCRIPT = """
+var options = arguments[0];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+var maxEvents = options.maxEvents, maxElements = options.maxElements;
+
+var updates = [], arrivals = [];
+var droppedEvents = 0, updateCount = 0, mutationRecords = 0, canvasChanges = 0, frames = 0;
+var elements = {}, elementCount = 0, elementOverflow = 0;
+var lastUpdate = -1;
+
+function label(node) {
+  var el = node && node.nodeType === 1 ? node : node && node.parentElement;
+  for (var depth = 0; el && depth < 4; depth++, el = el.parentElement) {
+    if (el.id) return el.tagName.toLowerCase() + '#' + el.id;
+    var c = (el.getAttribute('class') || '').trim().split(/\\s+/)[0];
+    if (c) return el.tagName.toLowerCase() + '.' + c;
+  }
+  return el ? el.tagName.toLowerCase() : 'document';
+}
+function countElement(key) {
+  if (elements.hasOwnProperty(key)) { elements[key]++; return; }
+  if (elementCount >= maxElements) { elementOverflow++; return; }
+  elements[key] = 1;
+  elementCount++;
+}
+function record(time) {
+  // Update dalam satu frame (16 ms) dihitung sekali
+  if (lastUpdate >= 0 && time - lastUpdate < 16) return;
+  lastUpdate = time;
+  updateCount++;
+  if (updates.length < maxEvents) updates.push(time); else droppedEvents++;
+}
+
+var observer = new MutationObserver(function (records) {
+  var time = performance.now();
+  var counted = false;
+  var seen = {};
+  records.forEach(function (r) {
+    if (r.type === 'attributes' && (r.attributeName === 'style' || r.attributeName === 'class')) return;
+    mutationRecords++;
+    counted = true;
+    var key = label(r.target);
+    if (!seen[key]) { seen[key] = true; countElement(key); }
+  });
+  if (counted) record(time);
+});
+observer.observe(document.documentElement, {
+  childList: true, subtree: true, characterData: true, attributes: true
+});
+
+var resourceObserver = null;
+if (window.PerformanceObserver) {
+  try {
+    resourceObserver = new PerformanceObserver(function (list) {
+      list.getEntries().forEach(function (entry) {
+        if (['fetch', 'xmlhttprequest', 'other'].indexOf(entry.initiatorType) < 0) return;
+        if (arrivals.length < maxEvents) arrivals.push(entry.responseEnd); else droppedEvents++;
+      });
+    });
+    resourceObserver.observe({type: 'resource'});
+  } catch (e) { resourceObserver = null; }
+}
+
+var sampler = document.createElement('canvas');
+sampler.width = sampler.height = 16;
+var samplerContext = sampler.getContext('2d', {willReadFrequently: true});
+var canvasHashes = [];
+var lastSample = 0;
+function sampleCanvases(time) {
+  var canvases = document.querySelectorAll('canvas');
+  var changed = false;
+  for (var i = 0; i < canvases.length && i < options.maxCanvases; i++) {
+    var canvas = canvases[i];
+    if (canvas.width < 50 || canvas.height < 50 || canvasHashes[i] === null) continue;
+    var hash = 2166136261;
+    try {
+      samplerContext.clearRect(0, 0, 16, 16);
+      samplerContext.drawImage(canvas, 0, 0, 16, 16);
+      var pixels = samplerContext.getImageData(0, 0, 16, 16).data;
+      for (var p = 0; p < pixels.length; p += 4) {
+        hash = Math.imul(hash ^ (pixels[p] ^ pixels[p + 1] << 8 ^ pixels[p + 2] << 16), 16777619);
+      }
+    } catch (e) {
+      canvasHashes[i] = null;  // Canvas cross-origin (tainted)
+      continue;
+    }
+    if (canvasHashes[i] !== undefined && canvasHashes[i] !== hash) {
+      canvasChanges++;
+      countElement(label(canvas));
+      changed = true;
+    }
+    canvasHashes[i] = hash;
+  }
+  if (changed) record(time);
+}
+
+var finished = false;
+function frame(time) {
+  if (finished) return;
+  frames++;
+  if (time - lastSample >= options.canvasSampleMs) {
+    lastSample = time;
+    sampleCanvases(performance.now());
+  }
+  requestAnimationFrame(frame);
+}
+requestAnimationFrame(frame);
+
+function percentile(sorted, q) {
+  if (!sorted.length) return null;
+  return Math.round(sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))]);
+}
+
+setTimeout(function () {
+  finished = true;
+  observer.disconnect();
+  if (resourceObserver) resourceObserver.disconnect();
+  var seconds = (performance.now() - start) / 1000;
+
+  // Latensi: respons -> update pertama sesudahnya (maksimum maxLatencyMs)
+  var latencies = [];
+  var next = 0;
+  arrivals.sort(function (a, b) { return a - b; }).forEach(function (arrival) {
+    while (next < updates.length && updates[next] < arrival) next++;
+    if (next < updates.length && updates[next] - arrival <= options.maxLatencyMs) {
+      latencies.push(updates[next] - arrival);
+    }
+  });
+  latencies.sort(function (a, b) { return a - b; });
+
+  var ranked = Object.keys(elements).sort(function (a, b) { return elements[b] - elements[a]; });
+  done({
+    duration_ms: Math.round(seconds * 1000),
+    updates: updateCount,
+    updates_per_second: Math.round(updateCount / seconds * 100) / 100,
+    mutation_records: mutationRecords,
+    canvas_changes: canvasChanges,
+    frame_rate: Math.round(frames / seconds * 10) / 10,
+    elements: ranked.slice(0, options.topElements).map(function (key) {
+      return {element: key, updates: elements[key],
+              per_second: Math.round(elements[key] / seconds * 100) / 100};
+    }),
+    element_overflow: elementOverflow,
+    arrivals: arrivals.length,
+    latency_ms: latencies.length ? {
+      samples: latencies.length, p50: percentile(latencies, 0.5), p95: percentile(latencies, 0.95)
+    } : null,
+    dropped_events: droppedEvents
+  });
+}, options.durationMs);
+"""
+
+
+def measure_update_rate(
+    driver,
+    seconds: float = 10.0,
+    canvas_sample_ms: int = 250,
+    max_canvases: int = 8,
+    max_events: int = 5000,
+    max_elements: int = 200,
+    top_elements: int = 10,
+    max_latency_ms: int = 2000
+) -> Dict[str, Any]:
+    """
+    Ukur seberapa sering halaman benar-benar berubah selama ``seconds`` detik
+
+    Args:
+        seconds: Lama observasi
+        canvas_sample_ms: Interval sampling isi canvas
+        max_canvases: Canvas maksimum yang di-sample
+        max_events: Batas buffer timestamp update dan respons di browser
+        max_elements: Batas elemen yang dihitung frekuensinya
+        top_elements: Jumlah elemen teratas yang dikembalikan
+        max_latency_ms: Selisih maksimum respons -> update yang dihitung sebagai latensi
+
+    Returns:
+        Dict duration_ms, updates, updates_per_second, mutation_records, canvas_changes,
+        frame_rate, elements ([{element, updates, per_second}]), element_overflow,
+        arrivals, latency_ms ({samples, p50, p95} atau None), dropped_events
+    """
+    driver.set_script_timeout(seconds + 10)
+    return driver.execute_async_script(UPDATE_RATE_SCRIPT, {
+        'durationMs': int(seconds * 1000),
+        'canvasSampleMs': canvas_sample_ms,
+        'maxCanvases': max_canvases,
+        'maxEvents': max_events,
+        'maxElements': max_elements,
+        'topElements': top_elements,
+        'maxLatencyMs': max_latency_ms
+    }) or {}
+
+
+# Dipasang sebelum dokumen dimuat (Page.addScriptToEvaluateOnNewDocument): LCP dan long
+# task hanya tersedia lewat PerformanceObserver. Hanya counter yang disimpan (tanpa list),
+# buffer Resource Timing diperbesar dari bawaan 250 entry.
+PERFORMANCE_OBSERVER_SCRIPT = """
+if (!window.__webcmpPerf) {
+  var perf = window.__webcmpPerf = {lcp: null, longTasks: 0, longTaskMs: 0, blockingMs: 0};
+  try { performance.setResourceTimingBufferSize(5000); } catch (e) {}
+  try {
+    new PerformanceObserver(function (list) {
+      var entries = list.getEntries();
+      perf.lcp = entries[entries.length - 1].startTime;
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+  } catch (e) {}
+  try {
+    new PerformanceObserver(function (list) {
+      list.getEntries().forEach(function (entry) {
+        perf.longTasks++;
+        perf.longTaskMs += entry.duration;
+        perf.blockingMs += Math.max(0, entry.duration - 50);
+      });
+    }).observe({type: 'longtask', buffered: true});
+  } catch (e) {}
+}
+"""
+
+
+# Metrik performa halaman saat ini (ms sejak navigasi dimulai, byte). Resource cross-origin
+# tanpa Timing-Allow-Origin tercatat dengan ukuran 0; resource dari cache punya transfer 0.
+PERFORMANCE_SCRIPT = """
+function round(value) { return value === null || value === undefined ? null : Math.round(value); }
+var nav = performance.getEntriesByType('navigation')[0] || null;
+var paint = {};
+performance.getEntriesByType('paint').forEach(function (entry) { paint[entry.name] = entry.startTime; });
+var perf = window.__webcmpPerf || null;
+
+var metrics = {
+  ttfb_ms: nav ? round(nav.responseStart) : null,
+  dom_content_loaded_ms: nav && nav.domContentLoadedEventEnd ? round(nav.domContentLoadedEventEnd) : null,
+  load_ms: nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+  first_paint_ms: round(paint['first-paint']),
+  first_contentful_paint_ms: round(paint['first-contentful-paint']),
+  largest_contentful_paint_ms: perf ? round(perf.lcp) : null,
+  long_tasks: perf ? perf.longTasks : null,
+  total_blocking_ms: perf ? round(perf.blockingMs) : null,
+  request_count: nav ? 1 : 0,
+  transfer_bytes: nav ? nav.transferSize || 0 : 0,
+  js_bytes: 0,
+  css_bytes: 0
+};
+performance.getEntriesByType('resource').forEach(function (entry) {
+  metrics.request_count++;
+  metrics.transfer_bytes += entry.transferSize || 0;
+  var path = entry.name.split(/[?#]/)[0].toLowerCase();
+  var size = entry.encodedBodySize || entry.transferSize || 0;
+  if (entry.initiatorType === 'script' || /\\.m?js$/.test(path)) metrics.js_bytes += size;
+  else if (entry.initiatorType === 'css' || /\\.css$/.test(path)) metrics.css_bytes += size;
+});
+return metrics;
+"""
+
+
+def install_performance_observer(driver) -> bool:
+    """Pasang observer LCP/long task untuk dokumen berikutnya di tab ini (False jika CDP tidak ada)"""
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': PERFORMANCE_OBSERVER_SCRIPT})
+        return True
+    except Exception:
+        return False
+
+
+def performance_metrics(driver) -> Dict[str, Any]:
+    """
+    Metrik performa halaman saat ini
+
+    Returns:
+        Dict ttfb_ms, dom_content_loaded_ms, load_ms, first_paint_ms,
+        first_contentful_paint_ms, largest_contentful_paint_ms, long_tasks,
+        total_blocking_ms, request_count, transfer_bytes, js_bytes, css_bytes.
+        Metrik yang tidak tersedia bernilai None (LCP dan long task membutuhkan
+        install_performance_observer sebelum halaman dimuat).
+    """
+    return driver.execute_script(PERFORMANCE_SCRIPT) or {}
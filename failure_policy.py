@@ -0,0 +1,177 @@
+"""
+Failure Policy Module
+Retry dengan exponential backoff, circuit breaker per host dan klasifikasi error scraping
+"""
+
+from typing import Dict, Optional
+import random
+import re
+import threading
+import time
+
+from selenium.common.exceptions import (
+    TimeoutException, InvalidSessionIdException, NoSuchWindowException, WebDriverException
+)
+
+
+# Kelas error yang dicatat di ScrapeResult.error_class
+ERROR_DNS = 'dns'
+ERROR_TIMEOUT = 'timeout'
+ERROR_CONNECTION = 'connection'
+ERROR_CRASH = 'crash'
+ERROR_AUTH = 'auth'
+ERROR_MEMORY = 'memory'
+ERROR_CIRCUIT_OPEN = 'circuit_open'
+ERROR_UNKNOWN = 'unknown'
+
+
+class AuthenticationError(Exception):
+    """Login gagal atau halaman menolak akses (401/403)"""
+
+
+class ResourceLimitError(Exception):
+    """Browser dihentikan karena RSS melebihi budget (lihat ResourceGovernor)"""
+
+
+_DNS_MARKERS = ('err_name_not_resolved', 'err_name_resolution_failed', 'dns_probe')
+_CONNECTION_MARKERS = (
+    'err_connection_refused', 'err_connection_reset', 'err_connection_closed',
+    'err_connection_timed_out', 'err_address_unreachable', 'err_internet_disconnected',
+    'err_ssl', 'err_cert'
+)
+_CRASH_MARKERS = (
+    'tab crashed', 'session deleted', 'chrome not reachable', 'disconnected',
+    'target window already closed', 'no such window', 'invalid session id',
+    'cannot connect to chrome', 'chrome failed to start'
+)
+# Kode 401/403 hanya dihitung jika berdiri sendiri di samping teks status atau kata
+# HTTP/status (angka 401/403 di tempat lain, misalnya ID atau nomor baris, bukan auth)
+_AUTH_PATTERN = re.compile(
+    r'\b40[13]\b[\s:-]*(unauthorized|forbidden)\b'
+    r'|\b(unauthorized|forbidden)[\s:(-]*\b40[13]\b'
+    r'|\b(http|status)( code)?[\s:/]*\b40[13]\b'
+)
+_AUTH_STATUS = (401, 403)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Status HTTP dari exception (atribut status_code atau response.status_code)"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def classify_error(error: BaseException) -> str:
+    """Tentukan kelas error (dns, timeout, connection, crash, auth, memory, unknown)"""
+    if isinstance(error, AuthenticationError) or _status_code(error) in _AUTH_STATUS:
+        return ERROR_AUTH
+    if isinstance(error, ResourceLimitError):
+        return ERROR_MEMORY
+    if isinstance(error, TimeoutException):
+        return ERROR_TIMEOUT
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return ERROR_CRASH
+
+    message = str(error).lower()
+    if any(marker in message for marker in _DNS_MARKERS):
+        return ERROR_DNS
+    if any(marker in message for marker in _CONNECTION_MARKERS):
+        return ERROR_CONNECTION
+    if 'timeout' in message or 'timed out' in message:
+        return ERROR_TIMEOUT
+    if any(marker in message for marker in _CRASH_MARKERS):
+        return ERROR_CRASH
+    if not isinstance(error, WebDriverException) and _AUTH_PATTERN.search(message):
+        return ERROR_AUTH
+    return ERROR_UNKNOWN
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per host
+
+    Setelah ``failure_threshold`` kegagalan berturut-turut, host dianggap mati
+    (open) dan URL berikutnya ke host tersebut langsung gagal tanpa membuka browser.
+    Setelah ``reset_timeout`` detik, satu percobaan dibolehkan (half-open); jika
+    berhasil breaker kembali closed, jika gagal kembali open.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._half_open: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """Apakah request ke host boleh dilakukan"""
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            if self._half_open.get(host):
+                return False  # Percobaan half-open sedang berjalan
+            if time.monotonic() - opened_at >= self.reset_timeout:
+                self._half_open[host] = True
+                return True
+            return False
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._half_open.pop(host, None)
+
+    def record_failure(self, host: str):
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if self._half_open.pop(host, False) or failures >= self.failure_threshold:
+                self._opened_at[host] = time.monotonic()
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            return host in self._opened_at
+
+
+class FailurePolicy:
+    """
+    Kebijakan kegagalan untuk WebScraper
+
+    - Retry per URL dengan exponential backoff (+ jitter)
+    - Circuit breaker per host
+    - Timeout page load dan tunggu <body> yang bisa dikonfigurasi
+
+    Error DNS dan auth tidak di-retry karena hampir pasti gagal lagi.
+    """
+
+    RETRYABLE = (ERROR_TIMEOUT, ERROR_CONNECTION, ERROR_CRASH, ERROR_MEMORY, ERROR_UNKNOWN)
+
+    def __init__(
+        self,
+        max_attempts: int = 2,
+        backoff_base: float = 2.0,
+        backoff_max: float = 30.0,
+        jitter: float = 0.2,
+        page_load_timeout: float = 30.0,
+        body_wait_timeout: float = 10.0,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.page_load_timeout = page_load_timeout
+        self.body_wait_timeout = body_wait_timeout
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    def should_retry(self, error_class: str, attempt: int) -> bool:
+        """Apakah percobaan berikutnya perlu dilakukan setelah percobaan ke-``attempt`` gagal"""
+        return error_class in self.RETRYABLE and attempt < self.max_attempts
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Delay sebelum percobaan berikutnya (exponential, dibatasi backoff_max)"""
+        delay = min(self.backoff_max, self.backoff_base ** attempt)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
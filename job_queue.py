@@ -0,0 +1,354 @@
+"""
+Job Queue Module
+Antrian job scraping berbasis SQLite dengan lease, heartbeat dan requeue otomatis
+"""
+
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from result_models import ScrapeResult
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    site TEXT NOT NULL,
+    url_index INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    heartbeat_at REAL,
+    result TEXT,
+    screenshot BLOB,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS job_element_screenshots (
+    job_id INTEGER NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+    capability TEXT NOT NULL,
+    screenshot BLOB NOT NULL,
+    PRIMARY KEY (job_id, capability)
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id);
+CREATE INDEX IF NOT EXISTS idx_jobs_batch_site ON jobs(batch, site, url_index);
+CREATE INDEX IF NOT EXISTS idx_jobs_lease ON jobs(status, lease_expires);
+"""
+
+# Status job
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+class JobQueue:
+    """
+    Antrian job scraping (satu job = satu URL) di database SQLite
+
+    - Worker mengambil job dengan ``lease``; job dikunci untuk worker tersebut
+      selama ``lease_seconds`` dan diperpanjang dengan ``heartbeat``
+    - Lease yang kadaluarsa (worker mati/hang) dikembalikan ke antrian, sampai
+      ``max_attempts`` percobaan; setelah itu job ditandai gagal
+    - Hasil scraping (JSON), screenshot halaman dan screenshot elemen per
+      capability (BLOB) dikirim balik lewat ``complete``
+
+    Untuk worker di beberapa host, letakkan database di filesystem bersama dan
+    pakai ``journal_mode='DELETE'`` (mode WAL membutuhkan shared memory di satu host).
+    """
+
+    def __init__(
+        self,
+        db_path: str = "jobs.db",
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        busy_timeout: float = 30.0,
+        journal_mode: str = 'WAL'
+    ):
+        """
+        Args:
+            db_path: Path database antrian
+            lease_seconds: Lama lease job tanpa heartbeat (detik)
+            max_attempts: Maksimum percobaan per job (termasuk lease yang kadaluarsa)
+            busy_timeout: Timeout menunggu lock database (detik)
+            journal_mode: 'WAL' (satu host) atau 'DELETE' (filesystem bersama)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.busy_timeout = busy_timeout
+        self.journal_mode = journal_mode
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Koneksi per thread (sqlite3.Connection tidak aman dibagi antar thread)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout,
+                isolation_level=None  # Transaksi dikelola manual
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transaksi tulis (BEGIN IMMEDIATE, retry jika database sedang dikunci)"""
+        conn = self._connection()
+        deadline = time.monotonic() + self.busy_timeout
+        while True:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                break
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def close(self):
+        """Tutup koneksi thread saat ini"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Coordinator
+    # ------------------------------------------------------------------
+
+    def enqueue(self, batch: str, site: str, urls: List[str], indices: List[int] = None) -> List[int]:
+        """
+        Masukkan URL ke antrian
+
+        Args:
+            batch: ID batch (satu perbandingan)
+            site: Nama website
+            urls: List URL
+            indices: Index URL di daftar asli (default 0..n-1)
+
+        Returns:
+            List id job
+        """
+        now = datetime.now().isoformat()
+        indices = indices if indices is not None else list(range(len(urls)))
+        ids = []
+        with self._transaction() as conn:
+            for index, url in zip(indices, urls):
+                cursor = conn.execute(
+                    "INSERT INTO jobs (batch, site, url_index, url, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (batch, site, index, url, now, now)
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def batch_status(self, batch: str, site: str = None) -> Dict[str, int]:
+        """Jumlah job per status untuk satu batch (opsional satu website)"""
+        query = "SELECT status, COUNT(*) AS n FROM jobs WHERE batch = ?"
+        params: Tuple = (batch,)
+        if site is not None:
+            query += " AND site = ?"
+            params += (site,)
+        rows = self._connection().execute(query + " GROUP BY status", params).fetchall()
+        status = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+        status.update({row['status']: row['n'] for row in rows})
+        return status
+
+    def finished_jobs(self, batch: str, site: str, exclude: List[int] = ()) -> List[Dict[str, Any]]:
+        """
+        Job yang sudah selesai (done atau failed) untuk satu website
+
+        Args:
+            exclude: id job yang sudah diterima (dilewati di query, payload-nya tidak dibaca)
+
+        Returns:
+            List dict dengan key id, url_index, url, status, attempts, result
+            (ScrapeResult atau None), screenshot (bytes atau None),
+            element_screenshots (capability -> bytes), error
+        """
+        conn = self._connection()
+        # Dipanggil berulang selama polling: cari id baru dulu (tanpa BLOB), lalu
+        # baca hasil dan screenshot hanya untuk job tersebut
+        new_ids = [
+            row['id'] for row in conn.execute(
+                "SELECT id FROM jobs WHERE batch = ? AND site = ? AND status IN (?, ?) "
+                "AND id NOT IN (SELECT value FROM json_each(?))",
+                (batch, site, STATUS_DONE, STATUS_FAILED, json.dumps(list(exclude)))
+            )
+        ]
+        if not new_ids:
+            return []
+
+        ids = json.dumps(new_ids)
+        element_screenshots: Dict[int, Dict[str, bytes]] = {}
+        for row in conn.execute(
+            "SELECT job_id, capability, screenshot FROM job_element_screenshots "
+            "WHERE job_id IN (SELECT value FROM json_each(?))", (ids,)
+        ):
+            element_screenshots.setdefault(row['job_id'], {})[row['capability']] = row['screenshot']
+
+        rows = conn.execute(
+            "SELECT id, url_index, url, status, attempts, result, screenshot, error FROM jobs "
+            "WHERE id IN (SELECT value FROM json_each(?)) ORDER BY url_index", (ids,)
+        )
+        return [
+            {
+                'id': row['id'],
+                'url_index': row['url_index'],
+                'url': row['url'],
+                'status': row['status'],
+                'attempts': row['attempts'],
+                'result': ScrapeResult.from_dict(json.loads(row['result'])) if row['result'] else None,
+                'screenshot': row['screenshot'],
+                'element_screenshots': element_screenshots.get(row['id'], {}),
+                'error': row['error']
+            }
+            for row in rows
+        ]
+
+    def requeue_expired(self) -> int:
+        """Kembalikan job dengan lease kadaluarsa ke antrian (atau tandai gagal)"""
+        with self._transaction() as conn:
+            return self._requeue_expired(conn)
+
+    def _requeue_expired(self, conn: sqlite3.Connection) -> int:
+        now = time.time()
+        updated = datetime.now().isoformat()
+        conn.execute(
+            "UPDATE jobs SET status = ?, worker = NULL, lease_expires = NULL, "
+            "error = 'Lease kadaluarsa (worker tidak mengirim heartbeat)', updated_at = ? "
+            "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+            (STATUS_FAILED, updated, STATUS_LEASED, now, self.max_attempts)
+        )
+        cursor = conn.execute(
+            "UPDATE jobs SET status = ?, worker = NULL, lease_expires = NULL, updated_at = ? "
+            "WHERE status = ? AND lease_expires < ?",
+            (STATUS_PENDING, updated, STATUS_LEASED, now)
+        )
+        return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def lease(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Ambil satu job untuk worker
+
+        Returns:
+            Dict id, batch, site, url_index, url, attempts; None jika antrian kosong
+        """
+        with self._transaction() as conn:
+            self._requeue_expired(conn)
+            row = conn.execute(
+                "SELECT id, batch, site, url_index, url, attempts FROM jobs "
+                "WHERE status = ? ORDER BY id LIMIT 1",
+                (STATUS_PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, heartbeat_at = ?, updated_at = ? WHERE id = ?",
+                (STATUS_LEASED, worker_id, now + self.lease_seconds, now,
+                 datetime.now().isoformat(), row['id'])
+            )
+            job = dict(row)
+            job['attempts'] += 1
+            return job
+
+    def heartbeat(self, job_id: int, worker_id: str) -> bool:
+        """Perpanjang lease; False jika job sudah tidak dipegang worker ini"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, heartbeat_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (now + self.lease_seconds, now, job_id, worker_id, STATUS_LEASED)
+            )
+            return cursor.rowcount == 1
+
+    def complete(
+        self,
+        job_id: int,
+        worker_id: str,
+        result: ScrapeResult,
+        screenshot: bytes = None,
+        element_screenshots: Dict[str, bytes] = None
+    ) -> bool:
+        """
+        Kirim hasil job
+
+        Args:
+            screenshot: Isi file screenshot halaman (optional)
+            element_screenshots: Capability -> isi file screenshot elemen (optional)
+
+        Hasil dengan error diperlakukan seperti ``fail`` (job di-retry jika masih ada
+        sisa percobaan). Returns False jika lease sudah hilang (hasil diabaikan).
+        """
+        if 'error' in result:
+            return self.fail(job_id, worker_id, result.error, result)
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, screenshot = ?, error = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                (STATUS_DONE, json.dumps(result.to_dict()), screenshot,
+                 datetime.now().isoformat(), job_id, worker_id, STATUS_LEASED)
+            )
+            if cursor.rowcount != 1:
+                return False
+            conn.executemany(
+                "INSERT OR REPLACE INTO job_element_screenshots (job_id, capability, screenshot) "
+                "VALUES (?, ?, ?)",
+                [(job_id, capability, data) for capability, data in (element_screenshots or {}).items()]
+            )
+            return True
+
+    def fail(self, job_id: int, worker_id: str, error: str, result: ScrapeResult = None) -> bool:
+        """Job gagal: kembali ke antrian jika masih ada sisa percobaan, jika tidak ditandai gagal"""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM jobs WHERE id = ? AND worker = ? AND status = ?",
+                (job_id, worker_id, STATUS_LEASED)
+            ).fetchone()
+            if row is None:
+                return False
+            final = row['attempts'] >= self.max_attempts
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker = ?, lease_expires = NULL, error = ?, "
+                "result = ?, updated_at = ? WHERE id = ?",
+                (STATUS_FAILED if final else STATUS_PENDING,
+                 worker_id if final else None, error,
+                 json.dumps(result.to_dict()) if (final and result is not None) else None,
+                 datetime.now().isoformat(), job_id)
+            )
+            return True
@@ -0,0 +1,140 @@
+"""
+Page Fingerprint Module
+Fingerprint struktur halaman (simhash dari shingle tag-path dan class) dan clustering
+halaman yang memakai template yang sama
+"""
+
+from typing import Dict, List, Optional
+import hashlib
+import math
+import re
+
+
+# Bit simhash
+FINGERPRINT_BITS = 64
+
+# Jumlah leluhur (termasuk elemen itu sendiri) dalam satu shingle tag-path
+PATH_DEPTH = 3
+
+# Elemen maksimum yang dihitung per halaman (sama dengan dom_probe.DOM_STATS_SCRIPT)
+MAX_ELEMENTS = 20000
+
+_DIGITS = re.compile(r'\d+')
+
+
+def _normalize_class(token: str) -> str:
+    """Class tanpa angka (id/urutan data seperti 'station-12' menjadi 'station-')"""
+    return _DIGITS.sub('', token.lower())
+
+
+def _label(tag: str, classes: List[str]) -> str:
+    for token in classes:
+        token = _normalize_class(token)
+        if token:
+            return f"{tag}.{token}"
+    return tag
+
+
+def soup_shingles(soup) -> Dict[str, int]:
+    """
+    Shingle struktur dari HTML yang sudah di-parse (BeautifulSoup)
+
+    Setiap elemen menghasilkan shingle tag-path (``p:div.card>div.chart>canvas``,
+    elemen dengan class pertamanya) dan satu shingle per class (``c:chart``).
+    Angka dihapus dari class supaya halaman dengan data berbeda tetap sama.
+    """
+    shingles: Dict[str, int] = {}
+    for element in soup.find_all(True, limit=MAX_ELEMENTS):
+        labels = []
+        node = element
+        while node is not None and getattr(node, 'name', None) and node.name != '[document]' \
+                and len(labels) < PATH_DEPTH:
+            labels.append(_label(node.name, node.get('class') or []))
+            node = node.parent
+        path = 'p:' + '>'.join(reversed(labels))
+        shingles[path] = shingles.get(path, 0) + 1
+        for token in element.get('class') or []:
+            token = _normalize_class(token)
+            if token:
+                shingles['c:' + token] = shingles.get('c:' + token, 0) + 1
+    return shingles
+
+
+def simhash(shingles: Dict[str, int], bits: int = FINGERPRINT_BITS) -> int:
+    """Simhash dari shingle berbobot (bobot 1 + log(jumlah), supaya elemen berulang tidak dominan)"""
+    vector = [0.0] * bits
+    for shingle, count in shingles.items():
+        weight = 1.0 + math.log(count) if count > 0 else 0.0
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=bits // 8).digest(), 'big')
+        for bit in range(bits):
+            if value >> bit & 1:
+                vector[bit] += weight
+            else:
+                vector[bit] -= weight
+    fingerprint = 0
+    for bit in range(bits):
+        if vector[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def structure_fingerprint(shingles: Dict[str, int]) -> Optional[str]:
+    """Fingerprint struktur (hex) dari shingle; None jika halaman kosong"""
+    if not shingles:
+        return None
+    return format(simhash(shingles), f'0{FINGERPRINT_BITS // 4}x')
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count('1')
+
+
+def cluster_fingerprints(fingerprints: List[Optional[str]], max_distance: int = 3) -> List[List[int]]:
+    """
+    Kelompokkan halaman dengan fingerprint berjarak Hamming <= max_distance
+
+    Fingerprint dipecah menjadi max_distance + 1 band; dua fingerprint yang berjarak
+    <= max_distance pasti sama persis di minimal satu band, jadi hanya representative
+    dengan band yang sama yang dibandingkan (tanpa perbandingan semua pasangan).
+
+    Args:
+        fingerprints: Fingerprint hex per halaman (None = tidak ikut clustering)
+        max_distance: Jarak Hamming maksimum dalam satu cluster
+
+    Returns:
+        List cluster (list index halaman); index pertama adalah representative.
+        Halaman tanpa fingerprint menjadi cluster sendiri.
+    """
+    bands = max_distance + 1
+    width = FINGERPRINT_BITS // bands
+    masks = [(band * width, (1 << width) - 1) for band in range(bands)]
+
+    clusters: List[List[int]] = []
+    # Representative: (fingerprint, posisi cluster di `clusters`)
+    representatives: List[tuple] = []
+    buckets: Dict[tuple, List[int]] = {}
+
+    for index, fingerprint in enumerate(fingerprints):
+        if fingerprint is None:
+            clusters.append([index])
+            continue
+        value = int(fingerprint, 16)
+        keys = [(band, value >> shift & mask) for band, (shift, mask) in enumerate(masks)]
+
+        match = None
+        for key in keys:
+            for representative in buckets.get(key, ()):
+                if hamming_distance(value, representatives[representative][0]) <= max_distance:
+                    match = representatives[representative][1]
+                    break
+            if match is not None:
+                break
+
+        if match is not None:
+            clusters[match].append(index)
+            continue
+        clusters.append([index])
+        representatives.append((value, len(clusters) - 1))
+        for key in keys:
+            buckets.setdefault(key, []).append(len(representatives) - 1)
+    return clusters
@@ -13,73 +13,134 @@ from reportlab.platypus import (
     PageBreak, Image, KeepTogether
 )
 from reportlab.lib.colors import HexColor
+from reportlab.pdfgen import canvas as canvas_module
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+import io
 import os
+import threading
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    PdfReader = PdfWriter = None
+
+from report_renderers import CAPABILITY_NAMES, capability_advantage, performance_rows
+from result_models import capabilities_to_dict
+
+
+# Stylesheet dan template section statis dibuat sekali per proses
+_STYLES = None
+_TEMPLATE_CACHE: Dict[str, bytes] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def get_styles():
+    """Stylesheet laporan (dibagi semua PDFGenerator dalam satu proses)"""
+    global _STYLES
+    with _CACHE_LOCK:
+        if _STYLES is None:
+            _STYLES = _build_styles()
+        return _STYLES
+
+
+def _build_styles():
+    """Stylesheet bawaan reportlab ditambah custom styles laporan"""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=HexColor('#1a1a1a'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=HexColor('#4a4a4a'),
+        spaceAfter=12,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Section header
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=14,
+        textColor=HexColor('#2563eb'),
+        spaceAfter=10,
+        spaceBefore=20,
+        fontName='Helvetica-Bold'
+    ))
+    
+    # Body text
+    styles.add(ParagraphStyle(
+        name='CustomBody',
+        parent=styles['Normal'],
+        fontSize=10,
+        leading=14,
+        alignment=TA_JUSTIFY,
+        spaceAfter=8
+    ))
+    
+    # Caption
+    styles.add(ParagraphStyle(
+        name='Caption',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=HexColor('#666666'),
+        alignment=TA_CENTER,
+        spaceAfter=6
+    ))
+    
+    return styles
+
+
+def _draw_page_number(canvas, number: int):
+    """Nomor halaman di pojok kanan atas"""
+    canvas.saveState()
+    canvas.setFont('Helvetica', 8)
+    canvas.setFillColor(HexColor('#666666'))
+    canvas.drawRightString(A4[0] - 72, A4[1] - 0.5 * inch, f"Halaman {number}")
+    canvas.restoreState()
+
+
+def _render_section(section: str, website_a: str, website_b: str,
+                    cap_a: Dict[str, Any], cap_b: Dict[str, Any],
+                    performance: Optional[Dict[str, Any]] = None) -> bytes:
+    """Render satu section menjadi fragment PDF (dijalankan di worker process)"""
+    generator = PDFGenerator()
+    return generator._render(generator._create_section(section, website_a, website_b, cap_a, cap_b, performance))
 
 
 class PDFGenerator:
-    """Generator laporan PDF untuk hasil perbandingan website"""
+    """
+    Generator laporan PDF untuk hasil perbandingan website
+
+    Section statis (metodologi) dirender sekali per proses menjadi halaman PDF.
+    Section dinamis (ringkasan, tiap capability, kesimpulan) dirender sebagai
+    fragment PDF terpisah, paralel di ``workers`` process, lalu digabung dengan
+    nomor halaman dan bookmark per section. Penggabungan membutuhkan pypdf
+    (optional); tanpa pypdf seluruh laporan dirender dalam satu ``doc.build``.
+    """
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-        
-    def _setup_custom_styles(self):
-        """Setup custom styles untuk PDF"""
-        
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=HexColor('#1a1a1a'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=HexColor('#4a4a4a'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Section header
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=14,
-            textColor=HexColor('#2563eb'),
-            spaceAfter=10,
-            spaceBefore=20,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Body text
-        self.styles.add(ParagraphStyle(
-            name='CustomBody',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leading=14,
-            alignment=TA_JUSTIFY,
-            spaceAfter=8
-        ))
-        
-        # Caption
-        self.styles.add(ParagraphStyle(
-            name='Caption',
-            parent=self.styles['Normal'],
-            fontSize=8,
-            textColor=HexColor('#666666'),
-            alignment=TA_CENTER,
-            spaceAfter=6
-        ))
+    def __init__(self, workers: int = 1):
+        """
+        Args:
+            workers: Jumlah worker process untuk render section (1 = berurutan)
+        """
+        self.styles = get_styles()
+        self.workers = max(1, workers)
     
     def generate_report(
         self,
@@ -87,7 +148,8 @@ class PDFGenerator:
         website_b_name: str,
         website_a_capabilities: Dict[str, Any],
         website_b_capabilities: Dict[str, Any],
-        output_path: str
+        output_path: str,
+        performance: Optional[Dict[str, Any]] = None
     ):
         """
         Generate comprehensive PDF report
@@ -98,50 +160,153 @@ class PDFGenerator:
             website_a_capabilities: Hasil analisis capability Website A
             website_b_capabilities: Hasil analisis capability Website B
             output_path: Path output PDF
+            performance: Ringkasan performa {'website_a': ..., 'website_b': ...} (optional,
+                lihat CapabilityAnalyzer.aggregate_performance); tanpa ini section
+                perbandingan performa tidak dibuat
         """
         
+        cover = self._create_cover_page(website_a_name, website_b_name)
+        
+        if PdfWriter is None:
+            # Tanpa pypdf: seluruh laporan dalam satu story
+            if self.workers > 1:
+                print("[WARNING] pypdf tidak terinstall, section PDF dirender berurutan "
+                      "(pip install -r requirements.txt)")
+            story = cover + [PageBreak()]
+            story.extend(self._create_methodology_section())
+            story.append(PageBreak())
+            story.extend(self._create_summary_table(
+                website_a_name, website_b_name,
+                website_a_capabilities, website_b_capabilities
+            ))
+            story.append(PageBreak())
+            story.extend(self._create_detailed_sections(
+                website_a_name, website_b_name,
+                website_a_capabilities, website_b_capabilities
+            ))
+            story.append(PageBreak())
+            performance_section = self._create_performance_section(website_a_name, website_b_name, performance)
+            if performance_section:
+                story.extend(performance_section)
+                story.append(PageBreak())
+            story.extend(self._create_conclusion_section(
+                website_a_name, website_b_name,
+                website_a_capabilities, website_b_capabilities
+            ))
+            self._build(story, output_path, page_numbers=True)
+        else:
+            sections = self._sections(
+                performance=bool(self._create_performance_section(website_a_name, website_b_name, performance))
+            )
+            fragments = self._render_sections(
+                [section for section, _ in sections],
+                website_a_name, website_b_name,
+                capabilities_to_dict(website_a_capabilities),
+                capabilities_to_dict(website_b_capabilities),
+                performance
+            )
+            self._merge([
+                ('Sampul', self._render(cover)),
+                ('Metodologi Analisis', self._template('methodology', self._create_methodology_section))
+            ] + [(title, fragment) for (_, title), fragment in zip(sections, fragments)], output_path)
+        
+        print(f"[SUCCESS] PDF generated: {output_path}")
+    
+    def _sections(self, performance: bool = False) -> List[Tuple[str, str]]:
+        """Section dinamis laporan (id section, judul bookmark) sesuai urutan"""
+        return ([('summary', 'Ringkasan Perbandingan')]
+                + list(CAPABILITY_NAMES.items())
+                + ([('performance', 'Perbandingan Performa')] if performance else [])
+                + [('conclusion', 'Kesimpulan')])
+    
+    def _create_section(self, section: str, website_a: str, website_b: str,
+                        cap_a: Dict[str, Any], cap_b: Dict[str, Any],
+                        performance: Optional[Dict[str, Any]] = None) -> List:
+        """Story satu section dinamis"""
+        if section == 'summary':
+            return self._create_summary_table(website_a, website_b, cap_a, cap_b)
+        if section == 'performance':
+            return self._create_performance_section(website_a, website_b, performance)
+        if section == 'conclusion':
+            return self._create_conclusion_section(website_a, website_b, cap_a, cap_b)
+        return self._create_capability_detail(
+            CAPABILITY_NAMES[section], section, website_a, website_b, cap_a, cap_b
+        )
+    
+    def _render_sections(self, sections: List[str], website_a: str, website_b: str,
+                         cap_a: Dict[str, Any], cap_b: Dict[str, Any],
+                         performance: Optional[Dict[str, Any]] = None) -> List[bytes]:
+        """Render section menjadi fragment PDF, paralel jika workers > 1"""
+        if self.workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(sections))) as pool:
+                    futures = [
+                        pool.submit(_render_section, section, website_a, website_b, cap_a, cap_b, performance)
+                        for section in sections
+                    ]
+                    return [future.result() for future in futures]
+            except (OSError, BrokenProcessPool) as e:
+                print(f"[WARNING] Render paralel gagal ({e}), render berurutan")
+        return [_render_section(section, website_a, website_b, cap_a, cap_b, performance) for section in sections]
+    
+    def _build(self, story: List, target, page_numbers: bool = False):
+        """Layout story ke file/stream PDF"""
         doc = SimpleDocTemplate(
-            output_path,
+            target,
             pagesize=A4,
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
             bottomMargin=18,
         )
-        
-        story = []
-        
-        # 1. Halaman Sampul
-        story.extend(self._create_cover_page(website_a_name, website_b_name))
-        story.append(PageBreak())
-        
-        # 2. Metodologi
-        story.extend(self._create_methodology_section())
-        story.append(PageBreak())
-        
-        # 3. Tabel Ringkasan
-        story.extend(self._create_summary_table(
-            website_a_name, website_b_name,
-            website_a_capabilities, website_b_capabilities
-        ))
-        story.append(PageBreak())
-        
-        # 4. Detail Per Capability
-        story.extend(self._create_detailed_sections(
-            website_a_name, website_b_name,
-            website_a_capabilities, website_b_capabilities
-        ))
-        
-        # 5. Kesimpulan
-        story.append(PageBreak())
-        story.extend(self._create_conclusion_section(
-            website_a_name, website_b_name,
-            website_a_capabilities, website_b_capabilities
-        ))
-        
-        # Build PDF
-        doc.build(story)
-        print(f"[SUCCESS] PDF generated: {output_path}")
+        if page_numbers:
+            doc.build(story, onLaterPages=lambda canvas, _: _draw_page_number(canvas, canvas.getPageNumber()))
+        else:
+            doc.build(story)
+    
+    def _render(self, story: List) -> bytes:
+        """Render story menjadi fragment PDF (bytes)"""
+        buffer = io.BytesIO()
+        self._build(story, buffer)
+        return buffer.getvalue()
+    
+    def _template(self, name: str, create_story) -> bytes:
+        """Fragment PDF section statis, dirender sekali per proses"""
+        with _CACHE_LOCK:
+            fragment = _TEMPLATE_CACHE.get(name)
+        if fragment is None:
+            fragment = self._render(create_story())
+            with _CACHE_LOCK:
+                _TEMPLATE_CACHE.setdefault(name, fragment)
+        return fragment
+    
+    def _merge(self, fragments: List[Tuple[str, bytes]], output_path: str):
+        """
+        Gabungkan fragment PDF (judul, bytes) berurutan menjadi satu file
+
+        Setiap fragment mendapat bookmark; semua halaman kecuali sampul diberi nomor.
+        """
+        writer = PdfWriter()
+        for title, fragment in fragments:
+            start = len(writer.pages)
+            writer.append(PdfReader(io.BytesIO(fragment)))
+            writer.add_outline_item(title, start)
+        
+        # Nomor halaman dihitung setelah digabung (tiap fragment mulai dari 1)
+        buffer = io.BytesIO()
+        overlay = canvas_module.Canvas(buffer, pagesize=A4)
+        for number in range(1, len(writer.pages) + 1):
+            if number > 1:
+                _draw_page_number(overlay, number)
+            overlay.showPage()
+        overlay.save()
+        numbers = PdfReader(io.BytesIO(buffer.getvalue()))
+        for page, number_page in zip(writer.pages[1:], numbers.pages[1:]):
+            page.merge_page(number_page)
+        
+        writer.page_mode = '/UseOutlines'
+        with open(output_path, 'wb') as f:
+            writer.write(f)
     
     def _create_cover_page(self, website_a: str, website_b: str) -> List:
         """Buat halaman sampul"""
@@ -267,19 +432,7 @@ class PDFGenerator:
             b_status = f"{'✓' if b_supported else '✗'} ({b_confidence})" if b_supported else '✗'
             
             # Determine advantage
-            if a_supported and not b_supported:
-                advantage = website_a
-            elif b_supported and not a_supported:
-                advantage = website_b
-            elif a_supported and b_supported:
-                if a_confidence == 'tinggi' and b_confidence != 'tinggi':
-                    advantage = f"{website_a}*"
-                elif b_confidence == 'tinggi' and a_confidence != 'tinggi':
-                    advantage = f"{website_b}*"
-                else:
-                    advantage = "Setara"
-            else:
-                advantage = "-"
+            advantage = capability_advantage(a_data, b_data, website_a, website_b)
             
             data.append([name, a_status, b_status, advantage])
         
@@ -321,16 +474,7 @@ class PDFGenerator:
         
         elements = []
         
-        capability_names = {
-            'output_grafik_chart': 'Output Grafik / Chart',
-            'output_data_tabel': 'Output Data Tabel',
-            'output_file': 'Output File (CSV, Excel, PDF, Gambar)',
-            'output_dinamis_realtime': 'Output Dinamis / Real-time',
-            'output_interaktif': 'Output Interaktif',
-            'output_berbasis_api': 'Output Berbasis API'
-        }
-        
-        for i, (key, name) in enumerate(capability_names.items()):
+        for i, (key, name) in enumerate(CAPABILITY_NAMES.items()):
             if i > 0:
                 elements.append(PageBreak())
             
@@ -396,6 +540,16 @@ class PDFGenerator:
             status_text += f" (Tingkat Kepercayaan: {confidence.upper()})"
         
         elements.append(Paragraph(status_text, self.styles['CustomBody']))
+        
+        # Mode sampling: estimasi jumlah URL dari seluruh daftar URL
+        if data.get('estimated_url_count') is not None:
+            low, high = data['estimated_url_range']
+            elements.append(Paragraph(
+                f"<b>Estimasi Cakupan:</b> {data['estimated_url_count']} dari {data['total_urls']} URL "
+                f"(interval 95%: {low}-{high}; ditemukan di {data.get('url_count', 0)} dari "
+                f"{data.get('total_urls_analyzed', 0)} URL sampel)",
+                self.styles['CustomBody']
+            ))
         elements.append(Spacer(1, 0.1 * inch))
         
         if supported and urls_with_evidence:
@@ -486,6 +640,48 @@ class PDFGenerator:
         else:
             return f"Kedua website tidak menunjukkan bukti {capability_name} pada halaman yang dianalisis."
     
+    def _create_performance_section(
+        self,
+        website_a: str,
+        website_b: str,
+        performance: Optional[Dict[str, Any]]
+    ) -> List:
+        """Tabel perbandingan performa (kosong jika tidak ada metrik performa)"""
+        performance = performance or {}
+        perf_a, perf_b = performance.get('website_a'), performance.get('website_b')
+        rows = performance_rows(website_a, website_b, perf_a, perf_b)
+        if not rows:
+            return []
+        
+        elements = []
+        elements.append(Paragraph("Perbandingan Performa", self.styles['CustomSubtitle']))
+        elements.append(Spacer(1, 0.2 * inch))
+        
+        table = Table([['Metrik', website_a, website_b, 'Lebih Baik']] + rows,
+                      colWidths=[2.2*inch, 1.6*inch, 1.6*inch, 1.4*inch])
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), HexColor('#2563eb')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, HexColor('#f3f4f6')]),
+        ]))
+        elements.append(table)
+        elements.append(Spacer(1, 0.15 * inch))
+        
+        pages_a = (perf_a or {}).get('pages', 0)
+        pages_b = (perf_b or {}).get('pages', 0)
+        elements.append(Paragraph(
+            f"<i>Median per halaman (p95 dalam kurung), diukur di {pages_a} halaman {website_a} dan "
+            f"{pages_b} halaman {website_b}. Ukuran resource cross-origin tanpa Timing-Allow-Origin "
+            f"tidak terukur.</i>",
+            self.styles['Caption']
+        ))
+        return elements
+    
     def _create_conclusion_section(
         self,
         website_a: str,
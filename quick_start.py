@@ -35,6 +35,24 @@ WEBSITE_B_NAME = "Website B"
 # Output PDF path (opsional, akan auto-generate jika kosong)
 OUTPUT_PDF = None  # atau "output/my_comparison.pdf"
 
+# Database riwayat hasil (opsional) dan mode incremental untuk run berulang:
+# URL yang kontennya tidak berubah sejak run sebelumnya tidak di-scrape ulang
+STORE_PATH = None  # atau "output/results.db"
+INCREMENTAL = False  # True membutuhkan STORE_PATH
+
+# Jumlah browser paralel (dikurangi otomatis jika memori tidak cukup)
+MAX_WORKERS = 1
+
+# Pakai satu browser untuk URL dengan origin sama: None, 'tab' (berbagi cache/koneksi)
+# atau 'context' (cookies/storage terisolasi per URL)
+BROWSER_REUSE = 'tab'
+
+# Disk cache Chrome bersama untuk asset statis (JS bundle, font) antar browser dan run
+CACHE_DIR = None  # atau ".browser_cache"
+
+# Format laporan: 'pdf', 'json' (untuk sistem lain), 'html' (laporan statis ringan)
+REPORT_FORMATS = ['pdf']
+
 # ============================================================
 # JANGAN EDIT DI BAWAH INI
 # ============================================================
@@ -74,13 +92,20 @@ def main():
             website_b_urls=WEBSITE_B_URLS,
             website_a_name=WEBSITE_A_NAME,
             website_b_name=WEBSITE_B_NAME,
-            output_pdf=OUTPUT_PDF
+            output_pdf=OUTPUT_PDF,
+            store_path=STORE_PATH,
+            incremental=INCREMENTAL,
+            formats=REPORT_FORMATS,
+            max_workers=MAX_WORKERS,
+            browser_reuse=BROWSER_REUSE,
+            cache_dir=CACHE_DIR
         )
         
         print("\n" + "="*70)
         print("✓ ANALISIS SELESAI!")
         print("="*70)
-        print(f"\nLaporan PDF: {result['pdf_path']}")
+        for report_format, path in result['reports'].items():
+            print(f"\nLaporan {report_format.upper()}: {path}")
         print(f"Screenshots: {result['screenshot_dir']}/")
         print("\nBuka file PDF untuk melihat hasil lengkap!")
         print("="*70)
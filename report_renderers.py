@@ -0,0 +1,418 @@
+"""
+Report Renderers Module
+Renderer laporan (PDF, JSON, HTML) dari hasil agregasi capability yang sama
+"""
+
+from typing import Dict, List, Any, Optional
+from datetime import datetime
+import html
+import json
+import os
+
+from result_models import capabilities_to_dict
+
+
+# Nama capability untuk laporan (urutan = urutan di laporan)
+CAPABILITY_NAMES = {
+    'output_grafik_chart': 'Output Grafik / Chart',
+    'output_data_tabel': 'Output Data Tabel',
+    'output_file': 'Output File (CSV, Excel, PDF, Gambar)',
+    'output_dinamis_realtime': 'Output Dinamis / Real-time',
+    'output_interaktif': 'Output Interaktif',
+    'output_berbasis_api': 'Output Berbasis API'
+}
+
+
+# Metrik performa di laporan: key -> (nama, satuan). Semua metrik: lebih kecil lebih baik
+PERFORMANCE_METRICS = {
+    'ttfb_ms': ('Time to First Byte', 'ms'),
+    'first_contentful_paint_ms': ('First Contentful Paint', 'ms'),
+    'largest_contentful_paint_ms': ('Largest Contentful Paint', 'ms'),
+    'dom_content_loaded_ms': ('DOMContentLoaded', 'ms'),
+    'load_ms': ('Load', 'ms'),
+    'total_blocking_ms': ('Total Blocking Time', 'ms'),
+    'long_tasks': ('Long Task', ''),
+    'request_count': ('Jumlah Request', ''),
+    'transfer_bytes': ('Total Transfer', 'bytes'),
+    'js_bytes': ('Ukuran JavaScript', 'bytes'),
+    'css_bytes': ('Ukuran CSS', 'bytes'),
+}
+
+
+def format_metric(value: Optional[float], unit: str) -> str:
+    """Nilai metrik untuk laporan ('1.2 s', '340 KB', '12')"""
+    if value is None:
+        return '-'
+    if unit == 'ms':
+        return f"{value / 1000:.2f} s" if value >= 1000 else f"{value:.0f} ms"
+    if unit == 'bytes':
+        if value >= 1024 * 1024:
+            return f"{value / (1024 * 1024):.1f} MB"
+        return f"{value / 1024:.0f} KB"
+    return f"{value:.0f}"
+
+
+def performance_rows(
+    website_a: str,
+    website_b: str,
+    perf_a: Optional[Dict[str, Any]],
+    perf_b: Optional[Dict[str, Any]]
+) -> List[List[str]]:
+    """
+    Baris tabel perbandingan performa: [metrik, A, B, lebih baik]
+
+    Nilai ditulis sebagai median (p95). Website dengan median lebih kecil unggul;
+    selisih di bawah 5% dianggap setara. Metrik yang tidak ada di kedua website dilewati.
+    """
+    metrics_a = (perf_a or {}).get('metrics', {})
+    metrics_b = (perf_b or {}).get('metrics', {})
+    rows = []
+    for key, (name, unit) in PERFORMANCE_METRICS.items():
+        a, b = metrics_a.get(key), metrics_b.get(key)
+        if a is None and b is None:
+            continue
+
+        def cell(item):
+            if item is None:
+                return '-'
+            return f"{format_metric(item['p50'], unit)} ({format_metric(item['p95'], unit)})"
+
+        if a is None or b is None:
+            better = '-'
+        elif abs(a['p50'] - b['p50']) <= 0.05 * max(a['p50'], b['p50']):
+            better = 'Setara'
+        else:
+            better = website_a if a['p50'] < b['p50'] else website_b
+        rows.append([name, cell(a), cell(b), better])
+    return rows
+
+
+def capability_advantage(a_data: Dict[str, Any], b_data: Dict[str, Any], website_a: str, website_b: str) -> str:
+    """Website yang unggul untuk satu capability ('*' = tingkat kepercayaan lebih tinggi)"""
+    a_supported = a_data.get('supported', False)
+    b_supported = b_data.get('supported', False)
+    a_confidence = a_data.get('confidence', 'rendah')
+    b_confidence = b_data.get('confidence', 'rendah')
+
+    if a_supported and not b_supported:
+        return website_a
+    if b_supported and not a_supported:
+        return website_b
+    if a_supported and b_supported:
+        if a_confidence == 'tinggi' and b_confidence != 'tinggi':
+            return f"{website_a}*"
+        if b_confidence == 'tinggi' and a_confidence != 'tinggi':
+            return f"{website_b}*"
+        return "Setara"
+    return "-"
+
+
+def build_report_data(
+    website_a_name: str,
+    website_b_name: str,
+    website_a_capabilities: Dict[str, Any],
+    website_b_capabilities: Dict[str, Any],
+    run_id: Optional[int] = None,
+    performance: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Struktur data laporan (format JSON) yang dipakai semua renderer non-PDF
+
+    ``performance`` berisi ringkasan performa per website ({'website_a': ...,
+    'website_b': ...}, lihat CapabilityAnalyzer.aggregate_performance).
+    """
+    cap_a = capabilities_to_dict(website_a_capabilities)
+    cap_b = capabilities_to_dict(website_b_capabilities)
+
+    capabilities = {}
+    for key, name in CAPABILITY_NAMES.items():
+        a_data = cap_a.get(key, {})
+        b_data = cap_b.get(key, {})
+        capabilities[key] = {
+            'name': name,
+            'website_a': a_data,
+            'website_b': b_data,
+            'advantage': capability_advantage(a_data, b_data, website_a_name, website_b_name)
+        }
+
+    data = {
+        'generated_at': datetime.now().isoformat(),
+        'run_id': run_id,
+        'website_a': {'name': website_a_name},
+        'website_b': {'name': website_b_name},
+        'capabilities': capabilities
+    }
+    for side in ('website_a', 'website_b'):
+        if (performance or {}).get(side):
+            data[side]['performance'] = performance[side]
+    return data
+
+
+class ReportRenderer:
+    """Base class renderer laporan"""
+
+    format = None
+    extension = None
+
+    def render(
+        self,
+        website_a_name: str,
+        website_b_name: str,
+        website_a_capabilities: Dict[str, Any],
+        website_b_capabilities: Dict[str, Any],
+        output_path: str,
+        run_id: Optional[int] = None,
+        performance: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Tulis laporan ke output_path dan kembalikan path-nya
+
+        ``performance``: ringkasan performa {'website_a': ..., 'website_b': ...} (optional)
+        """
+        raise NotImplementedError
+
+
+class PDFReportRenderer(ReportRenderer):
+    """Laporan PDF (PDFGenerator)"""
+
+    format = 'pdf'
+    extension = '.pdf'
+
+    def __init__(self, pdf_generator=None, workers: int = 1):
+        """
+        Args:
+            pdf_generator: PDFGenerator yang dipakai (optional)
+            workers: Worker process untuk render section PDF (lihat PDFGenerator)
+        """
+        self._pdf_generator = pdf_generator
+        self.workers = workers
+
+    @property
+    def pdf_generator(self):
+        # reportlab baru di-load jika PDF benar-benar dibuat
+        if self._pdf_generator is None:
+            from pdf_generator import PDFGenerator
+            self._pdf_generator = PDFGenerator(workers=self.workers)
+        return self._pdf_generator
+
+    def render(self, website_a_name, website_b_name, website_a_capabilities,
+               website_b_capabilities, output_path, run_id=None, performance=None):
+        self.pdf_generator.generate_report(
+            website_a_name=website_a_name,
+            website_b_name=website_b_name,
+            website_a_capabilities=website_a_capabilities,
+            website_b_capabilities=website_b_capabilities,
+            output_path=output_path,
+            performance=performance
+        )
+        return output_path
+
+
+class JSONReportRenderer(ReportRenderer):
+    """Laporan JSON untuk sistem lain (struktur build_report_data)"""
+
+    format = 'json'
+    extension = '.json'
+
+    def render(self, website_a_name, website_b_name, website_a_capabilities,
+               website_b_capabilities, output_path, run_id=None, performance=None):
+        data = build_report_data(
+            website_a_name, website_b_name, website_a_capabilities, website_b_capabilities, run_id,
+            performance
+        )
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"[SUCCESS] JSON generated: {output_path}")
+        return output_path
+
+
+class HTMLReportRenderer(ReportRenderer):
+    """
+    Laporan HTML statis
+
+    Screenshot ditampilkan sebagai thumbnail kecil (dibuat dengan Pillow di directory
+    ``<nama laporan>_files``) dengan ``loading="lazy"`` dan link ke screenshot penuh.
+    """
+
+    format = 'html'
+    extension = '.html'
+
+    STYLE = """
+body { font-family: Helvetica, Arial, sans-serif; color: #1a1a1a; max-width: 1100px; margin: 2em auto; padding: 0 1em; }
+h1 { text-align: center; } h2 { color: #4a4a4a; margin-top: 2em; } h3 { color: #2563eb; }
+table { border-collapse: collapse; width: 100%; }
+th { background: #2563eb; color: #fff; } th, td { border: 1px solid #000; padding: 6px 10px; text-align: center; }
+tr:nth-child(even) td { background: #f3f4f6; }
+.sites { display: flex; gap: 2em; } .site { flex: 1; min-width: 0; }
+.caption { font-size: 0.8em; color: #666; } .url { word-break: break-all; }
+img { border: 1px solid #ddd; max-width: 100%; height: auto; }
+"""
+
+    def __init__(self, thumbnail_width: int = 480):
+        self.thumbnail_width = thumbnail_width
+
+    def _thumbnail(self, screenshot_path: str, files_dir: str, output_dir: str) -> Optional[str]:
+        """
+        Buat thumbnail JPEG (path relatif terhadap laporan); None jika screenshot tidak ada
+
+        Thumbnail yang sudah ada dipakai ulang selama tidak lebih lama dari screenshot-nya
+        (screenshot dengan nama sama ditimpa saat run berikutnya).
+        """
+        if not screenshot_path or not os.path.exists(screenshot_path):
+            return None
+        os.makedirs(files_dir, exist_ok=True)
+        name = os.path.splitext(os.path.basename(screenshot_path))[0] + '_thumb.jpg'
+        thumbnail_path = os.path.join(files_dir, name)
+        if not os.path.exists(thumbnail_path) \
+                or os.path.getmtime(thumbnail_path) < os.path.getmtime(screenshot_path):
+            try:
+                from PIL import Image
+                with Image.open(screenshot_path) as image:
+                    image.thumbnail((self.thumbnail_width, self.thumbnail_width * 4))
+                    image.convert('RGB').save(thumbnail_path, 'JPEG', quality=75)
+            except Exception as e:
+                print(f"[INFO] Thumbnail gagal dibuat untuk {screenshot_path}: {e}")
+                return None
+        return os.path.relpath(thumbnail_path, output_dir)
+
+    def _site_detail(self, data: Dict[str, Any], website_name: str, files_dir: str, output_dir: str) -> List[str]:
+        parts = [f"<div class='site'><h3>{html.escape(website_name)}</h3>"]
+        supported = data.get('supported', False)
+        status = 'DIDUKUNG' if supported else 'TIDAK DIDUKUNG'
+        if supported:
+            status += f" (Tingkat Kepercayaan: {html.escape(data.get('confidence', 'rendah').upper())})"
+        parts.append(f"<p><b>Status:</b> {status}</p>")
+        if data.get('estimated_url_count') is not None:
+            low, high = data['estimated_url_range']
+            parts.append(
+                f"<p><b>Estimasi Cakupan:</b> {data['estimated_url_count']} dari {data['total_urls']} URL "
+                f"(interval 95%: {low}-{high}; ditemukan di {data.get('url_count', 0)} dari "
+                f"{data.get('total_urls_analyzed', 0)} URL sampel)</p>"
+            )
+
+        evidence_urls = data.get('urls_with_evidence', [])
+        if supported and evidence_urls:
+            primary = evidence_urls[0]
+            parts.append(f"<p class='url'><b>URL Sumber:</b> {html.escape(primary.get('url') or '-')}</p>")
+            parts.append("<p><b>Indikator Teknis:</b></p><ul>")
+            parts.extend(f"<li>{html.escape(item)}</li>" for item in primary.get('evidence', []))
+            parts.append("</ul>")
+
+            screenshot = primary.get('screenshot')
+            thumbnail = self._thumbnail(screenshot, files_dir, output_dir)
+            if thumbnail:
+                full = os.path.relpath(os.path.abspath(screenshot), output_dir)
+                parts.append(
+                    f"<a href='{html.escape(full)}'><img src='{html.escape(thumbnail)}' loading='lazy' "
+                    f"width='{self.thumbnail_width}' alt='Screenshot'></a>"
+                    f"<p class='caption'>Screenshot: {html.escape(os.path.basename(screenshot))}</p>"
+                )
+            else:
+                parts.append("<p class='caption'><i>Screenshot tidak tersedia</i></p>")
+
+            if len(evidence_urls) > 1:
+                parts.append(f"<p class='caption'><i>Capability ini juga ditemukan di "
+                             f"{len(evidence_urls) - 1} URL lainnya</i></p>")
+        else:
+            parts.append("<p><i>Tidak ditemukan bukti teknis untuk capability ini</i></p>")
+        parts.append("</div>")
+        return parts
+
+    def render(self, website_a_name, website_b_name, website_a_capabilities,
+               website_b_capabilities, output_path, run_id=None, performance=None):
+        data = build_report_data(
+            website_a_name, website_b_name, website_a_capabilities, website_b_capabilities, run_id,
+            performance
+        )
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        files_dir = os.path.splitext(os.path.abspath(output_path))[0] + '_files'
+        name_a, name_b = html.escape(website_a_name), html.escape(website_b_name)
+
+        parts = [
+            "<!DOCTYPE html><html lang='id'><head><meta charset='utf-8'>",
+            f"<title>Perbandingan {name_a} vs {name_b}</title><style>{self.STYLE}</style></head><body>",
+            "<h1>Perbandingan Output Capability</h1>",
+            f"<p style='text-align:center'><b>Website A:</b> {name_a} &nbsp; <b>Website B:</b> {name_b}<br>"
+            f"Tanggal Analisis: {datetime.now().strftime('%d %B %Y')}</p>",
+            "<h2>Ringkasan Perbandingan</h2><table>",
+            f"<tr><th>Capability</th><th>{name_a}</th><th>{name_b}</th><th>Keunggulan</th></tr>"
+        ]
+
+        def status(item):
+            return f"✓ ({html.escape(item.get('confidence', 'rendah'))})" if item.get('supported') else '✗'
+
+        for capability in data['capabilities'].values():
+            parts.append(
+                f"<tr><td>{html.escape(capability['name'])}</td><td>{status(capability['website_a'])}</td>"
+                f"<td>{status(capability['website_b'])}</td><td>{html.escape(capability['advantage'])}</td></tr>"
+            )
+        parts.append("</table><p class='caption'><i>* = Tingkat kepercayaan lebih tinggi</i></p>")
+
+        for key, capability in data['capabilities'].items():
+            parts.append(f"<h2 id='{key}'>{html.escape(capability['name'])}</h2><div class='sites'>")
+            parts.extend(self._site_detail(capability['website_a'], website_a_name, files_dir, output_dir))
+            parts.extend(self._site_detail(capability['website_b'], website_b_name, files_dir, output_dir))
+            parts.append("</div>")
+
+        rows = performance_rows(website_a_name, website_b_name,
+                                data['website_a'].get('performance'), data['website_b'].get('performance'))
+        if rows:
+            parts.append("<h2 id='performa'>Perbandingan Performa</h2><table>")
+            parts.append(f"<tr><th>Metrik</th><th>{name_a}</th><th>{name_b}</th><th>Lebih Baik</th></tr>")
+            parts.extend(
+                "<tr>" + ''.join(f"<td>{html.escape(value)}</td>" for value in row) + "</tr>" for row in rows
+            )
+            parts.append("</table><p class='caption'><i>Median per halaman (p95 dalam kurung)</i></p>")
+
+        parts.append("</body></html>")
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(parts))
+        print(f"[SUCCESS] HTML generated: {output_path}")
+        return output_path
+
+
+RENDERERS = {
+    renderer.format: renderer
+    for renderer in (PDFReportRenderer, JSONReportRenderer, HTMLReportRenderer)
+}
+
+REPORT_FORMATS = tuple(RENDERERS)
+
+
+def render_reports(
+    formats: List[str],
+    output_base: str,
+    website_a_name: str,
+    website_b_name: str,
+    website_a_capabilities: Dict[str, Any],
+    website_b_capabilities: Dict[str, Any],
+    run_id: Optional[int] = None,
+    renderers: Dict[str, ReportRenderer] = None,
+    performance: Optional[Dict[str, Any]] = None
+) -> Dict[str, str]:
+    """
+    Render laporan dalam beberapa format
+
+    Args:
+        formats: List format ('pdf', 'json', 'html')
+        output_base: Path laporan tanpa ekstensi (ekstensi ditambahkan per format)
+        renderers: Instance renderer yang dipakai ulang (optional, per format)
+        performance: Ringkasan performa per website ({'website_a': ..., 'website_b': ...})
+
+    Returns:
+        Dict format -> path laporan
+    """
+    unknown = [f for f in formats if f not in RENDERERS]
+    if unknown:
+        raise ValueError(f"Format laporan tidak dikenal: {', '.join(unknown)}")
+
+    renderers = renderers or {}
+    reports = {}
+    for report_format in formats:
+        renderer = renderers.get(report_format) or RENDERERS[report_format]()
+        reports[report_format] = renderer.render(
+            website_a_name, website_b_name,
+            website_a_capabilities, website_b_capabilities,
+            output_base + renderer.extension, run_id, performance
+        )
+    return reports
@@ -0,0 +1,271 @@
+"""
+Resource Governor Module
+Batas resource proses Chrome: jumlah renderer, heap JavaScript, RSS per browser dan
+jumlah worker paralel yang menyesuaikan memori yang tersedia
+"""
+
+from typing import Dict, List, Optional
+from contextlib import contextmanager
+import os
+import signal
+import threading
+
+try:
+    import psutil
+except ImportError:  # psutil opsional, fallback ke /proc (Linux)
+    psutil = None
+
+from failure_policy import ResourceLimitError
+
+
+def _proc_children_map() -> Dict[int, List[int]]:
+    """Peta pid -> pid anak dari /proc"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # Field ke-4 adalah ppid; nama proses (field 2) bisa berisi spasi
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def process_tree(pid: int) -> List[int]:
+    """pid beserta semua turunannya"""
+    if psutil is not None:
+        try:
+            parent = psutil.Process(pid)
+            return [pid] + [child.pid for child in parent.children(recursive=True)]
+        except psutil.Error:
+            return []
+    if not os.path.isdir('/proc'):
+        return [pid]
+    children = _proc_children_map()
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def process_rss_mb(pid: int) -> float:
+    """RSS satu proses dalam MB (0 jika tidak bisa dibaca)"""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return 0.0
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def available_memory_mb() -> Optional[float]:
+    """Memori yang tersedia di sistem dalam MB (None jika tidak diketahui)"""
+    if psutil is not None:
+        return psutil.virtual_memory().available / (1024 * 1024)
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def driver_pid(driver) -> Optional[int]:
+    """pid proses chromedriver milik driver (Chrome adalah turunannya)"""
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+class ResourceGovernor:
+    """
+    Pengatur resource browser untuk WebScraper
+
+    - Argumen Chrome: batas jumlah proses renderer dan batas heap V8 per renderer
+    - Watchdog per driver: RSS seluruh pohon proses browser dipantau; jika melebihi
+      ``driver_rss_budget_mb``, proses Chrome dihentikan dan scraping gagal dengan
+      ResourceLimitError (di-retry dengan browser baru)
+    - Slot worker: worker baru hanya mulai jika memori tersedia cukup untuk satu
+      browser lagi (``memory_per_driver_mb`` + ``memory_reserve_mb``), maksimal
+      ``max_workers``; minimal satu worker selalu boleh berjalan
+
+    psutil dipakai jika terpasang, jika tidak data dibaca dari /proc.
+    """
+
+    def __init__(
+        self,
+        renderer_process_limit: int = 4,
+        js_heap_mb: int = 512,
+        driver_rss_budget_mb: float = 2048.0,
+        memory_per_driver_mb: float = 800.0,
+        memory_reserve_mb: float = 512.0,
+        max_workers: int = 1,
+        monitor_interval: float = 2.0
+    ):
+        """
+        Args:
+            renderer_process_limit: Maksimum proses renderer per browser
+            js_heap_mb: Batas old-space heap V8 per renderer (MB)
+            driver_rss_budget_mb: Budget RSS pohon proses satu browser (MB), None untuk nonaktif
+            memory_per_driver_mb: Perkiraan memori satu browser (MB) untuk admission worker
+            memory_reserve_mb: Memori yang disisakan untuk sistem (MB)
+            max_workers: Maksimum worker paralel
+            monitor_interval: Interval sampling RSS watchdog (detik)
+        """
+        self.renderer_process_limit = renderer_process_limit
+        self.js_heap_mb = js_heap_mb
+        self.driver_rss_budget_mb = driver_rss_budget_mb
+        self.memory_per_driver_mb = memory_per_driver_mb
+        self.memory_reserve_mb = memory_reserve_mb
+        self.max_workers = max(1, max_workers)
+        self.monitor_interval = monitor_interval
+
+        self._active = 0
+        self._condition = threading.Condition()
+        self.peak_rss_mb = 0.0
+        self.recycled_drivers = 0
+
+    # ------------------------------------------------------------------
+    # Chrome
+    # ------------------------------------------------------------------
+
+    def chrome_arguments(self) -> List[str]:
+        """Argumen command line Chrome untuk membatasi resource"""
+        arguments = []
+        if self.renderer_process_limit:
+            arguments.append(f'--renderer-process-limit={self.renderer_process_limit}')
+        if self.js_heap_mb:
+            arguments.append(f'--js-flags=--max-old-space-size={self.js_heap_mb}')
+        return arguments
+
+    def driver_rss_mb(self, driver) -> float:
+        """RSS total pohon proses browser (chromedriver + Chrome) dalam MB"""
+        pid = driver_pid(driver)
+        if pid is None:
+            return 0.0
+        return sum(process_rss_mb(p) for p in process_tree(pid))
+
+    def exceeds_budget(self, driver) -> bool:
+        """Apakah browser sudah melebihi budget RSS"""
+        if not self.driver_rss_budget_mb:
+            return False
+        return self.driver_rss_mb(driver) > self.driver_rss_budget_mb
+
+    def _kill_browser(self, driver):
+        """Hentikan proses Chrome (bukan chromedriver) supaya perintah WebDriver berikutnya gagal"""
+        pid = driver_pid(driver)
+        if pid is None:
+            return
+        for child in process_tree(pid)[1:]:
+            try:
+                os.kill(child, signal.SIGKILL)
+            except (OSError, AttributeError):
+                pass
+
+    def record_recycled(self):
+        """Catat satu browser yang dihentikan/dibuat ulang karena melebihi budget"""
+        with self._condition:
+            self.recycled_drivers += 1
+
+    @contextmanager
+    def watch(self, driver):
+        """
+        Pantau RSS browser selama blok berjalan
+
+        Jika budget terlampaui, browser dihentikan dan ResourceLimitError di-raise
+        saat blok selesai (menggantikan error WebDriver akibat browser mati).
+        """
+        if not self.driver_rss_budget_mb or driver_pid(driver) is None:
+            yield
+            return
+
+        stop = threading.Event()
+        exceeded = []
+
+        def monitor():
+            while not stop.wait(self.monitor_interval):
+                rss = self.driver_rss_mb(driver)
+                with self._condition:
+                    self.peak_rss_mb = max(self.peak_rss_mb, rss)
+                if rss > self.driver_rss_budget_mb:
+                    exceeded.append(rss)
+                    print(f"[WARNING] RSS browser {rss:.0f} MB melebihi budget "
+                          f"{self.driver_rss_budget_mb:.0f} MB, browser dihentikan")
+                    self._kill_browser(driver)
+                    return
+
+        thread = threading.Thread(target=monitor, daemon=True)
+        thread.start()
+        try:
+            yield
+        except Exception as e:
+            if exceeded:
+                raise ResourceLimitError(
+                    f"RSS browser {exceeded[0]:.0f} MB melebihi budget {self.driver_rss_budget_mb:.0f} MB"
+                ) from e
+            raise
+        finally:
+            stop.set()
+            thread.join()
+            if exceeded:
+                self.record_recycled()
+        if exceeded:
+            raise ResourceLimitError(
+                f"RSS browser {exceeded[0]:.0f} MB melebihi budget {self.driver_rss_budget_mb:.0f} MB"
+            )
+
+    # ------------------------------------------------------------------
+    # Concurrency
+    # ------------------------------------------------------------------
+
+    def allowed_workers(self) -> int:
+        """Jumlah worker yang boleh berjalan berdasarkan memori yang tersedia saat ini"""
+        available = available_memory_mb()
+        if available is None:
+            return self.max_workers
+        # Memori yang sudah dipakai worker aktif tidak lagi terlihat sebagai "available"
+        spare = available - self.memory_reserve_mb
+        extra = int(spare // self.memory_per_driver_mb) if spare > 0 else 0
+        return max(1, min(self.max_workers, self._active + extra))
+
+    @contextmanager
+    def slot(self, poll_interval: float = 1.0):
+        """Ambil slot worker; menunggu sampai memori cukup untuk satu browser lagi"""
+        with self._condition:
+            waited = False
+            while self._active > 0 and self._active >= self.allowed_workers():
+                if not waited:
+                    print(f"[INFO] Menunggu memori/slot worker ({self._active} browser aktif)")
+                    waited = True
+                self._condition.wait(poll_interval)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[str, float]:
+        """Ringkasan: peak RSS browser dan jumlah browser yang di-recycle"""
+        with self._condition:
+            return {
+                'peak_rss_mb': round(self.peak_rss_mb, 1),
+                'recycled_drivers': self.recycled_drivers,
+                'active_workers': self._active
+            }
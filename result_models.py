@@ -0,0 +1,275 @@
+"""
+Result Models Module
+Record type ringkas (__slots__) untuk hasil scraping, statistik DOM dan verdict capability
+"""
+
+from typing import Dict, List, Any, Optional
+
+
+class _Record:
+    """
+    Base class untuk record ber-__slots__
+
+    Record tetap bisa dibaca seperti dict (``record['url']``, ``record.get(...)``,
+    ``'error' in record``) supaya kode lama yang memakai dict tetap berjalan.
+    """
+
+    __slots__ = ()
+
+    # Field yang dihilangkan dari to_dict() (dan dianggap tidak ada) jika bernilai None
+    _optional = ()
+
+    def _has(self, key: str) -> bool:
+        if key not in self.__slots__:
+            return False
+        return not (key in self._optional and getattr(self, key) is None)
+
+    def __contains__(self, key: str) -> bool:
+        return self._has(key)
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._has(key):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if not self._has(key):
+            return default
+        return getattr(self, key)
+
+    def keys(self) -> List[str]:
+        return [key for key in self.__slots__ if self._has(key)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dict biasa (format lama, siap untuk JSON)"""
+        result = {}
+        for key in self.keys():
+            value = getattr(self, key)
+            if isinstance(value, _Record):
+                value = value.to_dict()
+            elif isinstance(value, list) and value and isinstance(value[0], _Record):
+                value = [item.to_dict() for item in value]
+            result[key] = value
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Buat record dari dict (mengabaikan key yang tidak dikenal)"""
+        if isinstance(data, cls):
+            return data
+        return cls(**{key: data[key] for key in cls.__slots__ if key in data})
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={getattr(self, key)!r}" for key in self.__slots__
+                           if key != 'html')
+        return f"{type(self).__name__}({fields})"
+
+
+class DomStats(_Record):
+    """
+    Statistik DOM hasil _analyze_dom
+
+    ``chart_class_count``, ``grid_class_count`` dan ``event_handler_count`` hanya
+    diisi oleh ekstraksi di browser (tanpa HTML), supaya analyzer tidak perlu
+    mem-parse HTML lengkap. ``fingerprint`` adalah fingerprint struktur halaman
+    (lihat page_fingerprint).
+    """
+
+    __slots__ = (
+        'canvas_count', 'svg_count', 'table_count', 'chart_containers',
+        'tables', 'download_elements', 'inputs', 'form_count',
+        'chart_class_count', 'grid_class_count', 'event_handler_count', 'fingerprint'
+    )
+
+    _optional = ('chart_class_count', 'grid_class_count', 'event_handler_count', 'fingerprint')
+
+    def __init__(
+        self,
+        canvas_count: int = 0,
+        svg_count: int = 0,
+        table_count: int = 0,
+        chart_containers: Optional[List[Dict[str, Any]]] = None,
+        tables: Optional[List[Dict[str, Any]]] = None,
+        download_elements: Optional[List[Dict[str, Any]]] = None,
+        inputs: Optional[Dict[str, int]] = None,
+        form_count: int = 0,
+        chart_class_count: Optional[int] = None,
+        grid_class_count: Optional[int] = None,
+        event_handler_count: Optional[int] = None,
+        fingerprint: Optional[str] = None
+    ):
+        self.canvas_count = canvas_count
+        self.svg_count = svg_count
+        self.table_count = table_count
+        self.chart_containers = chart_containers if chart_containers is not None else []
+        self.tables = tables if tables is not None else []
+        self.download_elements = download_elements if download_elements is not None else []
+        self.inputs = inputs if inputs is not None else {}
+        self.form_count = form_count
+        self.chart_class_count = chart_class_count
+        self.grid_class_count = grid_class_count
+        self.event_handler_count = event_handler_count
+        self.fingerprint = fingerprint
+
+
+class ScrapeResult(_Record):
+    """
+    Hasil scraping satu URL
+
+    ``element_screenshots`` berisi screenshot per capability (nama capability ->
+    path) yang di-clip ke elemen buktinya; ``screenshot_path`` adalah screenshot viewport.
+    ``update_rate`` adalah hasil observasi update (dom_probe.measure_update_rate),
+    ``websocket_stats`` statistik frame WebSocket selama observasi yang sama
+    (websocket_monitor.WebSocketMonitor) dan ``performance`` metrik performa halaman
+    (dom_probe.performance_metrics).
+    """
+
+    __slots__ = (
+        'url', 'website_name', 'html', 'screenshot_path', 'network_requests',
+        'console_logs', 'dom_elements', 'javascript_libraries', 'websocket_detected',
+        'timestamp', 'error', 'error_class', 'attempts', 'element_screenshots', 'update_rate',
+        'websocket_stats', 'performance'
+    )
+
+    _optional = ('html', 'timestamp', 'error', 'error_class', 'element_screenshots', 'update_rate',
+                 'websocket_stats', 'performance')
+
+    def __init__(
+        self,
+        url: str,
+        website_name: str,
+        html: Optional[str] = None,
+        screenshot_path: Optional[str] = None,
+        network_requests: Optional[List[Dict[str, Any]]] = None,
+        console_logs: Optional[List[Dict[str, Any]]] = None,
+        dom_elements: Optional[DomStats] = None,
+        javascript_libraries: Optional[List[str]] = None,
+        websocket_detected: bool = False,
+        timestamp: Optional[str] = None,
+        error: Optional[str] = None,
+        error_class: Optional[str] = None,
+        attempts: int = 1,
+        element_screenshots: Optional[Dict[str, str]] = None,
+        update_rate: Optional[Dict[str, Any]] = None,
+        websocket_stats: Optional[Dict[str, Any]] = None,
+        performance: Optional[Dict[str, Any]] = None
+    ):
+        self.url = url
+        self.website_name = website_name
+        self.html = html
+        self.screenshot_path = screenshot_path
+        self.network_requests = network_requests if network_requests is not None else []
+        self.console_logs = console_logs if console_logs is not None else []
+        if dom_elements is None:
+            dom_elements = DomStats()
+        elif isinstance(dom_elements, dict):
+            dom_elements = DomStats.from_dict(dom_elements)
+        self.dom_elements = dom_elements
+        self.javascript_libraries = javascript_libraries if javascript_libraries is not None else []
+        self.websocket_detected = websocket_detected
+        self.timestamp = timestamp
+        self.error = error
+        self.error_class = error_class
+        self.attempts = attempts
+        self.element_screenshots = element_screenshots
+        self.update_rate = update_rate
+        self.websocket_stats = websocket_stats
+        self.performance = performance
+
+
+class CapabilityVerdict(_Record):
+    """
+    Verdict satu capability untuk satu URL
+
+    ``url`` dan ``screenshot`` hanya diisi saat verdict menjadi bukti
+    di ``urls_with_evidence`` hasil agregasi.
+    """
+
+    __slots__ = ('supported', 'confidence', 'evidence', 'indicators', 'url', 'screenshot')
+
+    _optional = ('url', 'screenshot')
+
+    def __init__(
+        self,
+        supported: bool = False,
+        confidence: str = 'rendah',
+        evidence: Optional[List[str]] = None,
+        indicators: Optional[Dict[str, Any]] = None,
+        url: Optional[str] = None,
+        screenshot: Optional[str] = None
+    ):
+        self.supported = supported
+        self.confidence = confidence
+        self.evidence = evidence if evidence is not None else []
+        self.indicators = indicators if indicators is not None else {}
+        self.url = url
+        self.screenshot = screenshot
+
+    def with_source(self, url: Optional[str], screenshot: Optional[str]) -> 'CapabilityVerdict':
+        """Salinan verdict dengan URL sumber dan screenshot (evidence list dibagi, tidak disalin)"""
+        return CapabilityVerdict(
+            supported=self.supported,
+            confidence=self.confidence,
+            evidence=self.evidence,
+            indicators=self.indicators,
+            url=url,
+            screenshot=screenshot
+        )
+
+    def _has(self, key: str) -> bool:
+        # URL sumber selalu ada (walau None) pada entry urls_with_evidence
+        if key == 'screenshot' and self.url is not None:
+            return True
+        return super()._has(key)
+
+
+class AggregatedCapability(_Record):
+    """
+    Agregasi satu capability dari semua URL satu website
+
+    Pada mode sampling, ``url_count`` dan ``total_urls_analyzed`` adalah angka sampel;
+    ``total_urls`` adalah jumlah seluruh URL dan ``estimated_url_count`` /
+    ``estimated_url_range`` (interval 95%) adalah estimasi untuk seluruh URL.
+    """
+
+    __slots__ = (
+        'supported', 'confidence', 'url_count', 'urls_with_evidence', 'total_urls_analyzed',
+        'total_urls', 'estimated_url_count', 'estimated_url_range'
+    )
+
+    _optional = ('total_urls', 'estimated_url_count', 'estimated_url_range')
+
+    def __init__(
+        self,
+        supported: bool = False,
+        confidence: str = 'rendah',
+        url_count: int = 0,
+        urls_with_evidence: Optional[List[CapabilityVerdict]] = None,
+        total_urls_analyzed: int = 0,
+        total_urls: Optional[int] = None,
+        estimated_url_count: Optional[int] = None,
+        estimated_url_range: Optional[List[int]] = None
+    ):
+        self.supported = supported
+        self.confidence = confidence
+        self.url_count = url_count
+        self.urls_with_evidence = [
+            CapabilityVerdict.from_dict(item) for item in (urls_with_evidence or [])
+        ]
+        self.total_urls_analyzed = total_urls_analyzed
+        self.total_urls = total_urls
+        self.estimated_url_count = estimated_url_count
+        self.estimated_url_range = list(estimated_url_range) if estimated_url_range is not None else None
+
+
+def capabilities_to_dict(capabilities: Dict[str, Any]) -> Dict[str, Any]:
+    """Konversi dict capability -> record menjadi dict biasa"""
+    return {
+        key: value.to_dict() if isinstance(value, _Record) else value
+        for key, value in capabilities.items()
+    }
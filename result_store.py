@@ -0,0 +1,516 @@
+"""
+Result Store Module
+Penyimpanan hasil perbandingan berbasis SQLite (embedded) dengan riwayat antar run
+"""
+
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from result_models import ScrapeResult, DomStats, CapabilityVerdict
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    meta TEXT,
+    sampling TEXT
+);
+
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    site TEXT NOT NULL,
+    url TEXT NOT NULL,
+    scraped_at TEXT NOT NULL,
+    screenshot_path TEXT,
+    error TEXT,
+    websocket_detected INTEGER NOT NULL DEFAULT 0,
+    html_length INTEGER,
+    dom_stats TEXT,
+    performance TEXT,
+    update_rate TEXT,
+    websocket_stats TEXT,
+    element_screenshots TEXT
+);
+
+CREATE TABLE IF NOT EXISTS libraries (
+    page_id INTEGER NOT NULL REFERENCES pages(id) ON DELETE CASCADE,
+    library TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS verdicts (
+    page_id INTEGER NOT NULL REFERENCES pages(id) ON DELETE CASCADE,
+    run_id INTEGER NOT NULL,
+    site TEXT NOT NULL,
+    url TEXT NOT NULL,
+    capability TEXT NOT NULL,
+    supported INTEGER NOT NULL,
+    confidence TEXT NOT NULL,
+    evidence TEXT,
+    indicators TEXT,
+    recorded_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS url_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_pages_run_site ON pages(run_id, site);
+CREATE INDEX IF NOT EXISTS idx_pages_site ON pages(site);
+CREATE INDEX IF NOT EXISTS idx_pages_url ON pages(url);
+CREATE INDEX IF NOT EXISTS idx_pages_scraped_at ON pages(scraped_at);
+CREATE INDEX IF NOT EXISTS idx_libraries_page ON libraries(page_id);
+CREATE INDEX IF NOT EXISTS idx_libraries_library ON libraries(library);
+CREATE INDEX IF NOT EXISTS idx_verdicts_page ON verdicts(page_id);
+CREATE INDEX IF NOT EXISTS idx_verdicts_site_capability ON verdicts(site, capability, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_verdicts_url_capability ON verdicts(url, capability);
+CREATE INDEX IF NOT EXISTS idx_verdicts_run ON verdicts(run_id, site);
+CREATE INDEX IF NOT EXISTS idx_verdicts_recorded_at ON verdicts(recorded_at);
+"""
+
+# Kolom JSON di tabel pages untuk field ScrapeResult opsional (None disimpan sebagai NULL).
+# Database lama tanpa kolom ini dimigrasi dengan ALTER TABLE saat store dibuka.
+PAGE_JSON_FIELDS = ('performance', 'update_rate', 'websocket_stats', 'element_screenshots')
+
+
+class ResultStore:
+    """
+    Store SQLite untuk metadata scraping, statistik DOM, library dan verdict capability
+
+    Setiap thread memakai koneksi sendiri dan database berjalan dalam mode WAL,
+    sehingga beberapa scraper paralel (thread maupun proses) bisa menulis bersamaan.
+    """
+
+    def __init__(self, db_path: str = "results.db", busy_timeout: float = 30.0):
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        """Tambahkan kolom pages/runs yang belum ada di database versi lama"""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(pages)")}
+        for field in PAGE_JSON_FIELDS:
+            if field not in columns:
+                conn.execute(f"ALTER TABLE pages ADD COLUMN {field} TEXT")
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(runs)")}
+        if 'sampling' not in columns:
+            conn.execute("ALTER TABLE runs ADD COLUMN sampling TEXT")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Koneksi per thread (sqlite3.Connection tidak aman dibagi antar thread)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout,
+                isolation_level=None  # Transaksi dikelola manual
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Transaksi tulis (BEGIN IMMEDIATE, retry jika database sedang dikunci)"""
+        conn = self._connection()
+        deadline = time.monotonic() + self.busy_timeout
+        while True:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                break
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    def close(self):
+        """Tutup koneksi thread saat ini"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    def start_run(self, label: str = None, meta: Dict[str, Any] = None) -> int:
+        """Catat run baru dan kembalikan run_id"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO runs (label, started_at, meta) VALUES (?, ?, ?)",
+                (label, datetime.now().isoformat(), json.dumps(meta or {}))
+            )
+            return cursor.lastrowid
+
+    def save_sampling(self, run_id: int, sampling: Dict[str, Dict[str, Any]]):
+        """Simpan rencana sampling run (site -> SamplingPlan.to_dict()) untuk estimasi cakupan"""
+        with self._transaction() as conn:
+            conn.execute("UPDATE runs SET sampling = ? WHERE id = ?", (json.dumps(sampling), run_id))
+
+    def finish_run(self, run_id: int):
+        """Tandai run selesai"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE runs SET finished_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), run_id)
+            )
+
+    def save_site_results(
+        self,
+        run_id: int,
+        site: str,
+        scrape_results: List[ScrapeResult],
+        analyses: List[Dict[str, CapabilityVerdict]] = None,
+        replace: bool = False
+    ) -> List[int]:
+        """
+        Simpan hasil scraping (dan verdict per URL) satu website secara bulk
+
+        Args:
+            replace: Hapus dulu data website ini pada run yang sama (idempotent,
+                dipakai saat job dilanjutkan dari checkpoint)
+
+        Returns:
+            List page_id sesuai urutan scrape_results
+        """
+        recorded_at = datetime.now().isoformat()
+        page_ids = []
+
+        with self._transaction() as conn:
+            if replace:
+                conn.execute("DELETE FROM pages WHERE run_id = ? AND site = ?", (run_id, site))
+            for result in scrape_results:
+                dom = result.get('dom_elements')
+                html = result.get('html')
+                cursor = conn.execute(
+                    "INSERT INTO pages (run_id, site, url, scraped_at, screenshot_path, error, "
+                    f"websocket_detected, html_length, dom_stats, {', '.join(PAGE_JSON_FIELDS)}) "
+                    f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?{', ?' * len(PAGE_JSON_FIELDS)})",
+                    (
+                        run_id, site, result.get('url'), recorded_at,
+                        result.get('screenshot_path'), result.get('error'),
+                        int(bool(result.get('websocket_detected', False))),
+                        len(html) if html is not None else None,
+                        json.dumps(dom.to_dict() if hasattr(dom, 'to_dict') else (dom or {}))
+                    ) + tuple(
+                        json.dumps(result.get(field)) if result.get(field) is not None else None
+                        for field in PAGE_JSON_FIELDS
+                    )
+                )
+                page_ids.append(cursor.lastrowid)
+
+            conn.executemany(
+                "INSERT INTO libraries (page_id, library) VALUES (?, ?)",
+                [
+                    (page_id, library)
+                    for page_id, result in zip(page_ids, scrape_results)
+                    for library in result.get('javascript_libraries', [])
+                ]
+            )
+
+            if analyses is not None:
+                conn.executemany(
+                    "INSERT INTO verdicts (page_id, run_id, site, url, capability, supported, "
+                    "confidence, evidence, indicators, recorded_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            page_id, run_id, site, result.get('url'), capability,
+                            int(verdict.supported), verdict.confidence,
+                            json.dumps(verdict.evidence), json.dumps(verdict.indicators),
+                            recorded_at
+                        )
+                        for page_id, result, analysis in zip(page_ids, scrape_results, analyses)
+                        for capability, verdict in analysis.items()
+                    ]
+                )
+
+        return page_ids
+
+    def save_validators(self, validators: Dict[str, Dict[str, Optional[str]]]):
+        """Simpan validator HTTP (ETag, Last-Modified, hash konten) per URL untuk mode incremental"""
+        checked_at = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO url_validators (url, etag, last_modified, content_hash, checked_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (url, v.get('etag'), v.get('last_modified'), v.get('content_hash'), checked_at)
+                    for url, v in validators.items()
+                ]
+            )
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    def get_validators(self, url: str) -> Optional[Dict[str, Optional[str]]]:
+        """Validator HTTP terakhir untuk satu URL"""
+        row = self._connection().execute(
+            "SELECT etag, last_modified, content_hash FROM url_validators WHERE url = ?", (url,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def load_latest_page(self, url: str, site: str) -> Optional[Tuple[ScrapeResult, Dict[str, CapabilityVerdict]]]:
+        """
+        Hasil scraping sukses terakhir untuk satu URL beserta verdict-nya
+
+        Returns:
+            (ScrapeResult tanpa HTML, dict capability -> CapabilityVerdict) atau None
+        """
+        conn = self._connection()
+        page = conn.execute(
+            "SELECT * FROM pages WHERE url = ? AND site = ? AND error IS NULL "
+            "AND EXISTS (SELECT 1 FROM verdicts v WHERE v.page_id = pages.id) "
+            "ORDER BY id DESC LIMIT 1",
+            (url, site)
+        ).fetchone()
+        if page is None:
+            return None
+
+        libraries = [
+            row['library'] for row in conn.execute(
+                "SELECT library FROM libraries WHERE page_id = ? ORDER BY rowid", (page['id'],)
+            )
+        ]
+        result = ScrapeResult(
+            url=page['url'],
+            website_name=site,
+            screenshot_path=page['screenshot_path'],
+            dom_elements=DomStats.from_dict(json.loads(page['dom_stats'] or '{}')),
+            javascript_libraries=libraries,
+            websocket_detected=bool(page['websocket_detected']),
+            **self._page_json_fields(page)
+        )
+        rows = conn.execute(
+            "SELECT v.*, p.screenshot_path, p.element_screenshots FROM verdicts v JOIN pages p ON p.id = v.page_id "
+            "WHERE v.page_id = ?", (page['id'],)
+        )
+        verdicts = {row['capability']: self._row_to_verdict(row) for row in rows}
+        return result, verdicts
+
+    def get_run(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Metadata satu run"""
+        row = self._connection().execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+        run = dict(row)
+        run['meta'] = json.loads(run['meta'] or '{}')
+        run['sampling'] = json.loads(run['sampling']) if run['sampling'] else None
+        return run
+
+    def list_runs(self, label: str = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Daftar run terbaru (optional difilter berdasarkan label)"""
+        query = "SELECT id, label, started_at, finished_at FROM runs"
+        params: Tuple = ()
+        if label is not None:
+            query += " WHERE label = ?"
+            params = (label,)
+        query += " ORDER BY id DESC LIMIT ?"
+        rows = self._connection().execute(query, params + (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def latest_run_id(self, label: str = None, finished_only: bool = True) -> Optional[int]:
+        """run_id terbaru"""
+        query = "SELECT id FROM runs WHERE 1 = 1"
+        params: List[Any] = []
+        if label is not None:
+            query += " AND label = ?"
+            params.append(label)
+        if finished_only:
+            query += " AND finished_at IS NOT NULL"
+        row = self._connection().execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return row['id'] if row else None
+
+    def load_scrape_results(self, run_id: int, site: str) -> List[ScrapeResult]:
+        """
+        Rekonstruksi ScrapeResult dari store (tanpa HTML, yang memang tidak disimpan)
+        """
+        conn = self._connection()
+        pages = conn.execute(
+            "SELECT * FROM pages WHERE run_id = ? AND site = ? ORDER BY id", (run_id, site)
+        ).fetchall()
+
+        libraries: Dict[int, List[str]] = {}
+        for row in conn.execute(
+            "SELECT l.page_id, l.library FROM libraries l JOIN pages p ON p.id = l.page_id "
+            "WHERE p.run_id = ? AND p.site = ? ORDER BY l.rowid", (run_id, site)
+        ):
+            libraries.setdefault(row['page_id'], []).append(row['library'])
+
+        return [
+            ScrapeResult(
+                url=page['url'],
+                website_name=site,
+                screenshot_path=page['screenshot_path'],
+                dom_elements=DomStats.from_dict(json.loads(page['dom_stats'] or '{}')),
+                javascript_libraries=libraries.get(page['id'], []),
+                websocket_detected=bool(page['websocket_detected']),
+                error=page['error'],
+                **self._page_json_fields(page)
+            )
+            for page in pages
+        ]
+
+    def load_verdicts(self, run_id: int, site: str) -> Tuple[Dict[str, List[CapabilityVerdict]], int]:
+        """
+        Verdict per URL untuk satu website pada satu run
+
+        Returns:
+            (dict capability -> list CapabilityVerdict dengan url/screenshot, jumlah URL)
+        """
+        conn = self._connection()
+        total_urls = conn.execute(
+            "SELECT COUNT(*) FROM pages WHERE run_id = ? AND site = ?", (run_id, site)
+        ).fetchone()[0]
+
+        verdicts: Dict[str, List[CapabilityVerdict]] = {}
+        rows = conn.execute(
+            "SELECT v.*, p.screenshot_path, p.element_screenshots FROM verdicts v JOIN pages p ON p.id = v.page_id "
+            "WHERE v.run_id = ? AND v.site = ? ORDER BY v.page_id", (run_id, site)
+        )
+        for row in rows:
+            verdicts.setdefault(row['capability'], []).append(self._row_to_verdict(row))
+
+        return verdicts, total_urls
+
+    def load_url_verdicts(self, url: str, run_id: int = None) -> Dict[str, CapabilityVerdict]:
+        """Verdict terbaru (atau pada run tertentu) untuk satu URL"""
+        conn = self._connection()
+        if run_id is None:
+            row = conn.execute(
+                "SELECT page_id FROM verdicts WHERE url = ? ORDER BY recorded_at DESC, page_id DESC LIMIT 1",
+                (url,)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT page_id FROM verdicts WHERE url = ? AND run_id = ? LIMIT 1", (url, run_id)
+            ).fetchone()
+        if row is None:
+            return {}
+
+        rows = conn.execute(
+            "SELECT v.*, p.screenshot_path, p.element_screenshots FROM verdicts v JOIN pages p ON p.id = v.page_id "
+            "WHERE v.page_id = ?", (row['page_id'],)
+        )
+        return {row['capability']: self._row_to_verdict(row) for row in rows}
+
+    def capability_history(self, site: str, capability: str, limit: int = 30) -> List[Dict[str, Any]]:
+        """
+        Trend satu capability untuk satu website dari run ke run
+
+        Returns:
+            List dict: run_id, started_at, supported_urls, total_urls, best_confidence
+        """
+        rows = self._connection().execute(
+            """
+            SELECT v.run_id, r.started_at,
+                   SUM(v.supported) AS supported_urls,
+                   COUNT(*) AS total_urls,
+                   MAX(CASE WHEN v.supported = 0 THEN 0
+                            WHEN v.confidence = 'tinggi' THEN 3
+                            WHEN v.confidence = 'sedang' THEN 2
+                            ELSE 1 END) AS confidence_rank
+            FROM verdicts v JOIN runs r ON r.id = v.run_id
+            WHERE v.site = ? AND v.capability = ?
+            GROUP BY v.run_id
+            ORDER BY v.run_id DESC
+            LIMIT ?
+            """,
+            (site, capability, limit)
+        ).fetchall()
+
+        rank_names = {0: None, 1: 'rendah', 2: 'sedang', 3: 'tinggi'}
+        return [
+            {
+                'run_id': row['run_id'],
+                'started_at': row['started_at'],
+                'supported_urls': row['supported_urls'],
+                'total_urls': row['total_urls'],
+                'best_confidence': rank_names[row['confidence_rank']]
+            }
+            for row in rows
+        ]
+
+    def diff_runs(self, old_run_id: int, new_run_id: int, site: str) -> List[Dict[str, Any]]:
+        """
+        Verdict per URL/capability yang berubah antara dua run
+
+        Returns:
+            List dict: url, capability, before, after (dict supported/confidence atau None)
+        """
+        def load(run_id):
+            rows = self._connection().execute(
+                "SELECT url, capability, supported, confidence FROM verdicts WHERE run_id = ? AND site = ?",
+                (run_id, site)
+            )
+            return {
+                (row['url'], row['capability']): {
+                    'supported': bool(row['supported']),
+                    'confidence': row['confidence']
+                }
+                for row in rows
+            }
+
+        before = load(old_run_id)
+        after = load(new_run_id)
+
+        changes = []
+        for key in sorted(set(before) | set(after)):
+            if before.get(key) != after.get(key):
+                changes.append({
+                    'url': key[0],
+                    'capability': key[1],
+                    'before': before.get(key),
+                    'after': after.get(key)
+                })
+        return changes
+
+    @staticmethod
+    def _page_json_fields(page: sqlite3.Row) -> Dict[str, Any]:
+        """Field JSON opsional satu baris pages (lihat PAGE_JSON_FIELDS)"""
+        return {field: json.loads(page[field]) if page[field] else None for field in PAGE_JSON_FIELDS}
+
+    @staticmethod
+    def _row_to_verdict(row: sqlite3.Row) -> CapabilityVerdict:
+        # Screenshot elemen capability jika ada, selain itu screenshot halaman
+        element_screenshots = json.loads(row['element_screenshots']) if row['element_screenshots'] else {}
+        return CapabilityVerdict(
+            supported=bool(row['supported']),
+            confidence=row['confidence'],
+            evidence=json.loads(row['evidence'] or '[]'),
+            indicators=json.loads(row['indicators'] or '{}'),
+            url=row['url'],
+            screenshot=element_screenshots.get(row['capability']) or row['screenshot_path']
+        )
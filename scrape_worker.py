@@ -0,0 +1,235 @@
+"""
+Scrape Worker Module
+Mode coordinator/worker: coordinator memasukkan URL ke JobQueue, worker (satu atau
+banyak host) menjalankan WebScraper dan mengirim balik hasil serta screenshot
+"""
+
+from typing import List, Dict, Any, Callable
+import argparse
+import os
+import socket
+import threading
+import time
+import uuid
+
+from job_queue import JobQueue, STATUS_DONE
+from result_models import ScrapeResult
+from web_scraper import WebScraper
+
+
+def _read_file(path: str) -> bytes:
+    """Isi file screenshot; None jika path kosong atau file tidak ada"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class ScrapeWorker:
+    """
+    Worker yang mengambil job dari JobQueue dan menjalankan WebScraper
+
+    Selama satu job berjalan, thread heartbeat memperpanjang lease. Jika worker
+    mati, lease kadaluarsa dan job diambil worker lain.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        scraper: WebScraper,
+        worker_id: str = None,
+        heartbeat_interval: float = None,
+        poll_interval: float = 2.0
+    ):
+        """
+        Args:
+            queue: Antrian job
+            scraper: WebScraper yang dipakai worker ini
+            worker_id: ID worker (default host:pid:acak)
+            heartbeat_interval: Interval heartbeat (default sepertiga lease)
+            poll_interval: Jeda saat antrian kosong (detik)
+        """
+        self.queue = queue
+        self.scraper = scraper
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval or queue.lease_seconds / 3
+        self.poll_interval = poll_interval
+
+    def run_once(self) -> bool:
+        """Kerjakan satu job; False jika antrian kosong"""
+        job = self.queue.lease(self.worker_id)
+        if job is None:
+            return False
+
+        print(f"[INFO] Worker {self.worker_id}: job #{job['id']} {job['url']} (percobaan {job['attempts']})")
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(self.heartbeat_interval):
+                if not self.queue.heartbeat(job['id'], self.worker_id):
+                    print(f"[WARNING] Lease job #{job['id']} hilang")
+                    return
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            result = self.scraper.scrape_url(job['url'], job['site'])
+        except Exception as e:
+            self.queue.fail(job['id'], self.worker_id, str(e))
+            return True
+        finally:
+            stop.set()
+            thread.join()
+
+        screenshot = _read_file(result.screenshot_path)
+        element_screenshots = {}
+        for capability, path in (result.element_screenshots or {}).items():
+            data = _read_file(path)
+            if data is not None:
+                element_screenshots[capability] = data
+        if not self.queue.complete(job['id'], self.worker_id, result, screenshot, element_screenshots):
+            print(f"[WARNING] Hasil job #{job['id']} ditolak (lease sudah diambil worker lain)")
+        return True
+
+    def run(self, max_jobs: int = None, idle_timeout: float = None) -> int:
+        """
+        Loop worker
+
+        Args:
+            max_jobs: Berhenti setelah sejumlah job (default tanpa batas)
+            idle_timeout: Berhenti jika antrian kosong selama sekian detik (default menunggu terus)
+
+        Returns:
+            Jumlah job yang dikerjakan
+        """
+        done = 0
+        idle_since = time.monotonic()
+        print(f"[INFO] Worker {self.worker_id} mulai (queue: {self.queue.db_path})")
+        while max_jobs is None or done < max_jobs:
+            if self.run_once():
+                done += 1
+                idle_since = time.monotonic()
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(self.poll_interval)
+        print(f"[INFO] Worker {self.worker_id} selesai ({done} job)")
+        return done
+
+
+class DistributedScraper:
+    """
+    Pengganti WebScraper di sisi coordinator
+
+    ``scrape_multiple_urls`` memasukkan URL ke antrian lalu menunggu hasil dari
+    worker; screenshot ditulis ke ``screenshot_dir`` lokal. Interface-nya sama
+    dengan WebScraper.scrape_multiple_urls, jadi WebsiteComparator tidak perlu
+    tahu scraping dilakukan di mesin lain.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        screenshot_dir: str = "screenshots",
+        poll_interval: float = 2.0,
+        timeout: float = None
+    ):
+        """
+        Args:
+            queue: Antrian job
+            screenshot_dir: Directory lokal untuk screenshot dari worker
+            poll_interval: Interval pengecekan hasil (detik)
+            timeout: Batas waktu menunggu semua hasil (detik, default tanpa batas)
+        """
+        self.queue = queue
+        self.screenshot_dir = screenshot_dir
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        os.makedirs(screenshot_dir, exist_ok=True)
+
+    def _to_result(self, job: Dict[str, Any], website_name: str) -> ScrapeResult:
+        if job['status'] != STATUS_DONE:
+            if job['result'] is not None:
+                return job['result']
+            return ScrapeResult(url=job['url'], website_name=website_name,
+                                error=job['error'], attempts=job['attempts'])
+
+        result = job['result']
+        # Path di hasil menunjuk ke filesystem worker; screenshot ditulis ulang secara lokal
+        if job['screenshot'] is not None and result.screenshot_path:
+            result.screenshot_path = self._write_screenshot(result.screenshot_path, job['screenshot'])
+        if result.element_screenshots:
+            received = job['element_screenshots']
+            result.element_screenshots = {
+                capability: self._write_screenshot(path, received[capability])
+                for capability, path in result.element_screenshots.items()
+                if capability in received
+            } or None
+        return result
+
+    def _write_screenshot(self, remote_path: str, data: bytes) -> str:
+        local_path = os.path.join(self.screenshot_dir, os.path.basename(remote_path))
+        with open(local_path, 'wb') as f:
+            f.write(data)
+        return local_path
+
+    def scrape_multiple_urls(
+        self,
+        urls: List[str],
+        website_name: str,
+        on_result: Callable[[int, ScrapeResult], None] = None
+    ) -> List[ScrapeResult]:
+        """Masukkan URL ke antrian dan tunggu sampai semua job selesai atau gagal"""
+        results: List[ScrapeResult] = [None] * len(urls)
+        if not urls:
+            return results
+
+        batch = uuid.uuid4().hex
+        self.queue.enqueue(batch, website_name, urls)
+        print(f"[INFO] {len(urls)} job dimasukkan ke antrian {self.queue.db_path} (batch {batch[:8]})")
+
+        seen: List[int] = []
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        while len(seen) < len(urls):
+            for job in self.queue.finished_jobs(batch, website_name, exclude=seen):
+                seen.append(job['id'])
+                result = self._to_result(job, website_name)
+                results[job['url_index']] = result
+                if on_result:
+                    on_result(job['url_index'], result)
+            if len(seen) == len(urls):
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Batch {batch[:8]}: {len(urls) - len(seen)} job belum selesai "
+                    f"({self.queue.batch_status(batch, website_name)})"
+                )
+            self.queue.requeue_expired()
+            time.sleep(self.poll_interval)
+        return results
+
+
+def main(argv: List[str] = None):
+    """Jalankan worker dari command line"""
+    parser = argparse.ArgumentParser(description="Worker scraping untuk JobQueue")
+    parser.add_argument('--queue', required=True, help="Path database antrian (SQLite)")
+    parser.add_argument('--worker-id', help="ID worker (default host:pid)")
+    parser.add_argument('--screenshot-dir', default="screenshots")
+    parser.add_argument('--max-jobs', type=int)
+    parser.add_argument('--idle-timeout', type=float, help="Berhenti jika antrian kosong selama N detik")
+    parser.add_argument('--extraction-mode', choices=['html', 'browser'], default='html')
+    parser.add_argument('--observe-seconds', type=float, default=0.0,
+                        help="Ukur update halaman selama N detik per URL (0 = tidak)")
+    parser.add_argument('--journal-mode', choices=['WAL', 'DELETE'], default='WAL',
+                        help="DELETE untuk database di filesystem bersama (beberapa host)")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.queue, journal_mode=args.journal_mode)
+    scraper = WebScraper(screenshot_dir=args.screenshot_dir, extraction_mode=args.extraction_mode,
+                         observe_seconds=args.observe_seconds)
+    worker = ScrapeWorker(queue, scraper, worker_id=args.worker_id)
+    worker.run(max_jobs=args.max_jobs, idle_timeout=args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
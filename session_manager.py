@@ -0,0 +1,168 @@
+"""
+Session Manager Module
+Login sekali per website, lalu pakai ulang cookies/localStorage di driver berikutnya
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse
+import json
+import os
+import threading
+import time
+
+
+# Field CookieParam yang diterima CDP Network.setCookies
+_COOKIE_PARAM_KEYS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+
+
+def get_origin(url: str) -> str:
+    """scheme://host[:port] dari URL"""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class SessionState:
+    """Cookies dan localStorage hasil login untuk satu origin"""
+
+    __slots__ = ('origin', 'cookies', 'local_storage', 'created_at')
+
+    def __init__(self, origin: str, cookies: List[Dict[str, Any]], local_storage: Dict[str, str]):
+        self.origin = origin
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.created_at = time.time()
+
+    def is_expired(self, max_age: float) -> bool:
+        """Session kadaluarsa jika terlalu lama atau ada cookie yang sudah lewat masa berlakunya"""
+        now = time.time()
+        if now - self.created_at > max_age:
+            return True
+        return any(0 < cookie.get('expires', -1) < now for cookie in self.cookies)
+
+
+class SessionManager:
+    """
+    Pengelola session login per origin
+
+    - Login dilakukan sekali per origin; cookies dan localStorage di-export
+    - Driver baru mendapat session lewat CDP (Network.setCookies dan script
+      localStorage yang dijalankan sebelum script halaman), tanpa navigasi tambahan
+    - Jika form login tetap muncul (session kadaluarsa), login ulang dan export ulang
+
+    Credential dikonfigurasi per host (atau '*' untuk semua host). Tanpa konfigurasi,
+    credential diambil dari environment variable WEBCOMPARE_AUTH_USERNAME /
+    WEBCOMPARE_AUTH_PASSWORD; jika keduanya tidak di-set, login dilewati.
+    """
+
+    def __init__(
+        self,
+        credentials: Dict[str, Tuple[str, str]] = None,
+        auth_url_patterns: Tuple[str, ...] = ('download',),
+        max_age: float = 3600.0
+    ):
+        """
+        Args:
+            credentials: Dict host (atau '*') -> (username, password)
+            auth_url_patterns: Pola URL yang membutuhkan login
+            max_age: Umur maksimum session (detik) sebelum login ulang
+        """
+        if credentials is None:
+            env_credentials = self._credentials_from_env()
+            credentials = {'*': env_credentials} if env_credentials else {}
+        self.credentials = credentials
+        self.auth_url_patterns = tuple(p.lower() for p in auth_url_patterns)
+        self.max_age = max_age
+        self._sessions: Dict[str, SessionState] = {}
+        self._lock = threading.Lock()
+        self._login_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _credentials_from_env() -> Optional[Tuple[str, str]]:
+        """Credential dari environment; None jika username atau password tidak di-set"""
+        username = os.environ.get('WEBCOMPARE_AUTH_USERNAME')
+        password = os.environ.get('WEBCOMPARE_AUTH_PASSWORD')
+        if not username or not password:
+            return None
+        return username, password
+
+    def requires_auth(self, url: str) -> bool:
+        """Apakah URL termasuk halaman yang butuh login"""
+        url = url.lower()
+        return any(pattern in url for pattern in self.auth_url_patterns)
+
+    def credentials_for(self, url: str) -> Optional[Tuple[str, str]]:
+        """Credential untuk host URL (None jika tidak dikonfigurasi)"""
+        host = urlparse(url).netloc
+        return self.credentials.get(host) or self.credentials.get('*')
+
+    def login_lock(self, url: str) -> threading.Lock:
+        """Lock per origin supaya worker paralel tidak login bersamaan ke website yang sama"""
+        origin = get_origin(url)
+        with self._lock:
+            return self._login_locks.setdefault(origin, threading.Lock())
+
+    def get_session(self, url: str) -> Optional[SessionState]:
+        """Session valid untuk origin URL (session kadaluarsa dibuang)"""
+        origin = get_origin(url)
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is not None and session.is_expired(self.max_age):
+                print(f"[INFO] Session {origin} kadaluarsa")
+                del self._sessions[origin]
+                session = None
+            return session
+
+    def invalidate(self, url: str):
+        """Buang session origin URL (misalnya karena form login muncul lagi)"""
+        with self._lock:
+            self._sessions.pop(get_origin(url), None)
+
+    def apply(self, driver, url: str) -> bool:
+        """
+        Injeksi session yang tersimpan ke driver sebelum driver.get(url)
+
+        Returns:
+            True jika session diinjeksi
+        """
+        session = self.get_session(url)
+        if session is None:
+            return False
+        try:
+            cookies = [
+                {key: cookie[key] for key in _COOKIE_PARAM_KEYS if key in cookie}
+                for cookie in session.cookies
+            ]
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': cookies})
+            if session.local_storage:
+                script = (
+                    "(function(){if (location.origin !== %s) return;"
+                    "var items = %s;"
+                    "for (var k in items) { try { localStorage.setItem(k, items[k]); } catch (e) {} }"
+                    "})();" % (json.dumps(session.origin), json.dumps(session.local_storage))
+                )
+                driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+            print(f"[INFO] Session {session.origin} dipakai ulang")
+            return True
+        except Exception as e:
+            print(f"[INFO] Gagal injeksi session: {e}")
+            return False
+
+    def capture(self, driver, url: str):
+        """Export cookies dan localStorage dari driver yang sudah login"""
+        origin = get_origin(url)
+        try:
+            cookies = driver.execute_cdp_cmd('Network.getCookies', {'urls': [origin]}).get('cookies', [])
+        except Exception:
+            cookies = driver.get_cookies()
+            for cookie in cookies:
+                if 'expiry' in cookie:
+                    cookie['expires'] = cookie.pop('expiry')
+        try:
+            local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        except Exception:
+            local_storage = {}
+
+        with self._lock:
+            self._sessions[origin] = SessionState(origin, cookies, local_storage)
+        print(f"[INFO] Session {origin} disimpan ({len(cookies)} cookies, {len(local_storage)} localStorage)")
@@ -56,7 +56,8 @@ def test_dependencies():
         ('beautifulsoup4', 'bs4'),
         ('reportlab', 'reportlab'),
         ('Pillow', 'PIL'),
-        ('requests', 'requests')
+        ('requests', 'requests'),
+        ('pypdf', 'pypdf')
     ]
     
     all_ok = True
@@ -246,31 +247,1902 @@ def test_pdf_generator():
                 'urls_with_evidence': []
             }
         
+        mock_performance = {
+            'website_a': {'pages': 1, 'metrics': {'load_ms': {'p50': 1800, 'p75': 1900, 'p95': 2100}}},
+            'website_b': {'pages': 1, 'metrics': {'load_ms': {'p50': 950, 'p75': 990, 'p95': 1200}}}
+        }
+        
         print("Generating test PDF...")
         test_pdf = "test_output/test_report.pdf"
         os.makedirs("test_output", exist_ok=True)
         
-        generator.generate_report(
-            website_a_name="Test Website A",
-            website_b_name="Test Website B",
-            website_a_capabilities=mock_cap_a,
-            website_b_capabilities=mock_cap_b,
-            output_path=test_pdf
+        generator.generate_report(
+            website_a_name="Test Website A",
+            website_b_name="Test Website B",
+            website_a_capabilities=mock_cap_a,
+            website_b_capabilities=mock_cap_b,
+            output_path=test_pdf,
+            performance=mock_performance
+        )
+        
+        if os.path.exists(test_pdf):
+            file_size = os.path.getsize(test_pdf)
+            print(f"✓ PDF created: {test_pdf} ({file_size} bytes)")
+            print("\n✓ PDF generator working correctly!")
+            return True
+        else:
+            print("✗ PDF not created")
+            return False
+        
+    except Exception as e:
+        print(f"\n✗ PDF generator test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_result_models():
+    """Test record hasil scraping dan agregasi"""
+    print("\n" + "="*70)
+    print("TEST 6: Result Models")
+    print("="*70)
+    
+    try:
+        from result_models import ScrapeResult, DomStats, AggregatedCapability
+        from capability_analyzer import CapabilityAnalyzer
+        
+        result = ScrapeResult(
+            url='https://test.com',
+            website_name='Test',
+            html='<html><body><canvas></canvas></body></html>',
+            dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js']
+        )
+        
+        # Record harus tetap bisa dibaca seperti dict lama
+        if 'error' in result or result['dom_elements'].get('canvas_count') != 1:
+            print("✗ Dict-style access broken")
+            return False
+        print("✓ Dict-style access works")
+        
+        if ScrapeResult.from_dict(result.to_dict()) != result:
+            print("✗ to_dict/from_dict roundtrip failed")
+            return False
+        print("✓ to_dict/from_dict roundtrip works")
+        
+        failed = ScrapeResult(url='https://down.test', website_name='Test', error='timeout')
+        aggregated = CapabilityAnalyzer().aggregate_website_capabilities([result, failed])
+        chart = aggregated['output_grafik_chart']
+        
+        if not isinstance(chart, AggregatedCapability) or chart.url_count != 1 \
+                or chart.total_urls_analyzed != 2:
+            print("✗ Aggregation result incorrect")
+            return False
+        if chart.to_dict()['urls_with_evidence'][0]['url'] != 'https://test.com':
+            print("✗ Aggregated to_dict() incorrect")
+            return False
+        print("✓ Aggregation over records works")
+        
+        print("\n✓ Result models working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Result models test failed: {e}")
+        return False
+
+
+def test_result_store():
+    """Test penyimpanan hasil di SQLite"""
+    print("\n" + "="*70)
+    print("TEST 7: Result Store")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import threading
+        from result_models import ScrapeResult, DomStats
+        from result_store import ResultStore
+        from capability_analyzer import CapabilityAnalyzer
+        
+        analyzer = CapabilityAnalyzer()
+        store = ResultStore(os.path.join(tempfile.mkdtemp(), "results.db"))
+        
+        def make_results(canvas_count):
+            return [ScrapeResult(
+                url=f'https://test.com/page{i}',
+                website_name='Test',
+                dom_elements=DomStats(canvas_count=canvas_count),
+                javascript_libraries=['Chart.js'] if canvas_count else []
+            ) for i in range(3)]
+        
+        run_ids = []
+        for canvas_count in (1, 0):
+            run_id = store.start_run(label='Test')
+            results = make_results(canvas_count)
+            store.save_site_results(run_id, 'Test', results, analyzer.analyze_pages(results))
+            store.finish_run(run_id)
+            run_ids.append(run_id)
+        
+        # Penulis paralel dari beberapa thread
+        def writer():
+            results = make_results(1)
+            store.save_site_results(run_ids[0], 'Parallel', results, analyzer.analyze_pages(results))
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        verdicts, total = store.load_verdicts(run_ids[0], 'Parallel')
+        if total != 12 or len(verdicts['output_grafik_chart']) != 12:
+            print("✗ Concurrent writes lost data")
+            return False
+        print("✓ Concurrent writes stored")
+        
+        verdicts, total = store.load_verdicts(run_ids[0], 'Test')
+        aggregated = analyzer.aggregate_verdicts(verdicts, total)
+        if aggregated['output_grafik_chart'].url_count != 3:
+            print("✗ Aggregation from store incorrect")
+            return False
+        print("✓ Aggregation from stored verdicts works")
+        
+        history = store.capability_history('Test', 'output_grafik_chart')
+        diff = store.diff_runs(run_ids[0], run_ids[1], 'Test')
+        if [h['supported_urls'] for h in history] != [0, 3] or len(diff) != 3:
+            print("✗ History/diff incorrect")
+            return False
+        print("✓ History and diff queries work")
+        
+        # Screenshot elemen per capability tersimpan dan dipakai sebagai bukti verdict
+        run_id = store.start_run(label='Screenshots')
+        results = [ScrapeResult(
+            url='https://test.com/chart',
+            website_name='Shots',
+            dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js'],
+            screenshot_path='page.png',
+            element_screenshots={'output_grafik_chart': 'chart.png'}
+        )]
+        store.save_site_results(run_id, 'Shots', results, analyzer.analyze_pages(results))
+        store.finish_run(run_id)
+        loaded = store.load_scrape_results(run_id, 'Shots')[0]
+        _, latest_verdicts = store.load_latest_page('https://test.com/chart', 'Shots')
+        verdicts, _ = store.load_verdicts(run_id, 'Shots')
+        url_verdicts = store.load_url_verdicts('https://test.com/chart', run_id)
+        screenshots = [
+            latest_verdicts['output_grafik_chart'].screenshot,
+            verdicts['output_grafik_chart'][0].screenshot,
+            url_verdicts['output_grafik_chart'].screenshot,
+        ]
+        if loaded.element_screenshots != {'output_grafik_chart': 'chart.png'} or screenshots != ['chart.png'] * 3:
+            print("✗ Element screenshots not restored")
+            return False
+        if url_verdicts['output_data_tabel'].screenshot != 'page.png':
+            print("✗ Page screenshot fallback missing")
+            return False
+        print("✓ Element screenshots persisted")
+        
+        print("\n✓ Result store working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Result store test failed: {e}")
+        return False
+
+
+def test_resource_governor():
+    """Test watchdog RSS dan slot worker"""
+    print("\n" + "="*70)
+    print("TEST 8: Resource Governor")
+    print("="*70)
+    
+    try:
+        import subprocess
+        import time
+        from types import SimpleNamespace
+        from resource_governor import ResourceGovernor
+        from failure_policy import ResourceLimitError, classify_error, ERROR_MEMORY
+        
+        # Proses palsu "browser": shell dengan satu proses anak
+        process = subprocess.Popen(['sh', '-c', 'sleep 30 & wait'])
+        fake_driver = SimpleNamespace(service=SimpleNamespace(process=process))
+        governor = ResourceGovernor(driver_rss_budget_mb=0.001, monitor_interval=0.1)
+        
+        try:
+            with governor.watch(fake_driver):
+                time.sleep(1)
+                raise RuntimeError("chrome not reachable")
+        except ResourceLimitError as e:
+            if classify_error(e) != ERROR_MEMORY:
+                print("✗ ResourceLimitError not classified as memory")
+                return False
+            print("✓ Browser over budget stopped and reported")
+        else:
+            print("✗ Budget violation not detected")
+            return False
+        finally:
+            process.kill()
+            process.wait()
+        
+        if governor.stats()['recycled_drivers'] != 1:
+            print("✗ Recycled driver count incorrect")
+            return False
+        
+        governor = ResourceGovernor(max_workers=2, memory_per_driver_mb=1, memory_reserve_mb=0)
+        with governor.slot():
+            with governor.slot():
+                if governor.stats()['active_workers'] != 2:
+                    print("✗ Worker slots incorrect")
+                    return False
+        print("✓ Worker slots work")
+        
+        print("\n✓ Resource governor working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Resource governor test failed: {e}")
+        return False
+
+
+def test_job_queue():
+    """Test antrian job: lease, heartbeat, requeue dan hasil"""
+    print("\n" + "="*70)
+    print("TEST 9: Job Queue")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import time
+        from job_queue import JobQueue
+        from result_models import ScrapeResult
+        
+        queue = JobQueue(os.path.join(tempfile.mkdtemp(), "jobs.db"), lease_seconds=0.5, max_attempts=2)
+        queue.enqueue('batch', 'Test', ['https://test.com/a', 'https://test.com/b'])
+        
+        # Worker yang mati: lease kadaluarsa lalu job diambil worker lain
+        dead = queue.lease('dead')
+        time.sleep(0.6)
+        job = queue.lease('alive')
+        if job['id'] != dead['id'] or job['attempts'] != 2:
+            print("✗ Expired lease not requeued")
+            return False
+        if not queue.heartbeat(job['id'], 'alive') or queue.heartbeat(job['id'], 'dead'):
+            print("✗ Heartbeat ownership incorrect")
+            return False
+        print("✓ Expired lease requeued, heartbeat extends lease")
+        
+        result = ScrapeResult(url=job['url'], website_name='Test', screenshot_path='/worker/a.png',
+                              element_screenshots={'output_grafik_chart': '/worker/a_chart.png'})
+        if queue.complete(job['id'], 'dead', result) \
+                or not queue.complete(job['id'], 'alive', result, b'PNG', {'output_grafik_chart': b'CHART'}):
+            print("✗ Result ownership incorrect")
+            return False
+        
+        other = queue.lease('alive')
+        queue.fail(other['id'], 'alive', 'timeout')
+        other = queue.lease('alive')
+        queue.fail(other['id'], 'alive', 'timeout')
+        
+        jobs = queue.finished_jobs('batch', 'Test')
+        if [j['status'] for j in jobs] != ['done', 'failed'] or jobs[0]['screenshot'] != b'PNG' \
+                or jobs[0]['result'] != result or jobs[0]['element_screenshots'] != {'output_grafik_chart': b'CHART'}:
+            print("✗ Finished jobs incorrect")
+            return False
+        if [j['id'] for j in queue.finished_jobs('batch', 'Test', exclude=[jobs[0]['id']])] != [jobs[1]['id']]:
+            print("✗ Seen jobs not excluded")
+            return False
+        print("✓ Results and failures reported back")
+        
+        # Coordinator menulis screenshot halaman dan elemen ke directory lokal
+        from scrape_worker import DistributedScraper
+        local_dir = tempfile.mkdtemp()
+        local = DistributedScraper(queue, screenshot_dir=local_dir)._to_result(jobs[0], 'Test')
+        chart_path = local.element_screenshots['output_grafik_chart']
+        if local.screenshot_path != os.path.join(local_dir, 'a.png') or os.path.dirname(chart_path) != local_dir:
+            print("✗ Screenshots not written locally")
+            return False
+        with open(chart_path, 'rb') as f:
+            if f.read() != b'CHART':
+                print("✗ Element screenshot content incorrect")
+                return False
+        print("✓ Element screenshots carried to coordinator")
+        
+        print("\n✓ Job queue working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Job queue test failed: {e}")
+        return False
+
+
+def test_page_clustering():
+    """Test clustering halaman berdasarkan fingerprint struktur DOM"""
+    print("\n" + "="*70)
+    print("TEST 10: Page Clustering")
+    print("="*70)
+    
+    try:
+        from bs4 import BeautifulSoup
+        from capability_analyzer import CapabilityAnalyzer
+        from page_fingerprint import soup_shingles, structure_fingerprint, cluster_fingerprints
+        from result_models import ScrapeResult, DomStats
+        
+        # Halaman dengan template sama (data berbeda) masuk satu cluster struktur
+        pages = [
+            '<body class="station-1"><div class="card"><canvas></canvas></div><table><tr><td>1</td></tr></table></body>',
+            '<body class="station-2"><div class="card"><canvas></canvas></div><table><tr><td>7</td></tr></table></body>',
+            '<body><article class="post"><p>a</p><ul><li>b</li></ul></article></body>'
+        ]
+        fingerprints = [structure_fingerprint(soup_shingles(BeautifulSoup(p, 'html.parser'))) for p in pages]
+        if cluster_fingerprints(fingerprints) != [[0, 1], [2]]:
+            print("✗ Structural clustering incorrect")
+            return False
+        print("✓ Same-template pages clustered")
+        
+        # Statistik cluster disimpan di analyzer (dicetak oleh comparator)
+        analyzer = CapabilityAnalyzer()
+        results = [ScrapeResult(url=f'https://test.com/{i}', website_name='Test', html=html,
+                                dom_elements=DomStats(canvas_count=1, fingerprint=fingerprint))
+                   for i, (html, fingerprint) in enumerate(zip(pages, fingerprints))]
+        analyses = analyzer.analyze_pages(results, cluster=True)
+        if len(analyses) != 3 or analyzer.cluster_stats != {'pages': 3, 'clusters': 2, 'shared': 1}:
+            print("✗ Cluster statistics incorrect")
+            return False
+        print("✓ Cluster statistics recorded")
+        
+        print("\n✓ Page clustering working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Page clustering test failed: {e}")
+        return False
+
+
+def test_early_exit():
+    """Test early exit detektor: verdict sama dengan mode bukti lengkap"""
+    print("\n" + "="*70)
+    print("TEST 11: Detector Early Exit")
+    print("="*70)
+    
+    try:
+        from capability_analyzer import CapabilityAnalyzer
+        
+        mock_data = {
+            'url': 'https://test.com',
+            'html': '<html><body><canvas id="chart"></canvas><table><tr><td>1</td></tr></table></body></html>',
+            'dom_elements': {
+                'canvas_count': 1,
+                'table_count': 1,
+                'tables': [{'rows': 1, 'cols': 1}],
+                'chart_containers': [{'tag': 'canvas', 'width': 400, 'height': 300}]
+            },
+            'javascript_libraries': ['Chart.js'],
+            'network_requests': [],
+            'websocket_detected': False
+        }
+        
+        fast = CapabilityAnalyzer().analyze_all_capabilities(mock_data)
+        full = CapabilityAnalyzer(full_evidence=True).analyze_all_capabilities(mock_data)
+        
+        # Mode cepat dan mode bukti lengkap harus memberi verdict yang sama
+        for cap, verdict in fast.items():
+            if (verdict.supported, verdict.confidence) != (full[cap].supported, full[cap].confidence):
+                print(f"✗ Early exit changed the verdict of '{cap}'")
+                return False
+        print("✓ Early exit keeps every verdict")
+        
+        # Mode bukti lengkap menjalankan semua detektor
+        if len(full['output_grafik_chart'].evidence) <= len(fast['output_grafik_chart'].evidence):
+            print("✗ Full evidence mode incomplete")
+            return False
+        print("✓ Full evidence mode runs all detectors")
+        
+        print("\n✓ Detector early exit working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Detector early exit test failed: {e}")
+        return False
+
+
+def test_update_rate():
+    """Test verdict real-time dari laju update yang terukur"""
+    print("\n" + "="*70)
+    print("TEST 12: Measured Update Rate")
+    print("="*70)
+    
+    try:
+        from capability_analyzer import CapabilityAnalyzer
+        
+        page = {
+            'url': 'https://test.com',
+            'html': '<html><body><div id="value">1</div></body></html>',
+            'dom_elements': {},
+            'javascript_libraries': [],
+            'network_requests': [],
+            'websocket_detected': False
+        }
+        
+        def realtime(data):
+            return CapabilityAnalyzer().analyze_all_capabilities(data)['output_dinamis_realtime'].supported
+        
+        # Update terukur mengalahkan pola kode: WebSocket di HTML tanpa update = bukan real-time
+        static = dict(page, websocket_detected=True,
+                      update_rate={'duration_ms': 10000, 'updates': 0, 'updates_per_second': 0})
+        live = dict(page, update_rate={'duration_ms': 10000, 'updates': 20, 'updates_per_second': 2.0})
+        if realtime(static) or not realtime(live):
+            print("✗ Measured update rate not used for real-time verdict")
+            return False
+        print("✓ Measured update rate decides real-time verdict")
+        
+        # Satu perubahan dalam jendela observasi belum cukup
+        single = dict(page, update_rate={'duration_ms': 10000, 'updates': 1, 'updates_per_second': 0.1})
+        if realtime(single):
+            print("✗ Single update counted as real-time")
+            return False
+        print("✓ Single update below threshold")
+        
+        print("\n✓ Measured update rate working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Measured update rate test failed: {e}")
+        return False
+
+
+def test_websocket_monitor():
+    """Test statistik frame WebSocket dari performance log CDP"""
+    print("\n" + "="*70)
+    print("TEST 13: WebSocket Monitor")
+    print("="*70)
+    
+    try:
+        import json
+        from capability_analyzer import CapabilityAnalyzer
+        from websocket_monitor import WebSocketMonitor
+        
+        class FakeDriver:
+            """Driver tiruan: get_log mengembalikan lalu mengosongkan event"""
+            def __init__(self, events):
+                self.events = events
+            
+            def get_log(self, log_type):
+                entries, self.events = self.events, []
+                return [{'message': json.dumps({'message': {'method': m, 'params': p}})} for m, p in entries]
+        
+        # Koneksi dibuka sebelum jendela observasi, frame dihitung di dalam jendela
+        monitor = WebSocketMonitor(max_samples=2)
+        monitor.drain(FakeDriver([('Network.webSocketCreated', {'requestId': '1', 'url': 'wss://test.com/live'}),
+                                  ('Network.requestWillBeSent', {'requestId': '2'})]), in_window=False)
+        frames = [('Network.webSocketFrameReceived', {'requestId': '1', 'response': {'opcode': 1, 'payloadData': 'x' * n}})
+                  for n in (10, 20, 30)]
+        monitor.drain(FakeDriver(frames), in_window=True)
+        stats = monitor.summary(2.0)
+        if stats['connections'] != 1 or stats['messages_per_second'] != 1.5 or len(stats['samples']) != 2 \
+                or stats['payload_bytes']['p50'] != 20 or stats['samples'][-1]['url'] != 'wss://test.com/live':
+            print("✗ WebSocket frame statistics incorrect")
+            return False
+        print("✓ WebSocket frames measured via CDP")
+        
+        # Frame terukur = real-time walaupun DOM tidak berubah; koneksi tanpa frame bukan real-time
+        page = {
+            'url': 'https://test.com',
+            'html': '<html><body></body></html>',
+            'dom_elements': {},
+            'javascript_libraries': [],
+            'network_requests': [],
+            'websocket_detected': False,
+            'update_rate': {'duration_ms': 2000, 'updates': 0, 'updates_per_second': 0}
+        }
+        idle = dict(stats, frames_received=0, messages_per_second=0)
+        analyzer = CapabilityAnalyzer()
+        live = analyzer.analyze_all_capabilities(dict(page, websocket_stats=stats))
+        quiet = analyzer.analyze_all_capabilities(dict(page, websocket_stats=idle))
+        if not live['output_dinamis_realtime'].supported or quiet['output_dinamis_realtime'].supported:
+            print("✗ WebSocket frames not used for real-time verdict")
+            return False
+        print("✓ WebSocket frames decide real-time verdict")
+        
+        print("\n✓ WebSocket monitor working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ WebSocket monitor test failed: {e}")
+        return False
+
+
+def test_element_screenshots():
+    """Test screenshot elemen sebagai bukti capability"""
+    print("\n" + "="*70)
+    print("TEST 14: Element Screenshots")
+    print("="*70)
+    
+    try:
+        from result_models import ScrapeResult, DomStats
+        from capability_analyzer import CapabilityAnalyzer
+        
+        result = ScrapeResult(
+            url='https://test.com',
+            website_name='Test',
+            html='<html><body><canvas></canvas></body></html>',
+            dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js'],
+            screenshot_path='page.png',
+            element_screenshots={'output_grafik_chart': 'chart.png'}
+        )
+        
+        # Screenshot elemen dipakai sebagai bukti capability-nya
+        aggregated = CapabilityAnalyzer().aggregate_website_capabilities([result])
+        if aggregated['output_grafik_chart'].urls_with_evidence[0].screenshot != 'chart.png':
+            print("✗ Element screenshot not used as evidence")
+            return False
+        print("✓ Element screenshot used as evidence")
+        
+        if ScrapeResult.from_dict(result.to_dict()) != result:
+            print("✗ Element screenshots lost in roundtrip")
+            return False
+        
+        # Capability tanpa screenshot elemen memakai screenshot halaman
+        result.element_screenshots = None
+        aggregated = CapabilityAnalyzer().aggregate_website_capabilities([result])
+        if aggregated['output_grafik_chart'].urls_with_evidence[0].screenshot != 'page.png':
+            print("✗ Page screenshot fallback missing")
+            return False
+        print("✓ Page screenshot used as fallback")
+        
+        print("\n✓ Element screenshots working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Element screenshots test failed: {e}")
+        return False
+
+
+def test_url_sampling():
+    """Test sampling berstrata per template URL dan interval Wilson"""
+    print("\n" + "="*70)
+    print("TEST 15: URL Sampling")
+    print("="*70)
+    
+    try:
+        from url_sampler import path_template, plan_sample, wilson_interval
+        from result_models import ScrapeResult, DomStats
+        from capability_analyzer import CapabilityAnalyzer
+        
+        # Angka dan ID di path menjadi placeholder template
+        if path_template('https://X.app/jakarta/station12?b=1&a=2') != 'x.app/jakarta/station{n}?a&b' \
+                or path_template('https://x.app/items/5f3a9c2e11') != 'x.app/items/{id}':
+            print("✗ Path template incorrect")
+            return False
+        print("✓ Path templates group similar URLs")
+        
+        # Interval Wilson tetap masuk akal untuk proporsi 0 dan sampel kosong
+        low, high = wilson_interval(0, 10)
+        if low != 0.0 or round(high, 4) != 0.2775 or wilson_interval(0, 0) != (0.0, 1.0):
+            print("✗ Wilson interval incorrect")
+            return False
+        print("✓ Wilson interval correct")
+        
+        # Sampling berstrata: angka sampel tetap dan deterministik, estimasi untuk seluruh URL
+        urls = [f'https://test.com/station{i}' for i in range(50)] + ['https://test.com/about']
+        plan = plan_sample(urls, per_group=3)
+        if plan.urls != plan_sample(urls, per_group=3).urls:
+            print("✗ Sampling plan not deterministic")
+            return False
+        sampled = [ScrapeResult(url=url, website_name='Test', dom_elements=DomStats(canvas_count=1))
+                   for url in plan.urls]
+        chart = CapabilityAnalyzer().aggregate_website_capabilities(sampled, sampling=plan)['output_grafik_chart']
+        low, high = chart.estimated_url_range
+        if len(plan.urls) != 4 or chart.url_count != 4 or chart.total_urls != 51 \
+                or chart.estimated_url_count != 51 or not low < 51 <= high:
+            print("✗ Sampling estimate incorrect")
+            return False
+        print("✓ Stratified sampling estimate works")
+        
+        # Rencana sampling tersimpan per run; laporan ulang tetap berisi estimasi cakupan
+        import json
+        import sqlite3
+        import tempfile
+        from website_comparator import WebsiteComparator
+        
+        work_dir = tempfile.mkdtemp()
+        db_path = os.path.join(work_dir, 'results.db')
+        legacy = sqlite3.connect(db_path)
+        legacy.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT, "
+                       "started_at TEXT NOT NULL, finished_at TEXT, meta TEXT)")
+        legacy.close()
+        comparator = WebsiteComparator(screenshot_dir=work_dir, output_dir=work_dir, store_path=db_path)
+        store = comparator.store
+        run_id = store.start_run(label='A vs B', meta={'website_a_name': 'A', 'website_b_name': 'B'})
+        store.save_sampling(run_id, {'A': plan.to_dict(), 'B': plan.to_dict()})
+        for name in ('A', 'B'):
+            store.save_site_results(run_id, name, sampled, comparator.analyzer.analyze_pages(sampled))
+        store.finish_run(run_id)
+        if store.get_run(run_id)['sampling']['A']['strata'] != plan.strata:
+            print("✗ Sampling plan not stored")
+            return False
+        reports = comparator.regenerate_report(run_id, formats=['json'])
+        with open(reports['json'], 'r', encoding='utf-8') as f:
+            regenerated = json.load(f)['capabilities']['output_grafik_chart']['website_a']
+        if regenerated['estimated_url_count'] != chart.estimated_url_count or \
+                regenerated['estimated_url_range'] != chart.estimated_url_range or regenerated['total_urls'] != 51:
+            print("✗ Regenerated report lost coverage estimate")
+            return False
+        print("✓ Regenerated report keeps coverage estimate")
+        
+        print("\n✓ URL sampling working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ URL sampling test failed: {e}")
+        return False
+
+
+def test_url_crawler():
+    """Test discovery URL: normalisasi, seen-set dan filter same-site"""
+    print("\n" + "="*70)
+    print("TEST 16: URL Crawler")
+    print("="*70)
+    
+    try:
+        from url_crawler import normalize_url, BloomFilter, URLCrawler
+        
+        if normalize_url('../b?utm_source=x&z=1&a=2#top', 'HTTPS://Test.com:443/x/y') != 'https://test.com/b?a=2&z=1' \
+                or normalize_url('mailto:a@test.com') is not None:
+            print("✗ URL normalization incorrect")
+            return False
+        print("✓ URL normalization works")
+        
+        # href rusak di halaman tidak boleh menghentikan crawl
+        if normalize_url('http://a.com:abc/x') is not None or normalize_url('http://[::1/x') is not None \
+                or normalize_url('/x', 'http://[::1/') is not None:
+            print("✗ Malformed URL not rejected")
+            return False
+        print("✓ Malformed hrefs rejected")
+        
+        seen = BloomFilter(capacity=1000)
+        urls = [f'https://test.com/station{i}' for i in range(50)]
+        if not all(seen.add(url) for url in urls) or any(seen.add(url) for url in urls):
+            print("✗ Bloom filter seen-set incorrect")
+            return False
+        print("✓ Bloom filter seen-set works")
+        
+        # Halaman palsu (tanpa jaringan): redirect keluar website tidak ikut dihitung
+        site = {
+            'https://test.com/': ('https://test.com/', [
+                'https://test.com/a', 'https://test.com/moved', 'https://test.com/report.pdf',
+                'https://other.com/x', normalize_url('http://test.com:abc/', 'https://test.com/')
+            ]),
+            'https://test.com/a': ('https://test.com/a', ['https://test.com/']),
+            'https://test.com/moved': ('https://other.com/landing', ['https://test.com/hidden']),
+        }
+        
+        def fetch_links(url):
+            return site.get(url, (None, []))
+        
+        crawler = URLCrawler(per_host_delay=0, use_sitemaps=False, respect_robots=False)
+        crawler._fetch_links = fetch_links
+        pages = crawler.crawl(['https://test.com'])
+        if pages != ['https://test.com/', 'https://test.com/a'] or crawler.stats['fetched'] != 3:
+            print(f"✗ Crawl result incorrect: {pages}")
+            return False
+        print("✓ Off-site redirects and non-page links filtered")
+        
+        print("\n✓ URL crawler working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ URL crawler test failed: {e}")
+        return False
+
+
+def test_performance_metrics():
+    """Test persentil performa, penyimpanan di store dan laporan ulang"""
+    print("\n" + "="*70)
+    print("TEST 17: Performance Metrics")
+    print("="*70)
+    
+    try:
+        import json
+        import sqlite3
+        import tempfile
+        from result_models import ScrapeResult
+        from result_store import ResultStore
+        from capability_analyzer import CapabilityAnalyzer
+        from website_comparator import WebsiteComparator
+        
+        analyzer = CapabilityAnalyzer()
+        
+        # Persentil performa per website; halaman gagal dan metrik None dilewati
+        pages = [ScrapeResult(url=f'https://test.com/{i}', website_name='Test',
+                              performance={'load_ms': load, 'largest_contentful_paint_ms': None})
+                 for i, load in enumerate([100, 200, 300, 400, 500])]
+        pages.append(ScrapeResult(url='https://test.com/x', website_name='Test', error='timeout'))
+        summary = analyzer.aggregate_performance(pages)
+        if summary['pages'] != 5 or summary['metrics']['load_ms']['p50'] != 300 \
+                or summary['metrics']['load_ms']['p95'] != 480 or 'largest_contentful_paint_ms' in summary['metrics']:
+            print("✗ Performance percentiles incorrect")
+            return False
+        print("✓ Performance percentiles per site work")
+        
+        # Database lama (tanpa kolom performa) dimigrasi saat store dibuka
+        directory = tempfile.mkdtemp()
+        db_path = os.path.join(directory, "results.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE pages (id INTEGER PRIMARY KEY AUTOINCREMENT, run_id INTEGER NOT NULL, "
+                     "site TEXT NOT NULL, url TEXT NOT NULL, scraped_at TEXT NOT NULL, screenshot_path TEXT, "
+                     "error TEXT, websocket_detected INTEGER NOT NULL DEFAULT 0, html_length INTEGER, dom_stats TEXT)")
+        conn.close()
+        store = ResultStore(db_path)
+        
+        # Performa, laju update dan statistik WebSocket tersimpan dan dibaca kembali
+        pages[0].update_rate = {'duration_ms': 10000, 'updates': 20, 'updates_per_second': 2.0}
+        pages[0].websocket_stats = {'connections': 1, 'frames_received': 4, 'messages_per_second': 0.4}
+        run_id = store.start_run(label='Test', meta={'website_a_name': 'A', 'website_b_name': 'B'})
+        for site in ('A', 'B'):
+            store.save_site_results(run_id, site, pages, analyzer.analyze_pages(pages))
+        store.finish_run(run_id)
+        
+        restored = store.load_scrape_results(run_id, 'A')
+        latest, _ = store.load_latest_page('https://test.com/0', 'A')
+        for result in (restored[0], latest):
+            if (result.performance, result.update_rate, result.websocket_stats) != \
+                    (pages[0].performance, pages[0].update_rate, pages[0].websocket_stats):
+                print("✗ Performance fields not restored from store")
+                return False
+        if restored[-1].performance is not None:
+            print("✗ Missing performance not restored as None")
+            return False
+        print("✓ Performance fields stored and restored")
+        
+        # Laporan ulang dari store tetap berisi perbandingan performa
+        comparator = WebsiteComparator(output_dir=directory, store_path=db_path)
+        reports = comparator.regenerate_report(run_id, formats=('json',))
+        with open(reports['json'], encoding='utf-8') as f:
+            report = json.load(f)
+        if report['website_a']['performance']['metrics']['load_ms']['p50'] != 300:
+            print("✗ Regenerated report has no performance section")
+            return False
+        print("✓ Regenerated report includes performance")
+        
+        print("\n✓ Performance metrics working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Performance metrics test failed: {e}")
+        return False
+
+
+def test_failure_policy():
+    """Test klasifikasi error, circuit breaker dan retry"""
+    print("\n" + "="*70)
+    print("TEST 18: Failure Policy")
+    print("="*70)
+    
+    try:
+        import time
+        from failure_policy import (
+            FailurePolicy, CircuitBreaker, AuthenticationError, classify_error,
+            ERROR_AUTH, ERROR_TIMEOUT, ERROR_UNKNOWN
+        )
+        
+        # 401/403 hanya auth jika berupa status HTTP, bukan angka sembarang di pesan
+        auth = [Exception('HTTP 403 Forbidden'), Exception('401 Unauthorized'), AuthenticationError('Login gagal')]
+        other = [Exception('element 4031 not found at line 401'), Exception('value 403 out of range')]
+        if any(classify_error(e) != ERROR_AUTH for e in auth) \
+                or any(classify_error(e) != ERROR_UNKNOWN for e in other):
+            print("✗ Auth error classification incorrect")
+            return False
+        print("✓ Auth errors classified by HTTP status")
+        
+        # Breaker open setelah 3 kegagalan berturut-turut
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.2)
+        for _ in range(2):
+            breaker.record_failure('test.com')
+        if breaker.is_open('test.com') or not breaker.allow('test.com'):
+            print("✗ Breaker opened before threshold")
+            return False
+        breaker.record_failure('test.com')
+        if not breaker.is_open('test.com') or breaker.allow('test.com') or not breaker.allow('other.com'):
+            print("✗ Breaker not open after threshold")
+            return False
+        print("✓ Breaker opens after 3 failures (per host)")
+        
+        # Setelah reset_timeout: satu percobaan half-open; gagal = open lagi, sukses = closed
+        time.sleep(0.25)
+        if not breaker.allow('test.com') or breaker.allow('test.com'):
+            print("✗ Half-open should allow exactly one trial")
+            return False
+        breaker.record_failure('test.com')
+        if breaker.allow('test.com'):
+            print("✗ Failed half-open trial did not reopen breaker")
+            return False
+        time.sleep(0.25)
+        breaker.allow('test.com')
+        breaker.record_success('test.com')
+        if breaker.is_open('test.com') or not breaker.allow('test.com'):
+            print("✗ Successful half-open trial did not close breaker")
+            return False
+        print("✓ Half-open trial after reset timeout")
+        
+        # Error auth tidak di-retry, timeout di-retry sampai max_attempts
+        policy = FailurePolicy(max_attempts=3)
+        if policy.should_retry(ERROR_AUTH, 1) or not policy.should_retry(ERROR_TIMEOUT, 2) \
+                or policy.should_retry(ERROR_TIMEOUT, 3):
+            print("✗ Retry decision incorrect")
+            return False
+        print("✓ Auth errors not retried")
+        
+        print("\n✓ Failure policy working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Failure policy test failed: {e}")
+        return False
+
+
+def test_checkpoint():
+    """Test checkpoint: resume per URL, invalidasi stage dan skip laporan"""
+    print("\n" + "="*70)
+    print("TEST 19: Checkpoint")
+    print("="*70)
+    
+    try:
+        import tempfile
+        from checkpoint import CheckpointManager
+        from result_models import ScrapeResult, DomStats
+        from website_comparator import WebsiteComparator
+        
+        directory = tempfile.mkdtemp()
+        checkpoint = CheckpointManager(os.path.join(directory, "ckpt"))
+        
+        # URL gagal tidak dikembalikan, jadi di-scrape ulang saat resume
+        checkpoint.save_page('Test', 0, ScrapeResult(url='https://test.com/0', website_name='Test'))
+        checkpoint.save_page('Test', 1, ScrapeResult(url='https://test.com/1', website_name='Test', error='timeout'))
+        if list(checkpoint.load_pages('Test')) != [0]:
+            print("✗ Failed pages returned from checkpoint")
+            return False
+        print("✓ Only successful pages resumed")
+        
+        # Beberapa stage dibatalkan dengan satu kali tulis stages.json
+        checkpoint.mark_complete('analysis:Test', [])
+        checkpoint.mark_complete('report', {'json': 'a.json'})
+        writes = []
+        write_json = CheckpointManager._write_json
+        
+        def counting_write(path, data):
+            writes.append(path)
+            write_json(path, data)
+        
+        CheckpointManager._write_json = staticmethod(counting_write)
+        try:
+            checkpoint.invalidate('analysis:Test', 'report', 'scrape:Other')
+            checkpoint.invalidate('analysis:Test')
+        finally:
+            CheckpointManager._write_json = staticmethod(write_json)
+        if len(writes) != 1 or checkpoint.is_complete('analysis:Test') or checkpoint.is_complete('report'):
+            print("✗ Stage invalidation not batched")
+            return False
+        print("✓ Stage invalidation batched")
+        
+        # Resume lewat comparator: scraper tiruan mencatat URL yang di-scrape
+        class FakeScraper:
+            def __init__(self):
+                self.scraped = []
+            
+            def scrape_multiple_urls(self, urls, website_name, on_result=None):
+                self.scraped.extend(urls)
+                results = [ScrapeResult(url=url, website_name=website_name, dom_elements=DomStats(canvas_count=1))
+                           for url in urls]
+                for position, result in enumerate(results):
+                    if on_result:
+                        on_result(position, result)
+                return results
+        
+        comparator = WebsiteComparator(screenshot_dir=directory, output_dir=directory)
+        comparator.scraper = FakeScraper()
+        job = dict(website_a_urls=['https://a.com/1', 'https://a.com/2'], website_b_urls=['https://b.com/1'],
+                   website_a_name='A', website_b_name='B', formats=['json'],
+                   checkpoint_dir=os.path.join(directory, "job"), output_pdf=os.path.join(directory, "ab.pdf"))
+        report = comparator.compare(**job)['reports']['json']
+        
+        # Job selesai: resume tidak scrape maupun render ulang
+        comparator.scraper.scraped = []
+        os.utime(report, (0, 0))
+        comparator.compare(**job)
+        if comparator.scraper.scraped or os.path.getmtime(report) != 0:
+            print("✗ Completed job scraped or rendered again on resume")
+            return False
+        print("✓ Completed report stage skipped on resume")
+        
+        # Satu halaman hilang: hanya URL itu di-scrape, analisis dan laporan dibuat ulang
+        site_dir = CheckpointManager(job['checkpoint_dir'])._site_dir('A')
+        os.remove(os.path.join(site_dir, '1.json'))
+        comparator.compare(**job)
+        if comparator.scraper.scraped != ['https://a.com/2'] or os.path.getmtime(report) == 0:
+            print("✗ Missing page not resumed or report not rendered again")
+            return False
+        print("✓ Missing page resumed, report rendered again")
+        
+        print("\n✓ Checkpoint working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Checkpoint test failed: {e}")
+        return False
+
+
+def test_change_detector():
+    """Test keputusan berubah/tidak berubah dari ETag dan hash konten"""
+    print("\n" + "="*70)
+    print("TEST 20: Change Detector")
+    print("="*70)
+    
+    try:
+        import threading
+        from http.server import HTTPServer, BaseHTTPRequestHandler
+        from change_detector import ChangeDetector
+        
+        # Server lokal: /etag memakai ETag (304 jika cocok), /plain tanpa validator
+        state = {'etag': '"v1"', 'body': b'<html>v1</html>'}
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, send_body):
+                if self.path == '/etag':
+                    if self.headers.get('If-None-Match') == state['etag']:
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header('ETag', state['etag'])
+                else:
+                    self.send_response(200)
+                self.send_header('Content-Length', str(len(state['body'])))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(state['body'])
+            
+            def do_HEAD(self):
+                self._respond(False)
+            
+            def do_GET(self):
+                self._respond(True)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{server.server_port}"
+        detector = ChangeDetector(timeout=5)
+        
+        try:
+            changed, validators = detector.check(base + '/etag')
+            unchanged, _ = detector.check(base + '/etag', validators)
+            state['etag'] = '"v2"'
+            changed_again, _ = detector.check(base + '/etag', validators)
+            if not changed or validators['etag'] != '"v1"' or unchanged or not changed_again:
+                print("✗ ETag decision incorrect")
+                return False
+            print("✓ ETag / 304 decides unchanged vs changed")
+            
+            changed, validators = detector.check(base + '/plain')
+            unchanged, _ = detector.check(base + '/plain', validators)
+            state['body'] = b'<html>v2</html>'
+            changed_again, _ = detector.check(base + '/plain', validators)
+            if not changed or not validators['content_hash'] or unchanged or not changed_again:
+                print("✗ Content hash decision incorrect")
+                return False
+            print("✓ Content hash used without validators")
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        # Pre-check gagal: URL dianggap berubah (di-scrape ulang)
+        changed, validators = detector.check(base + '/etag', {'etag': '"v2"'})
+        if not changed or any(validators.values()):
+            print("✗ Failed pre-check not treated as changed")
+            return False
+        print("✓ Failed pre-check treated as changed")
+        
+        print("\n✓ Change detector working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Change detector test failed: {e}")
+        return False
+
+
+def test_browser_cache():
+    """Test merge copy-on-write cache Chrome: mtime, index dan batas ukuran"""
+    print("\n" + "="*70)
+    print("TEST 21: Browser Cache")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import time
+        from browser_cache import BrowserCache
+        
+        def write(path, content, mtime):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(content)
+            os.utime(path, (mtime, mtime))
+        
+        def read(path):
+            with open(path) as f:
+                return f.read()
+        
+        now = time.time()
+        cache = BrowserCache(tempfile.mkdtemp(), max_size_mb=1)
+        shared = os.path.join(cache.shared_dir, 'Cache_Data')
+        write(os.path.join(shared, 'f_old'), 'old', now - 100)
+        write(os.path.join(shared, 'f_newer_in_shared'), 'shared', now - 100)
+        write(os.path.join(shared, 'index'), 'index', now - 100)
+        write(os.path.join(shared, 'index-dir', 'the-real-index'), 'index', now - 100)
+        
+        worker_dir = cache.checkout()
+        worker = os.path.join(worker_dir, 'Cache_Data')
+        if read(os.path.join(worker, 'f_old')) != 'old':
+            print("✗ Checkout did not copy shared cache")
+            return False
+        
+        # Worker memperbarui satu entry dan menambah entry baru; worker lain sudah
+        # memasukkan versi yang lebih baru dari entry kedua ke cache bersama
+        write(os.path.join(worker, 'f_old'), 'updated', now - 10)
+        write(os.path.join(worker, 'f_new'), 'new', now - 10)
+        write(os.path.join(worker, 'f_newer_in_shared'), 'stale', now - 50)
+        write(os.path.join(shared, 'f_newer_in_shared'), 'other worker', now - 5)
+        cache.checkin(worker_dir)
+        
+        if read(os.path.join(shared, 'f_old')) != 'updated' or read(os.path.join(shared, 'f_new')) != 'new' \
+                or read(os.path.join(shared, 'f_newer_in_shared')) != 'other worker':
+            print("✗ Merge did not keep the newest entries")
+            return False
+        print("✓ Check-in merges by mtime")
+        
+        if os.path.exists(os.path.join(shared, 'index')) or os.path.exists(os.path.join(shared, 'index-dir')) \
+                or os.path.exists(worker_dir):
+            print("✗ Stale index or worker copy left behind")
+            return False
+        print("✓ Index removed, worker copy deleted")
+        
+        # Melebihi batas ukuran: entry paling lama dibuang dulu
+        write(os.path.join(shared, 'f_big'), 'x' * (1024 * 1024), now)
+        cache.checkin(cache.checkout())
+        if os.path.exists(os.path.join(shared, 'f_old')) or not os.path.exists(os.path.join(shared, 'f_big')) \
+                or cache.size_mb() > 1:
+            print("✗ Eviction incorrect")
+            return False
+        print("✓ Oldest entries evicted above size limit")
+        
+        print("\n✓ Browser cache working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Browser cache test failed: {e}")
+        return False
+
+
+def test_report_renderers():
+    """Test data laporan JSON/HTML, aturan setara performa dan thumbnail"""
+    print("\n" + "="*70)
+    print("TEST 22: Report Renderers")
+    print("="*70)
+    
+    try:
+        import tempfile
+        from PIL import Image
+        from report_renderers import build_report_data, performance_rows, HTMLReportRenderer
+        from result_models import ScrapeResult, DomStats
+        from capability_analyzer import CapabilityAnalyzer
+        
+        directory = tempfile.mkdtemp()
+        screenshot = os.path.join(directory, 'a.png')
+        Image.new('RGB', (800, 600), 'red').save(screenshot)
+        analyzer = CapabilityAnalyzer()
+        cap_a = analyzer.aggregate_website_capabilities([ScrapeResult(
+            url='https://a.com', website_name='A', dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js'], screenshot_path=screenshot
+        )])
+        cap_b = analyzer.aggregate_website_capabilities([ScrapeResult(
+            url='https://b.com', website_name='B', dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js'], screenshot_path=os.path.join(directory, 'missing.png')
+        )])
+        
+        # Struktur data laporan: keunggulan per capability, performa hanya jika ada
+        performance = {'website_a': {'pages': 1, 'metrics': {'load_ms': {'p50': 100, 'p95': 150}}}}
+        data = build_report_data('A', 'B', cap_a, cap_b, run_id=7, performance=performance)
+        chart = data['capabilities']['output_grafik_chart']
+        if data['run_id'] != 7 or chart['advantage'] != 'Setara' or not chart['website_a']['supported'] \
+                or 'performance' not in data['website_a'] or 'performance' in data['website_b'] \
+                or list(data['capabilities']) != list(cap_a):
+            print("✗ Report data incorrect")
+            return False
+        print("✓ build_report_data structure")
+        
+        # Selisih median <= 5% dianggap setara; metrik yang hanya ada di satu sisi tanpa pemenang
+        def better(a, b):
+            perf = [{'metrics': {'load_ms': {'p50': value, 'p95': value}}} for value in (a, b)]
+            return performance_rows('A', 'B', *perf)[0][3]
+        rows = performance_rows('A', 'B', performance['website_a'], None)
+        if better(100, 105) != 'Setara' or better(100, 106) != 'A' or better(120, 100) != 'B' \
+                or rows != [['Load', '100 ms (150 ms)', '-', '-']]:
+            print("✗ Performance rows incorrect")
+            return False
+        print("✓ Performance rows use the 5% tie rule")
+        
+        # Thumbnail dibuat untuk screenshot yang ada, fallback teks untuk yang hilang
+        renderer = HTMLReportRenderer(thumbnail_width=100)
+        output = os.path.join(directory, 'report.html')
+        renderer.render('A', 'B', cap_a, cap_b, output)
+        with open(output, encoding='utf-8') as f:
+            page = f.read()
+        thumbnail = os.path.join(directory, 'report_files', 'a_thumb.jpg')
+        if not os.path.exists(thumbnail) or 'report_files/a_thumb.jpg' not in page \
+                or 'Screenshot tidak tersedia' not in page:
+            print("✗ Thumbnail or fallback missing")
+            return False
+        print("✓ Thumbnail created, missing screenshot falls back to text")
+        
+        # Screenshot baru dengan nama sama: thumbnail lama dibuat ulang
+        os.utime(thumbnail, (0, 0))
+        Image.new('RGB', (800, 600), 'blue').save(screenshot)
+        renderer.render('A', 'B', cap_a, cap_b, output)
+        with Image.open(thumbnail) as image:
+            red, green, blue = image.convert('RGB').getpixel((10, 10))
+        if os.path.getmtime(thumbnail) == 0 or blue < 200 or red > 50:
+            print("✗ Stale thumbnail reused")
+            return False
+        print("✓ Stale thumbnail regenerated")
+        
+        print("\n✓ Report renderers working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Report renderers test failed: {e}")
+        return False
+
+
+def test_pdf_templates():
+    """Test stylesheet bersama dan section metodologi yang dirender sekali"""
+    print("\n" + "="*70)
+    print("TEST 23: PDF Templates")
+    print("="*70)
+    
+    try:
+        import io
+        import tempfile
+        from pypdf import PdfReader
+        import pdf_generator
+        from pdf_generator import PDFGenerator
+        from result_models import ScrapeResult, DomStats
+        from capability_analyzer import CapabilityAnalyzer
+        
+        first, second = PDFGenerator(), PDFGenerator()
+        if first.styles is not second.styles:
+            print("✗ Stylesheet not shared")
+            return False
+        print("✓ Stylesheet shared per process")
+        
+        # Section statis dirender sekali; generator lain memakai fragment yang sama
+        calls = []
+        
+        def methodology():
+            calls.append(1)
+            return first._create_methodology_section()
+        
+        pdf_generator._TEMPLATE_CACHE.pop('test_methodology', None)
+        fragment = first._template('test_methodology', methodology)
+        if second._template('test_methodology', methodology) is not fragment or len(calls) != 1 \
+                or 'metodologi' not in PdfReader(io.BytesIO(fragment)).pages[0].extract_text().lower():
+            print("✗ Template not cached")
+            return False
+        print("✓ Methodology rendered once and reused")
+        
+        # Laporan: sampul dinamis + metodologi dari cache, dengan atau tanpa pypdf
+        capabilities = CapabilityAnalyzer().aggregate_website_capabilities([ScrapeResult(
+            url='https://test.com', website_name='Test', dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js']
+        )])
+        directory = tempfile.mkdtemp()
+        merged, single = os.path.join(directory, 'merged.pdf'), os.path.join(directory, 'single.pdf')
+        first.generate_report('A', 'B', capabilities, capabilities, merged)
+        writer = pdf_generator.PdfWriter
+        pdf_generator.PdfWriter = None
+        try:
+            first.generate_report('A', 'B', capabilities, capabilities, single)
+        finally:
+            pdf_generator.PdfWriter = writer
+        outline = [item.title for item in PdfReader(merged).outline]
+        if outline[:2] != ['Sampul', 'Metodologi Analisis'] or not PdfReader(single).pages:
+            print("✗ Report with cached template incorrect")
+            return False
+        print("✓ Report merged from cover, cached methodology and sections")
+        
+        print("\n✓ PDF templates working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ PDF templates test failed: {e}")
+        return False
+
+
+def test_parallel_pdf_sections():
+    """Test render section PDF paralel di worker process"""
+    print("\n" + "="*70)
+    print("TEST 24: Parallel PDF Sections")
+    print("="*70)
+    
+    try:
+        import tempfile
+        from pypdf import PdfReader
+        import pdf_generator
+        from pdf_generator import PDFGenerator
+        from result_models import ScrapeResult, DomStats
+        from capability_analyzer import CapabilityAnalyzer
+        
+        capabilities = CapabilityAnalyzer().aggregate_website_capabilities([ScrapeResult(
+            url='https://test.com', website_name='Test', dom_elements=DomStats(canvas_count=1),
+            javascript_libraries=['Chart.js']
+        )])
+        performance = {side: {'pages': 1, 'metrics': {'load_ms': {'p50': 900, 'p75': 950, 'p95': 1000}}}
+                       for side in ('website_a', 'website_b')}
+        directory = tempfile.mkdtemp()
+        
+        def report(name, workers):
+            path = os.path.join(directory, name)
+            PDFGenerator(workers=workers).generate_report('A', 'B', capabilities, capabilities, path, performance)
+            reader = PdfReader(path)
+            return [item.title for item in reader.outline], [page.extract_text() for page in reader.pages]
+        
+        # Hasil paralel identik dengan render berurutan (urutan section tetap)
+        sequential = report('sequential.pdf', 1)
+        parallel = report('parallel.pdf', 3)
+        if parallel != sequential or 'Perbandingan Performa' not in parallel[0] or parallel[0][-1] != 'Kesimpulan':
+            print("✗ Parallel sections differ from sequential render")
+            return False
+        print("✓ Parallel render matches sequential render")
+        
+        # Pool process tidak bisa dibuat: kembali ke render berurutan
+        class BrokenPool:
+            def __init__(self, *args, **kwargs):
+                raise OSError("process tidak tersedia")
+        
+        pool = pdf_generator.ProcessPoolExecutor
+        pdf_generator.ProcessPoolExecutor = BrokenPool
+        try:
+            fallback = report('fallback.pdf', 3)
+        finally:
+            pdf_generator.ProcessPoolExecutor = pool
+        if fallback != sequential:
+            print("✗ Sequential fallback incorrect")
+            return False
+        print("✓ Falls back to sequential render")
+        
+        print("\n✓ Parallel PDF sections working correctly!")
+        return True
+        
+    except Exception as e:
+        print(f"\n✗ Parallel PDF sections test failed: {e}")
+        return False
+
+
+def test_session_manager():
+    """Test credential per host/environment dan injeksi ulang session login"""
+    print("\n" + "="*70)
+    print("TEST 25: Session Manager")
+    print("="*70)
+    
+    try:
+        from session_manager import SessionManager
+        
+        class FakeDriver:
+            """Driver tiruan: mencatat perintah CDP dan script yang dijalankan"""
+            def __init__(self, cookies=None, local_storage=None):
+                self.cookies = cookies or []
+                self.local_storage = local_storage or {}
+                self.cdp_calls = []
+                self.scripts = []
+            
+            def execute_cdp_cmd(self, cmd, params):
+                self.cdp_calls.append((cmd, params))
+                if cmd == 'Network.getCookies':
+                    return {'cookies': self.cookies}
+                return {}
+            
+            def execute_script(self, script):
+                self.scripts.append(script)
+                return dict(self.local_storage)
+        
+        # Credential: dict per host, lalu environment, selain itu tidak ada
+        env_keys = ('WEBCOMPARE_AUTH_USERNAME', 'WEBCOMPARE_AUTH_PASSWORD')
+        saved_env = {key: os.environ.pop(key, None) for key in env_keys}
+        try:
+            manager = SessionManager(credentials={'a.test': ('alice', 'secret'), '*': ('any', 'pw')})
+            if (manager.credentials_for('https://a.test/download') != ('alice', 'secret') or
+                    manager.credentials_for('https://b.test/') != ('any', 'pw')):
+                print("✗ Per-host credentials incorrect")
+                return False
+            
+            if SessionManager().credentials_for('https://a.test/') is not None:
+                print("✗ Credentials used without configuration")
+                return False
+            
+            os.environ['WEBCOMPARE_AUTH_USERNAME'] = 'env-user'
+            if SessionManager().credentials_for('https://a.test/') is not None:
+                print("✗ Credentials used with only username set")
+                return False
+            os.environ['WEBCOMPARE_AUTH_PASSWORD'] = 'env-pass'
+            if SessionManager().credentials_for('https://a.test/') != ('env-user', 'env-pass'):
+                print("✗ Environment credentials not used")
+                return False
+        finally:
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+        print("✓ Credentials from host dict, then environment, otherwise none")
+        
+        # Capture lalu apply ke driver baru
+        manager = SessionManager(credentials={})
+        login_driver = FakeDriver(
+            cookies=[{'name': 'sid', 'value': 'abc', 'domain': 'a.test', 'path': '/', 'size': 6}],
+            local_storage={'token': 'xyz'}
         )
+        if manager.apply(FakeDriver(), 'https://a.test/download'):
+            print("✗ Session applied before capture")
+            return False
+        manager.capture(login_driver, 'https://a.test/login')
+        driver = FakeDriver()
+        if not manager.apply(driver, 'https://a.test/download'):
+            print("✗ Captured session not applied")
+            return False
+        calls = dict(driver.cdp_calls)
+        if calls.get('Network.setCookies') != {'cookies': [{'name': 'sid', 'value': 'abc', 'domain': 'a.test', 'path': '/'}]}:
+            print("✗ Cookies not re-injected")
+            return False
+        source = calls.get('Page.addScriptToEvaluateOnNewDocument', {}).get('source', '')
+        if '"token": "xyz"' not in source or '"https://a.test"' not in source:
+            print("✗ localStorage not re-injected")
+            return False
+        print("✓ Captured cookies and localStorage re-injected")
         
-        if os.path.exists(test_pdf):
-            file_size = os.path.getsize(test_pdf)
-            print(f"✓ PDF created: {test_pdf} ({file_size} bytes)")
-            print("\n✓ PDF generator working correctly!")
-            return True
-        else:
-            print("✗ PDF not created")
+        # Session kadaluarsa (umur atau cookie expired) dibuang
+        manager.max_age = -1
+        if manager.apply(FakeDriver(), 'https://a.test/download') or manager.get_session('https://a.test/'):
+            print("✗ Expired session reused")
+            return False
+        manager = SessionManager(credentials={})
+        manager.capture(FakeDriver(cookies=[{'name': 'sid', 'value': 'old', 'expires': 1}]), 'https://a.test/')
+        if manager.get_session('https://a.test/') is not None:
+            print("✗ Session with expired cookie reused")
             return False
+        print("✓ Expired sessions dropped")
         
+        print("\n✓ Session manager working correctly!")
+        return True
+    
     except Exception as e:
-        print(f"\n✗ PDF generator test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"\n✗ Session manager test failed: {e}")
+        return False
+
+
+def test_browser_reuse():
+    """Test pemakaian ulang browser per origin (tab/context) dengan driver tiruan"""
+    print("\n" + "="*70)
+    print("TEST 26: Browser Reuse")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import time
+        from types import SimpleNamespace
+        import web_scraper
+        from web_scraper import WebScraper
+        from failure_policy import FailurePolicy
+        from resource_governor import ResourceGovernor
+        from result_models import ScrapeResult
+        
+        class FakeSwitchTo:
+            def __init__(self, driver):
+                self.driver = driver
+            
+            def window(self, handle):
+                self.driver.current_window_handle = handle
+            
+            def new_window(self, kind):
+                self.driver.current_window_handle = f"tab{len(self.driver.cdp_calls)}"
+        
+        class FakeDriver:
+            """Driver tiruan: mencatat URL, window yang ditutup dan perintah CDP"""
+            def __init__(self):
+                self.current_window_handle = 'main'
+                self.switch_to = FakeSwitchTo(self)
+                self.urls = []
+                self.closed = []
+                self.cdp_calls = []
+                self.rss = 0
+                self.quit_called = False
+            
+            def execute_cdp_cmd(self, cmd, params):
+                self.cdp_calls.append((cmd, params))
+                count = len(self.cdp_calls)
+                if cmd == 'Target.createBrowserContext':
+                    return {'browserContextId': f"ctx{count}"}
+                if cmd == 'Target.createTarget':
+                    return {'targetId': f"target{count}"}
+                return {}
+            
+            def close(self):
+                self.closed.append(self.current_window_handle)
+            
+            def quit(self):
+                self.quit_called = True
+        
+        class FakeGovernor(ResourceGovernor):
+            def driver_rss_mb(self, driver):
+                return driver.rss
+        
+        class FakeScraper(WebScraper):
+            """Browser dan halaman tiruan; URL '/fail' gagal, URL '/heavy' membuat RSS melebihi budget"""
+            drivers = []
+            
+            def _create_driver(self):
+                driver = FakeDriver()
+                self.drivers.append(driver)
+                return driver
+            
+            def _scrape_with_driver(self, driver, url, website_name):
+                driver.urls.append(url)
+                if url.endswith('/fail'):
+                    raise RuntimeError("renderer crashed")
+                if url.endswith('/heavy'):
+                    driver.rss = 4096
+                return ScrapeResult(url=url, website_name=website_name)
+        
+        governor = FakeGovernor(driver_rss_budget_mb=2048)
+        scraper = FakeScraper(
+            screenshot_dir=tempfile.mkdtemp(),
+            failure_policy=FailurePolicy(max_attempts=1),
+            resource_governor=governor,
+            browser_reuse='context'
+        )
+        urls = [
+            'https://a.test/1', 'https://b.test/1', 'https://a.test/2',
+            'https://a.test/fail', 'https://a.test/heavy', 'https://a.test/3'
+        ]
+        # Delay antar request tidak perlu untuk driver tiruan
+        web_scraper.time = SimpleNamespace(sleep=lambda seconds: None, time=time.time, monotonic=time.monotonic)
+        try:
+            results = scraper.scrape_multiple_urls(urls, 'Test')
+        finally:
+            web_scraper.time = time
+        drivers = scraper.drivers
+        
+        if [d.urls for d in drivers] != [
+            ['https://a.test/1', 'https://a.test/2', 'https://a.test/fail'],
+            ['https://a.test/heavy'], ['https://a.test/3'], ['https://b.test/1']
+        ]:
+            print(f"✗ Drivers per origin incorrect: {[d.urls for d in drivers]}")
+            return False
+        print("✓ One browser per origin group")
+        
+        first = drivers[0]
+        disposed = [params['browserContextId'] for cmd, params in first.cdp_calls
+                    if cmd == 'Target.disposeBrowserContext']
+        if first.closed != ['main', 'target2'] or disposed != ['ctx1']:
+            print(f"✗ Previous page not closed: {first.closed}, {disposed}")
+            return False
+        print("✓ Previous tab closed and previous context disposed")
+        
+        if not results[3].error or not first.quit_called:
+            print("✗ Failed attempt did not discard shared browser")
+            return False
+        print("✓ Failed attempt discards shared browser")
+        
+        if not drivers[1].quit_called or governor.recycled_drivers != 1:
+            print("✗ Browser over RSS budget not recycled")
+            return False
+        if not all(d.quit_called for d in drivers):
+            print("✗ Browser left open")
+            return False
+        print("✓ Browser over RSS budget recycled")
+        
+        print("\n✓ Browser reuse working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"\n✗ Browser reuse test failed: {e}")
+        return False
+
+
+def test_dom_probe():
+    """Test pemetaan hasil probe (satu execute_script) di sisi Python dengan driver tiruan"""
+    print("\n" + "="*70)
+    print("TEST 27: DOM Probe")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import time
+        from types import SimpleNamespace
+        from selenium.common.exceptions import StaleElementReferenceException
+        import web_scraper
+        from web_scraper import WebScraper
+        from dom_probe import probe, PROBE_SCRIPT
+        
+        class FakeElement:
+            """WebElement tiruan: mencatat aksi; setelah submit dianggap sudah hilang"""
+            def __init__(self, name):
+                self.name = name
+                self.actions = []
+            
+            def clear(self):
+                self.actions.append('clear')
+            
+            def send_keys(self, value):
+                self.actions.append(('send_keys', value))
+            
+            def click(self):
+                self.actions.append('click')
+            
+            def is_enabled(self):
+                raise StaleElementReferenceException(self.name)
+        
+        class FakeDriver:
+            """Driver tiruan: execute_script mengembalikan hasil probe yang disiapkan"""
+            def __init__(self, probe_result=None):
+                self.probe_result = probe_result
+                self.scripts = []
+            
+            def execute_script(self, script, *args):
+                self.scripts.append((script, args))
+                return self.probe_result if script == PROBE_SCRIPT else None
+            
+            def set_script_timeout(self, seconds):
+                pass
+            
+            def execute_async_script(self, script, *args):
+                return {'steps': 1, 'elapsed_ms': 10, 'height': 900, 'new_requests': 0, 'lazy_elements': 0}
+        
+        def element(name, visible=True, enabled=True, text=''):
+            return {'element': FakeElement(name), 'selector': name, 'tag': 'button',
+                    'text': text, 'visible': visible, 'enabled': enabled, 'rect': None}
+        
+        def probe_calls(driver):
+            return [args for script, args in driver.scripts if script == PROBE_SCRIPT]
+        
+        # Spec dikirim dalam satu panggilan; hasil kosong menjadi struktur default
+        driver = FakeDriver()
+        empty = probe(driver, first={'password': ["input[type='password']"]},
+                      all={'buttons': ("button", 5)}, iframes=True)
+        spec = {'first': {'password': ["input[type='password']"]}, 'all': {'buttons': ["button", 5]}, 'iframes': True}
+        if probe_calls(driver) != [(spec,)] or empty != {'first': {}, 'all': {}, 'iframes': []}:
+            print("✗ Probe spec/default result incorrect")
+            return False
+        print("✓ Probe spec sent in one execute_script call")
+        
+        scraper = WebScraper(screenshot_dir=tempfile.mkdtemp())
+        
+        # Form login: field dan tombol dari satu probe
+        found = {'username': element('username'), 'password': element('password'), 'submit': element('submit')}
+        driver = FakeDriver({'first': found, 'all': {}, 'iframes': []})
+        scraper._submit_login(driver, 'alice', 'secret')
+        if (len(probe_calls(driver)) != 1 or
+                found['username']['element'].actions != ['clear', ('send_keys', 'alice')] or
+                found['password']['element'].actions != ['clear', ('send_keys', 'secret')] or
+                found['submit']['element'].actions != ['click']):
+            print("✗ Login form probe result not used")
+            return False
+        if not scraper._login_form_visible(driver, timeout=0):
+            print("✗ Visible password field not detected")
+            return False
+        if scraper._login_form_visible(FakeDriver({'first': {'password': None}, 'all': {}, 'iframes': []}), timeout=0):
+            print("✗ Missing password field detected as visible")
+            return False
+        print("✓ Login form filled from single probe")
+        
+        # Tombol: hanya yang terlihat, aktif dan bukan aksi berbahaya yang diklik
+        buttons = [
+            element('filter', text='Filter'), element('hidden', visible=False, text='More'),
+            element('disabled', enabled=False, text='Next'), element('logout', text='Logout')
+        ]
+        driver = FakeDriver({'first': {}, 'all': {'buttons': buttons, 'hoverable': []}, 'iframes': []})
+        web_scraper.time = SimpleNamespace(sleep=lambda seconds: None, time=time.time, monotonic=time.monotonic)
+        try:
+            scraper._scroll_and_interact(driver)
+        finally:
+            web_scraper.time = time
+        clicked = [b['selector'] for b in buttons if b['element'].actions == ['click']]
+        if len(probe_calls(driver)) != 1 or clicked != ['filter']:
+            print(f"✗ Button probe mapping incorrect: {clicked}")
+            return False
+        print("✓ Buttons clicked from single probe result")
+        
+        print("\n✓ DOM probe working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"\n✗ DOM probe test failed: {e}")
+        return False
+
+
+def test_browser_extraction():
+    """Test extraction_mode='browser' menghasilkan field yang sama dengan parsing HTML"""
+    print("\n" + "="*70)
+    print("TEST 28: Browser Extraction")
+    print("="*70)
+    
+    try:
+        import tempfile
+        from bs4 import BeautifulSoup
+        from web_scraper import WebScraper
+        from dom_probe import DOM_STATS_SCRIPT
+        from page_fingerprint import soup_shingles
+        from result_models import ScrapeResult
+        from capability_analyzer import CapabilityAnalyzer
+        
+        html = (
+            '<html><body><form><input type="checkbox"><select></select></form>'
+            '<div class="chart-box"><canvas id="c1" width="400" height="200"></canvas></div>'
+            '<table class="data"><tr><th>A</th></tr><tr><td>1</td></tr></table>'
+            '<a href="/download/report.csv">Report</a>'
+            '<script src="https://cdn.jsdelivr.net/npm/chart.js"></script>'
+            "<script>var ws = new WebSocket('wss://example.test');</script></body></html>"
+        )
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Hasil DOM_STATS_SCRIPT untuk HTML di atas (dimensi chart hasil render)
+        extracted = {
+            'dom': {
+                'canvas_count': 1, 'svg_count': 0, 'table_count': 1,
+                'chart_containers': [{'tag': 'canvas', 'id': 'c1', 'class': '', 'parent_class': 'chart-box',
+                                      'width': 400, 'height': 200}],
+                'tables': [{'rows': 2, 'cols': 2, 'class': 'data', 'id': '', 'has_header': True}],
+                'download_elements': [{'tag': 'a', 'text': 'Report', 'href': '/download/report.csv',
+                                       'download_attr': False}],
+                'inputs': {'select': 1, 'checkbox': 1, 'radio': 0, 'range': 0, 'date': 0},
+                'form_count': 1, 'chart_class_count': 1, 'grid_class_count': 0, 'event_handler_count': 0
+            },
+            'script_srcs': ['https://cdn.jsdelivr.net/npm/chart.js'],
+            'inline_scripts': "var ws = new WebSocket('wss://example.test');",
+            'global_libraries': ['Chart.js'],
+            'structure': soup_shingles(soup)
+        }
+        
+        class FakeDriver:
+            """Driver tiruan: DOM_STATS_SCRIPT mengembalikan hasil yang disiapkan"""
+            page_source = html
+            
+            def __init__(self):
+                self.scripts = []
+            
+            def execute_script(self, script, *args):
+                self.scripts.append((script, args))
+                return extracted if script == DOM_STATS_SCRIPT else None
+        
+        scraper = WebScraper(screenshot_dir=tempfile.mkdtemp(), extraction_mode='browser')
+        driver = FakeDriver()
+        html_content, dom, libraries, websocket = scraper._extract_in_browser(driver)
+        if len(driver.scripts) != 1 or html_content is not None:
+            print("✗ Browser extraction should use one script call and skip page_source")
+            return False
+        
+        html_dom = scraper._analyze_dom(soup, html)
+        html_libraries = scraper._detect_js_libraries(html, soup)
+        html_websocket = scraper._detect_websocket(html)
+        
+        browser_fields = dom.to_dict()
+        html_fields = html_dom.to_dict()
+        for container in html_fields['chart_containers']:
+            container['width'], container['height'] = int(container['width']), int(container['height'])
+        if any(browser_fields[key] != value for key, value in html_fields.items()):
+            print("✗ DomStats fields differ from HTML path")
+            return False
+        if browser_fields['chart_class_count'] != 1 or dom.fingerprint is None:
+            print("✗ Browser-only DOM fields missing")
+            return False
+        if libraries != html_libraries or websocket != html_websocket:
+            print(f"✗ Libraries/WebSocket differ: {libraries} vs {html_libraries}")
+            return False
+        print("✓ DomStats, libraries and WebSocket match HTML path")
+        
+        # Verdict capability dari kedua mode sama
+        analyzer = CapabilityAnalyzer()
+        results = [
+            ScrapeResult(url='https://test.com/a', website_name='Test', html=content,
+                         dom_elements=stats, javascript_libraries=libs, websocket_detected=ws)
+            for content, stats, libs, ws in (
+                (html, html_dom, html_libraries, html_websocket),
+                (html_content, dom, libraries, websocket)
+            )
+        ]
+        verdicts = analyzer.analyze_pages(results)
+        supported = [{name: v.supported for name, v in page.items()} for page in verdicts]
+        if supported[0] != supported[1]:
+            print(f"✗ Capability verdicts differ: {supported}")
+            return False
+        print("✓ Capability verdicts identical for both extraction modes")
+        
+        scraper.include_html = True
+        if scraper._extract_in_browser(FakeDriver())[0] != html:
+            print("✗ include_html did not capture page_source")
+            return False
+        print("✓ include_html keeps full HTML")
+        
+        print("\n✓ Browser extraction working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"\n✗ Browser extraction test failed: {e}")
+        return False
+
+
+def test_adaptive_scroll():
+    """Test pemanggilan scroll adaptif dan penanganan hasil/timeout dengan driver tiruan"""
+    print("\n" + "="*70)
+    print("TEST 29: Adaptive Scroll")
+    print("="*70)
+    
+    try:
+        import tempfile
+        import time
+        from types import SimpleNamespace
+        from selenium.common.exceptions import TimeoutException
+        import web_scraper
+        from web_scraper import WebScraper
+        from dom_probe import adaptive_scroll, ADAPTIVE_SCROLL_SCRIPT, PROBE_SCRIPT
+        
+        class FakeDriver:
+            """Driver tiruan: execute_async_script mengembalikan hasil scroll (atau timeout)"""
+            def __init__(self, scroll_result):
+                self.scroll_result = scroll_result
+                self.script_timeout = None
+                self.async_calls = []
+                self.scripts = []
+            
+            def set_script_timeout(self, seconds):
+                self.script_timeout = seconds
+            
+            def execute_async_script(self, script, *args):
+                self.async_calls.append((script, args))
+                if self.scroll_result is None:
+                    raise TimeoutException("script timeout")
+                return self.scroll_result
+            
+            def execute_script(self, script, *args):
+                self.scripts.append(script)
+                if script == PROBE_SCRIPT:
+                    return {'first': {}, 'all': {'buttons': [], 'hoverable': []}, 'iframes': []}
+                return None
+        
+        scroll_result = {'steps': 4, 'height': 3600, 'elapsed_ms': 2100,
+                         'new_requests': 3, 'lazy_elements': 6, 'reached_bottom': True}
+        
+        driver = FakeDriver(scroll_result)
+        result = adaptive_scroll(driver, quiet_ms=200, max_seconds=5, poll_ms=50, lazy_selector='img')
+        expected_args = ({'quietMs': 200, 'maxMs': 5000, 'pollMs': 50, 'lazySelector': 'img'},)
+        if result != scroll_result or driver.async_calls != [(ADAPTIVE_SCROLL_SCRIPT, expected_args)]:
+            print("✗ Adaptive scroll arguments/result incorrect")
+            return False
+        if driver.script_timeout != 10:
+            print("✗ Script timeout not above scroll budget")
+            return False
+        print("✓ Adaptive scroll runs in one async script call")
+        
+        scraper = WebScraper(screenshot_dir=tempfile.mkdtemp())
+        web_scraper.time = SimpleNamespace(sleep=lambda seconds: None, time=time.time, monotonic=time.monotonic)
+        try:
+            driver = FakeDriver(scroll_result)
+            scraper._scroll_and_interact(driver)
+            timeout_driver = FakeDriver(None)
+            scraper._scroll_and_interact(timeout_driver)
+        finally:
+            web_scraper.time = time
+        
+        settings = driver.async_calls[0][1][0]
+        if settings['quietMs'] != scraper.SCROLL_QUIET_MS or settings['maxMs'] != scraper.SCROLL_MAX_SECONDS * 1000:
+            print("✗ Scraper scroll settings not passed")
+            return False
+        # Tidak ada scroll langkah tetap: hanya probe dan kembali ke atas
+        if driver.scripts != [PROBE_SCRIPT, "window.scrollTo(0, 0);"]:
+            print(f"✗ Unexpected scroll scripts: {driver.scripts}")
+            return False
+        print("✓ Scraper uses adaptive scroll instead of fixed steps")
+        
+        if timeout_driver.scripts != [PROBE_SCRIPT, "window.scrollTo(0, 0);"]:
+            print("✗ Interaction skipped after scroll timeout")
+            return False
+        print("✓ Scroll timeout still runs interaction")
+        
+        print("\n✓ Adaptive scroll working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"\n✗ Adaptive scroll test failed: {e}")
+        return False
+
+
+def test_cli():
+    """Test manifest, prioritas opsi dan validasi flag command line"""
+    print("\n" + "="*70)
+    print("TEST 30: CLI")
+    print("="*70)
+    
+    try:
+        import json
+        import tempfile
+        from cli import load_manifest, resolve_options, build_parser, DEFAULT_OPTIONS
+        
+        manifest_dir = tempfile.mkdtemp()
+        
+        def write_manifest(name, content):
+            path = os.path.join(manifest_dir, name)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(content, f)
+            return path
+        
+        # Satu perbandingan di top level dinormalisasi menjadi comparisons
+        manifest = load_manifest(write_manifest('single.json', {
+            'defaults': {'workers': 3},
+            'website_a': {'urls': ['https://a.test/']},
+            'website_b': {'name': 'B', 'seeds': ['https://b.test/']},
+            'output_pdf': 'output/a_vs_b.pdf'
+        }))
+        comparisons = manifest['comparisons']
+        if (manifest['defaults'] != {'workers': 3} or len(comparisons) != 1 or
+                comparisons[0]['output_pdf'] != 'output/a_vs_b.pdf' or
+                comparisons[0]['website_a']['name'] != 'Website A'):
+            print("✗ Single-comparison manifest not normalised")
+            return False
+        print("✓ Top-level comparison normalised into comparisons")
+        
+        # Website tanpa urls/seeds ditolak
+        for content in (
+            {'website_a': {'urls': ['https://a.test/']}, 'website_b': {'name': 'B'}},
+            {'comparisons': [{'website_a': {'urls': []}, 'website_b': {'urls': ['https://b.test/']}}]}
+        ):
+            try:
+                load_manifest(write_manifest('invalid.json', content))
+                print("✗ Site without urls/seeds accepted")
+                return False
+            except SystemExit:
+                pass
+        print("✓ Site without urls/seeds rejected")
+        
+        # Prioritas: flag > defaults manifest > DEFAULT_OPTIONS
+        parser = build_parser()
+        args = parser.parse_args(['compare', 'manifest.json', '--workers', '4', '--no-cache'])
+        options = resolve_options(args, {'workers': 2, 'extraction_mode': 'browser', 'cache_dir': '.cache'})
+        if (options['workers'] != 4 or options['extraction_mode'] != 'browser' or
+                options['page_load_timeout'] != DEFAULT_OPTIONS['page_load_timeout']):
+            print("✗ Option precedence incorrect")
+            return False
+        if options['cache_dir'] != '':
+            print("✗ --no-cache did not override manifest cache_dir")
+            return False
+        print("✓ Flag > manifest defaults > DEFAULT_OPTIONS, --no-cache maps to ''")
+        
+        options = resolve_options(parser.parse_args(['compare', 'manifest.json', '--formats', 'PDF, html']), {})
+        if options['formats'] != ['pdf', 'html']:
+            print("✗ Formats not parsed")
+            return False
+        try:
+            resolve_options(parser.parse_args(['compare', 'manifest.json', '--formats', 'pdf,docx']), {})
+            print("✗ Unknown format accepted")
+            return False
+        except SystemExit:
+            pass
+        print("✓ Unknown --formats value rejected")
+        
+        print("\n✓ CLI working correctly!")
+        return True
+    
+    except Exception as e:
+        print(f"\n✗ CLI test failed: {e}")
         return False
 
 
@@ -305,6 +2177,81 @@ def run_all_tests():
     # Test 5: PDF Generator
     results.append(("PDF Generator", test_pdf_generator()))
     
+    # Test 6: Result Models
+    results.append(("Result Models", test_result_models()))
+    
+    # Test 7: Result Store
+    results.append(("Result Store", test_result_store()))
+    
+    # Test 8: Resource Governor
+    results.append(("Resource Governor", test_resource_governor()))
+    
+    # Test 9: Job Queue
+    results.append(("Job Queue", test_job_queue()))
+    
+    # Test 10: Page Clustering
+    results.append(("Page Clustering", test_page_clustering()))
+    
+    # Test 11: Detector Early Exit
+    results.append(("Detector Early Exit", test_early_exit()))
+    
+    # Test 12: Measured Update Rate
+    results.append(("Measured Update Rate", test_update_rate()))
+    
+    # Test 13: WebSocket Monitor
+    results.append(("WebSocket Monitor", test_websocket_monitor()))
+    
+    # Test 14: Element Screenshots
+    results.append(("Element Screenshots", test_element_screenshots()))
+    
+    # Test 15: URL Sampling
+    results.append(("URL Sampling", test_url_sampling()))
+    
+    # Test 16: URL Crawler
+    results.append(("URL Crawler", test_url_crawler()))
+    
+    # Test 17: Performance Metrics
+    results.append(("Performance Metrics", test_performance_metrics()))
+    
+    # Test 18: Failure Policy
+    results.append(("Failure Policy", test_failure_policy()))
+    
+    # Test 19: Checkpoint
+    results.append(("Checkpoint", test_checkpoint()))
+    
+    # Test 20: Change Detector
+    results.append(("Change Detector", test_change_detector()))
+    
+    # Test 21: Browser Cache
+    results.append(("Browser Cache", test_browser_cache()))
+    
+    # Test 22: Report Renderers
+    results.append(("Report Renderers", test_report_renderers()))
+    
+    # Test 23: PDF Templates
+    results.append(("PDF Templates", test_pdf_templates()))
+    
+    # Test 24: Parallel PDF Sections
+    results.append(("Parallel PDF Sections", test_parallel_pdf_sections()))
+    
+    # Test 25: Session Manager
+    results.append(("Session Manager", test_session_manager()))
+    
+    # Test 26: Browser Reuse
+    results.append(("Browser Reuse", test_browser_reuse()))
+    
+    # Test 27: DOM Probe
+    results.append(("DOM Probe", test_dom_probe()))
+    
+    # Test 28: Browser Extraction
+    results.append(("Browser Extraction", test_browser_extraction()))
+    
+    # Test 29: Adaptive Scroll
+    results.append(("Adaptive Scroll", test_adaptive_scroll()))
+    
+    # Test 30: CLI
+    results.append(("CLI", test_cli()))
+    
     # Summary
     print("\n" + "="*70)
     print("TEST SUMMARY")
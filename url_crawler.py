@@ -0,0 +1,332 @@
+"""
+URL Crawler Module
+Discovery URL: crawl link same-site dan sitemap dari seed URL secara paralel
+dengan frontier terbatas, rate limit per host dan budget kedalaman/halaman
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from urllib import robotparser
+import hashlib
+import math
+import re
+import threading
+import time
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# Parameter query yang tidak mengubah konten (dibuang saat normalisasi)
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|_ga)$', re.I)
+
+# Ekstensi yang bukan halaman HTML
+NON_PAGE_EXTENSIONS = re.compile(
+    r'\.(pdf|csv|xlsx?|docx?|pptx?|zip|gz|tar|rar|7z|png|jpe?g|gif|svg|webp|ico|bmp|'
+    r'css|js|mjs|map|json|xml|txt|woff2?|ttf|eot|mp[34]|webm|avi|mov)$', re.I
+)
+
+
+def normalize_url(url: str, base: str = None) -> Optional[str]:
+    """
+    Normalisasi URL untuk deduplikasi
+
+    Relatif -> absolut, scheme/host huruf kecil, port default dan fragment dibuang,
+    parameter tracking dibuang, query diurutkan, path kosong menjadi '/'.
+    Returns None untuk URL non-HTTP (mailto:, javascript:, ...) dan URL rusak
+    (port bukan angka, IPv6 tanpa kurung tutup).
+    """
+    try:
+        if base:
+            url = urljoin(base, url.strip())
+        parsed = urlparse(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ('http', 'https') or not parsed.hostname:
+            return None
+        host = parsed.hostname.lower()
+        port = parsed.port
+    except ValueError:
+        return None
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    path = re.sub(r'/{2,}', '/', parsed.path or '/')
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not TRACKING_PARAMS.match(key)
+    ))
+    return urlunparse((scheme, host, path, '', query, ''))
+
+
+class BloomFilter:
+    """
+    Seen-set ringkas (false positive ~error_rate, tanpa false negative)
+
+    Ukuran bit array dan jumlah hash dihitung dari capacity dan error_rate;
+    posisi bit memakai double hashing dari satu digest blake2b.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:], 'big') | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item: str) -> bool:
+        """Tambahkan item; False jika item (kemungkinan) sudah ada"""
+        new = False
+        for position in self._positions(item):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+
+class URLCrawler:
+    """
+    Crawler untuk menemukan halaman satu website dari seed URL
+
+    - Breadth-first dari seed (kedalaman 0) dan URL dari sitemap (kedalaman 1)
+    - Hanya host seed dan subdomain-nya; robots.txt dihormati
+    - Frontier dibatasi ``max_frontier`` URL; URL baru dibuang jika frontier penuh
+    - Setiap host paling cepat satu request per ``per_host_delay`` detik
+    - Berhenti setelah ``max_pages`` halaman HTML ditemukan
+
+    Link diambil dari HTML statis (requests), jadi link yang hanya dibuat oleh
+    JavaScript tidak ditemukan; sitemap membantu untuk website seperti itu.
+    """
+
+    USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                  'Chrome/120.0 Safari/537.36')
+
+    def __init__(
+        self,
+        max_pages: int = 50,
+        max_depth: int = 3,
+        max_frontier: int = 10000,
+        per_host_delay: float = 1.0,
+        max_workers: int = 4,
+        timeout: float = 10.0,
+        use_sitemaps: bool = True,
+        respect_robots: bool = True,
+        exclude_patterns: List[str] = None
+    ):
+        """
+        Args:
+            max_pages: Jumlah maksimum halaman yang dikembalikan
+            max_depth: Kedalaman link maksimum dari seed
+            max_frontier: Jumlah maksimum URL yang menunggu di-fetch
+            per_host_delay: Jeda minimum antar request ke host yang sama (detik)
+            max_workers: Jumlah request paralel
+            timeout: Timeout request (detik)
+            use_sitemaps: Baca sitemap (robots.txt dan /sitemap.xml)
+            respect_robots: Lewati URL yang dilarang robots.txt
+            exclude_patterns: Regex URL yang tidak di-crawl (misalnya logout)
+        """
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.max_frontier = max_frontier
+        self.per_host_delay = per_host_delay
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.use_sitemaps = use_sitemaps
+        self.respect_robots = respect_robots
+        self.exclude_patterns = [re.compile(p, re.I) for p in (exclude_patterns or [])]
+
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = self.USER_AGENT
+        self._host_lock = threading.Lock()
+        self._next_request: Dict[str, float] = {}
+        self._robots: Dict[str, Optional[robotparser.RobotFileParser]] = {}
+        self.stats = {}
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _wait_for_host(self, host: str):
+        """Rate limit per host: reservasi slot request berikutnya lalu tunggu"""
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request.get(host, now))
+            self._next_request[host] = slot + self.per_host_delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _get(self, url: str) -> Optional[requests.Response]:
+        self._wait_for_host(urlparse(url).netloc)
+        try:
+            return self.session.get(url, timeout=self.timeout, allow_redirects=True)
+        except requests.RequestException:
+            return None
+
+    def _allowed(self, url: str) -> bool:
+        if any(pattern.search(url) for pattern in self.exclude_patterns):
+            return False
+        if not self.respect_robots:
+            return True
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        with self._host_lock:
+            known = origin in self._robots
+            robots = self._robots.get(origin)
+        if not known:
+            robots = None
+            response = self._get(origin + '/robots.txt')
+            if response is not None and response.status_code == 200:
+                robots = robotparser.RobotFileParser()
+                robots.parse(response.text.splitlines())
+            with self._host_lock:
+                self._robots[origin] = robots
+        return robots is None or robots.can_fetch(self.USER_AGENT, url)
+
+    # ------------------------------------------------------------------
+    # Sitemap
+    # ------------------------------------------------------------------
+
+    def _sitemap_urls(self, seed: str, limit: int) -> List[str]:
+        """URL halaman dari sitemap (robots.txt Sitemap: dan /sitemap.xml), termasuk sitemap index"""
+        parsed = urlparse(seed)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        sitemaps = deque()
+        response = self._get(origin + '/robots.txt')
+        if response is not None and response.status_code == 200:
+            sitemaps.extend(
+                line.split(':', 1)[1].strip() for line in response.text.splitlines()
+                if line.lower().startswith('sitemap:')
+            )
+        if not sitemaps:
+            sitemaps.append(origin + '/sitemap.xml')
+
+        pages: List[str] = []
+        fetched: Set[str] = set()
+        while sitemaps and len(pages) < limit and len(fetched) < 20:
+            sitemap = sitemaps.popleft()
+            if sitemap in fetched:
+                continue
+            fetched.add(sitemap)
+            response = self._get(sitemap)
+            if response is None or response.status_code != 200:
+                continue
+            locations = re.findall(r'<loc>\s*([^<\s]+)\s*</loc>', response.text, re.I)
+            if '<sitemapindex' in response.text[:2000].lower():
+                sitemaps.extend(locations)
+            else:
+                pages.extend(locations[:limit - len(pages)])
+        return pages
+
+    # ------------------------------------------------------------------
+    # Crawl
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _same_site(host: str, seed_hosts: Set[str]) -> bool:
+        return any(host == seed or host.endswith('.' + seed) for seed in seed_hosts)
+
+    def _fetch_links(self, url: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Fetch satu URL
+
+        Returns:
+            (URL akhir setelah redirect jika halaman HTML 200, else None; link di halaman)
+        """
+        response = self._get(url)
+        if response is None or response.status_code != 200 \
+                or 'html' not in response.headers.get('Content-Type', '').lower():
+            return None, []
+        final_url = normalize_url(response.url) or url
+        soup = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer('a'))
+        links = [a['href'] for a in soup.find_all('a', href=True)]
+        return final_url, [normalize_url(link, final_url) for link in links]
+
+    def crawl(self, seeds: List[str]) -> List[str]:
+        """
+        Temukan halaman dari seed URL
+
+        Returns:
+            List URL halaman HTML (urutan penemuan, maksimum max_pages)
+        """
+        seen = BloomFilter(capacity=max(1000, self.max_frontier * 10))
+        frontier = deque()
+        seed_hosts: Set[str] = set()
+        dropped = 0
+
+        def in_scope(url: str) -> bool:
+            parsed = urlparse(url)
+            return self._same_site(parsed.hostname or '', seed_hosts) and not NON_PAGE_EXTENSIONS.search(parsed.path)
+
+        def enqueue(url: Optional[str], depth: int):
+            nonlocal dropped
+            if url is None or depth > self.max_depth or not in_scope(url):
+                return
+            if not seen.add(url):
+                return
+            if len(frontier) >= self.max_frontier:
+                dropped += 1
+                return
+            frontier.append((url, depth))
+
+        for seed in seeds:
+            seed = normalize_url(seed)
+            if seed:
+                seed_hosts.add(urlparse(seed).hostname)
+                enqueue(seed, 0)
+        if self.use_sitemaps:
+            for seed in list(frontier):
+                for url in self._sitemap_urls(seed[0], self.max_pages):
+                    enqueue(normalize_url(url), 1)
+
+        pages: List[str] = []
+        found: Set[str] = set()
+        started = time.monotonic()
+        fetched = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            while (frontier or running) and len(pages) < self.max_pages:
+                while frontier and len(running) < self.max_workers:
+                    url, depth = frontier.popleft()
+                    if not self._allowed(url):
+                        continue
+                    running[pool.submit(self._fetch_links, url)] = depth
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = running.pop(future)
+                    fetched += 1
+                    page, links = future.result()
+                    # URL akhir setelah redirect bisa keluar dari website seed
+                    if page is None or page in found or len(pages) >= self.max_pages or not in_scope(page):
+                        continue
+                    found.add(page)
+                    pages.append(page)
+                    for link in links:
+                        enqueue(link, depth + 1)
+            for future in running:
+                future.cancel()
+
+        self.stats = {
+            'pages': len(pages),
+            'fetched': fetched,
+            'frontier_left': len(frontier),
+            'frontier_dropped': dropped,
+            'seen': seen.count,
+            'elapsed_seconds': round(time.monotonic() - started, 1)
+        }
+        print(f"[INFO] Crawl selesai: {len(pages)} halaman dari {fetched} request "
+              f"({len(frontier)} URL tersisa di frontier, {dropped} dibuang)")
+        return pages
@@ -0,0 +1,144 @@
+"""
+URL Sampler Module
+Sampling URL berstrata per template path untuk website dengan ribuan URL, dan
+estimasi jumlah URL per capability dengan interval kepercayaan
+"""
+
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlparse, parse_qsl
+import math
+import random
+import re
+
+
+_NUMBER = re.compile(r'^\d+$')
+_IDENTIFIER = re.compile(r'^[0-9a-f]{8,}$|^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
+_DIGITS = re.compile(r'\d+')
+
+
+def _segment_template(segment: str) -> str:
+    if _NUMBER.match(segment):
+        return '{n}'
+    if _IDENTIFIER.match(segment):
+        return '{id}'
+    return _DIGITS.sub('{n}', segment.lower())
+
+
+def path_template(url: str) -> str:
+    """
+    Template path URL: angka dan ID diganti placeholder
+
+    Contoh: ``https://x.app/jakarta/station12`` -> ``x.app/jakarta/station{n}``,
+    ``/items/5f3a9c2e11`` -> ``/items/{id}``. Key query string ikut dalam template.
+    """
+    parsed = urlparse(url)
+    segments = [_segment_template(segment) for segment in parsed.path.split('/') if segment]
+    template = parsed.netloc.lower() + '/' + '/'.join(segments)
+    keys = sorted({key for key, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    if keys:
+        template += '?' + '&'.join(keys)
+    return template
+
+
+class SamplingPlan:
+    """
+    Rencana sampling berstrata
+
+    Attributes:
+        groups: Template -> index URL (di daftar asli) dalam grup tersebut
+        indices: Index URL yang di-sample (urutan daftar asli)
+        urls: URL yang di-sample (sejajar dengan indices)
+        strata: Template setiap URL yang di-sample (sejajar dengan indices)
+        total_urls: Jumlah URL di daftar asli
+    """
+
+    def __init__(self, groups: Dict[str, List[int]], indices: List[int], urls: List[str], strata: List[str]):
+        self.groups = groups
+        self.indices = indices
+        self.urls = urls
+        self.strata = strata
+        self.total_urls = sum(len(members) for members in groups.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dict (siap untuk JSON, misalnya disimpan per run di ResultStore)"""
+        return {'groups': self.groups, 'indices': self.indices, 'urls': self.urls, 'strata': self.strata}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SamplingPlan':
+        """Buat rencana dari hasil to_dict()"""
+        return cls(data['groups'], data['indices'], data['urls'], data['strata'])
+
+    @property
+    def population(self) -> Dict[str, int]:
+        """Jumlah URL per template"""
+        return {template: len(members) for template, members in self.groups.items()}
+
+    def estimate(self, hits: Dict[str, int], sampled: Dict[str, int], z: float = 1.96) -> Tuple[int, int, int]:
+        """
+        Estimasi jumlah URL (seluruh daftar) yang memiliki suatu capability
+
+        Args:
+            hits: Template -> jumlah URL sampel yang memiliki capability
+            sampled: Template -> jumlah URL sampel yang berhasil dianalisis
+            z: Nilai z interval kepercayaan (1.96 = 95%)
+
+        Returns:
+            (estimasi, batas bawah, batas atas). Grup yang di-sample seluruhnya
+            dihitung pasti; grup lain memakai proporsi sampel dengan interval Wilson.
+        """
+        estimate = low = high = 0.0
+        for template, population in self.population.items():
+            n = sampled.get(template, 0)
+            k = hits.get(template, 0)
+            if n >= population:
+                estimate, low, high = estimate + k, low + k, high + k
+                continue
+            unseen = population - n
+            if n == 0:
+                # Grup tanpa hasil: hanya batas atas yang bertambah
+                high += population
+                continue
+            proportion_low, proportion_high = wilson_interval(k, n, z)
+            estimate += population * k / n
+            low += k + unseen * proportion_low
+            high += k + unseen * proportion_high
+        return int(round(estimate)), int(math.floor(low)), int(math.ceil(high))
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """Interval Wilson untuk proporsi (tetap masuk akal untuk sampel kecil dan proporsi 0/1)"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def plan_sample(urls: List[str], per_group: int = 3, seed: int = 0) -> SamplingPlan:
+    """
+    Kelompokkan URL per template path dan ambil maksimum per_group URL per grup
+
+    Pemilihan acak tetapi deterministik (seed dan template), jadi rencana yang sama
+    dihasilkan ulang saat resume dari checkpoint.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, url in enumerate(urls):
+        groups.setdefault(path_template(url), []).append(index)
+
+    selected = []
+    for template, members in groups.items():
+        if len(members) <= per_group:
+            selected.extend(members)
+        else:
+            selected.extend(random.Random(f"{seed}:{template}").sample(members, per_group))
+    selected.sort()
+
+    index_template = {index: template for template, members in groups.items() for index in members}
+    return SamplingPlan(
+        groups=groups,
+        indices=selected,
+        urls=[urls[index] for index in selected],
+        strata=[index_template[index] for index in selected]
+    )
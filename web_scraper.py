@@ -9,22 +9,86 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
+import base64
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 import re
 import subprocess
 import sys
+import threading
+from urllib.parse import urlparse
+
+from result_models import ScrapeResult, DomStats
+from failure_policy import FailurePolicy, AuthenticationError, classify_error, ERROR_CIRCUIT_OPEN
+from session_manager import SessionManager, get_origin
+from dom_probe import (
+    probe, extract_dom_stats, adaptive_scroll, resource_cache_stats, evidence_regions,
+    measure_update_rate, install_performance_observer, performance_metrics
+)
+from websocket_monitor import WebSocketMonitor, LOGGING_PREFS
+from resource_governor import ResourceGovernor
+from browser_cache import BrowserCache
+from page_fingerprint import soup_shingles, structure_fingerprint
 
 
 class WebScraper:
     """Web scraper dengan Selenium ChromeDriver untuk website dinamis"""
     
-    def __init__(self, screenshot_dir: str = "screenshots"):
+    def __init__(
+        self,
+        screenshot_dir: str = "screenshots",
+        failure_policy: FailurePolicy = None,
+        session_manager: SessionManager = None,
+        extraction_mode: str = 'html',
+        include_html: bool = False,
+        resource_governor: ResourceGovernor = None,
+        browser_reuse: str = None,
+        browser_cache: BrowserCache = None,
+        element_screenshots: bool = True,
+        observe_seconds: float = 0.0
+    ):
+        """
+        Args:
+            screenshot_dir: Directory screenshot
+            failure_policy: Kebijakan retry/timeout/circuit breaker
+            session_manager: Pengelola session login
+            extraction_mode: 'html' (page_source + BeautifulSoup) atau 'browser'
+                (statistik DOM dihitung di browser dalam satu execute_script, dengan
+                dimensi chart hasil render)
+            include_html: Pada mode 'browser', tetap ambil HTML lengkap
+            resource_governor: Batas resource Chrome dan jumlah worker paralel
+                (default: satu worker, renderer dan heap JS dibatasi)
+            browser_reuse: None (browser baru per URL), 'tab' (URL dengan origin sama
+                dibuka sebagai tab baru di satu browser, berbagi cache dan koneksi) atau
+                'context' (satu browser, setiap URL di browser context terisolasi)
+            browser_cache: Disk cache Chrome bersama untuk asset statis (optional)
+            element_screenshots: Ambil juga screenshot yang di-clip ke elemen bukti
+                setiap capability (chart, tabel, link download, kontrol interaktif)
+            observe_seconds: Lama observasi update (mutasi DOM, perubahan canvas, frame
+                WebSocket via performance log CDP) setelah halaman selesai dimuat; 0 = tidak diukur
+        """
+        if extraction_mode not in ('html', 'browser'):
+            raise ValueError(f"extraction_mode tidak dikenal: {extraction_mode}")
+        if browser_reuse not in (None, 'tab', 'context'):
+            raise ValueError(f"browser_reuse tidak dikenal: {browser_reuse}")
         self.screenshot_dir = screenshot_dir
+        self.extraction_mode = extraction_mode
+        self.include_html = include_html
+        self.failure_policy = failure_policy or FailurePolicy()
+        self.session_manager = session_manager or SessionManager()
+        self.resource_governor = resource_governor or ResourceGovernor()
+        self.browser_reuse = browser_reuse
+        self.browser_cache = browser_cache
+        self.element_screenshots = element_screenshots
+        self.observe_seconds = observe_seconds
+        # Browser yang dipakai ulang oleh worker (thread) yang sedang berjalan
+        self._local = threading.local()
         os.makedirs(screenshot_dir, exist_ok=True)
     
     def _get_chrome_driver_path(self):
@@ -61,78 +125,232 @@ class WebScraper:
         options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        for argument in self.resource_governor.chrome_arguments():
+            options.add_argument(argument)
+        if self.observe_seconds > 0:
+            # Event CDP Network (termasuk frame WebSocket) lewat driver.get_log('performance')
+            options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
+        
+        # Salinan copy-on-write cache bersama (dikembalikan saat driver ditutup)
+        cache_dir = None
+        if self.browser_cache:
+            cache_dir = self.browser_cache.checkout()
+            for argument in self.browser_cache.chrome_arguments(cache_dir):
+                options.add_argument(argument)
         
         try:
-            # Try with service (using webdriver-manager)
-            driver_path = self._get_chrome_driver_path()
-            service = Service(driver_path)
-            driver = webdriver.Chrome(service=service, options=options)
-        except Exception as e:
-            print(f"[WARNING] Gagal dengan service: {e}")
-            # Fallback: try without explicit service (Selenium 4.6+ auto-downloads)
-            driver = webdriver.Chrome(options=options)
+            try:
+                # Try with service (using webdriver-manager)
+                driver_path = self._get_chrome_driver_path()
+                service = Service(driver_path)
+                driver = webdriver.Chrome(service=service, options=options)
+            except Exception as e:
+                print(f"[WARNING] Gagal dengan service: {e}")
+                # Fallback: try without explicit service (Selenium 4.6+ auto-downloads)
+                driver = webdriver.Chrome(options=options)
+        except Exception:
+            if cache_dir:
+                self.browser_cache.checkin(cache_dir)
+            raise
         
-        driver.set_page_load_timeout(30)
+        driver.webcompare_cache_dir = cache_dir
+        driver.set_page_load_timeout(self.failure_policy.page_load_timeout)
         return driver
+    
+    def _quit_driver(self, driver):
+        """Tutup driver dan kembalikan salinan cache-nya ke cache bersama"""
+        try:
+            driver.quit()
+        finally:
+            cache_dir = getattr(driver, 'webcompare_cache_dir', None)
+            if cache_dir:
+                self.browser_cache.checkin(cache_dir)
         
-    def scrape_url(self, url: str, website_name: str) -> Dict[str, Any]:
+    def scrape_url(self, url: str, website_name: str) -> ScrapeResult:
         """
         Scrape satu URL dan kumpulkan semua data teknis
         
         Returns:
-            Dict berisi:
+            ScrapeResult (bisa dibaca seperti dict, lihat to_dict()) berisi:
             - url: URL yang diakses
             - html: HTML content
             - screenshot_path: Path ke screenshot
             - dom_elements: Elemen DOM penting
             - javascript_libraries: Library JS yang terdeteksi
+            - error / error_class / attempts: jika gagal setelah semua retry
         """
+        policy = self.failure_policy
+        breaker = policy.circuit_breaker
+        host = urlparse(url).netloc
+        
+        attempt = 0
+        while True:
+            if not breaker.allow(host):
+                print(f"[ERROR] Circuit breaker open untuk {host}, {url} dilewati")
+                return ScrapeResult(
+                    url=url, website_name=website_name,
+                    error=f"Circuit breaker open untuk host {host}",
+                    error_class=ERROR_CIRCUIT_OPEN, attempts=attempt
+                )
+            
+            attempt += 1
+            try:
+                result = self._scrape_once(url, website_name)
+            except Exception as e:
+                error_class = classify_error(e)
+                breaker.record_failure(host)
+                print(f"[ERROR] Gagal scraping {url} (percobaan {attempt}, {error_class}): {str(e)}")
+                
+                if not policy.should_retry(error_class, attempt) or breaker.is_open(host):
+                    return ScrapeResult(
+                        url=url, website_name=website_name, error=str(e),
+                        error_class=error_class, attempts=attempt
+                    )
+                
+                delay = policy.backoff_delay(attempt)
+                print(f"[INFO] Retry dalam {delay:.1f} detik...")
+                time.sleep(delay)
+                continue
+            
+            breaker.record_success(host)
+            result.attempts = attempt
+            return result
+    
+    def _scrape_once(self, url: str, website_name: str) -> ScrapeResult:
+        """Satu percobaan scraping; exception diteruskan ke scrape_url untuk retry"""
+        reuse = getattr(self._local, 'reusing', False)
         driver = None
+        keep_driver = False
         try:
             print(f"[INFO] Mengakses {url}")
             
-            # Create driver
-            driver = self._create_driver()
-            
-            # Navigate to URL
-            print(f"[INFO] Loading page...")
-            driver.get(url)
-            
-            # Wait for page to load - wait for body element
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            print(f"[INFO] Page loaded, checking for auth/captcha...")
-            
-            # Handle auth untuk halaman download (admin/admin123)
-            if 'download' in url.lower():
-                self._handle_auth(driver, username='admin', password='admin123')
-            
-            # Handle Grafana CAPTCHA / verification
-            if 'grafana' in url.lower():
-                self._handle_grafana_verification(driver)
-            
-            # Additional wait for dynamic content
-            print(f"[INFO] Waiting for JavaScript to render...")
-            time.sleep(8)  # Increased wait time for JS-heavy pages
-            
-            # More aggressive scrolling and interaction
-            print(f"[INFO] Scrolling and interacting...")
-            self._scroll_and_interact(driver)
+            if reuse and self._local.driver is not None:
+                # Browser yang sama, halaman baru di tab/context baru
+                driver = self._local.driver
+                self._open_page(driver)
+            else:
+                # Create driver
+                driver = self._create_driver()
+                if reuse:
+                    self._local.driver = driver
+                    self._local.context_id = None
+            
+            # RSS browser dipantau selama scraping (browser dihentikan jika melebihi budget)
+            with self.resource_governor.watch(driver):
+                result = self._scrape_with_driver(driver, url, website_name)
+            
+            # Browser yang dipakai ulang di-recycle jika sudah terlalu besar
+            keep_driver = reuse and not self.resource_governor.exceeds_budget(driver)
+            if reuse and not keep_driver:
+                print(f"[INFO] Browser melebihi budget RSS, dibuat ulang untuk URL berikutnya")
+                self.resource_governor.record_recycled()
+            return result
             
+        finally:
+            if driver and not keep_driver:
+                self._quit_driver(driver)
+                if reuse:
+                    self._local.driver = None
+    
+    def _open_page(self, driver):
+        """Buka tab (atau browser context terisolasi) baru dan tutup halaman sebelumnya"""
+        previous_handle = driver.current_window_handle
+        previous_context = self._local.context_id
+        new_handle = None
+        
+        if self.browser_reuse == 'context':
+            try:
+                context_id = driver.execute_cdp_cmd(
+                    'Target.createBrowserContext', {'disposeOnDetach': True}
+                )['browserContextId']
+                new_handle = driver.execute_cdp_cmd(
+                    'Target.createTarget', {'url': 'about:blank', 'browserContextId': context_id}
+                )['targetId']
+                driver.switch_to.window(new_handle)
+                self._local.context_id = context_id
+            except Exception as e:
+                print(f"[INFO] Browser context tidak tersedia, memakai tab biasa: {e}")
+                new_handle = None
+        
+        if new_handle is None:
+            driver.switch_to.new_window('tab')
+            new_handle = driver.current_window_handle
+            self._local.context_id = None
+        
+        # Tutup halaman sebelumnya supaya hanya satu renderer halaman aktif
+        driver.switch_to.window(previous_handle)
+        driver.close()
+        driver.switch_to.window(new_handle)
+        if previous_context:
+            try:
+                driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': previous_context})
+            except Exception:
+                pass
+    
+    def _scrape_with_driver(self, driver, url: str, website_name: str) -> ScrapeResult:
+        """Scrape satu URL memakai driver yang sudah dibuat"""
+        # Injeksi session login yang sudah ada untuk website ini
+        session_applied = self.session_manager.apply(driver, url)
+        install_performance_observer(driver)
+        if self.observe_seconds > 0:
+            WebSocketMonitor.discard(driver)
+        
+        # Navigate to URL
+        print(f"[INFO] Loading page...")
+        driver.get(url)
+        
+        # Wait for page to load - wait for body element
+        WebDriverWait(driver, self.failure_policy.body_wait_timeout).until(
+            EC.presence_of_element_located((By.TAG_NAME, "body"))
+        )
+        print(f"[INFO] Page loaded, checking for auth/captcha...")
+        
+        # Handle auth (halaman download), memakai ulang session jika ada
+        if self.session_manager.requires_auth(url):
+            self._handle_auth(driver, url, session_applied)
+        
+        # Handle Grafana CAPTCHA / verification
+        if 'grafana' in url.lower():
+            self._handle_grafana_verification(driver)
+        
+        # Additional wait for dynamic content
+        print(f"[INFO] Waiting for JavaScript to render...")
+        time.sleep(8)  # Increased wait time for JS-heavy pages
+        
+        # Metrik performa sebelum scroll/interaksi (yang memicu request tambahan)
+        performance = self._collect_performance(driver)
+        
+        # More aggressive scrolling and interaction
+        print(f"[INFO] Scrolling and interacting...")
+        self._scroll_and_interact(driver)
+        
+        if self.browser_cache:
+            self.browser_cache.record_page(resource_cache_stats(driver))
+        
+        update_rate = websocket_stats = None
+        if self.observe_seconds > 0:
+            update_rate, websocket_stats = self._observe(driver)
+        
+        # Take screenshot
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_url = url.replace('https://', '').replace('http://', '').replace('/', '_').replace(':', '_')[:50]
+        screenshot_filename = f"{website_name}_{safe_url}_{timestamp}.png"
+        screenshot_path = os.path.join(self.screenshot_dir, screenshot_filename)
+        driver.save_screenshot(screenshot_path)
+        print(f"[INFO] Screenshot saved: {screenshot_path}")
+        element_screenshots = (
+            self._capture_element_screenshots(driver, screenshot_path)
+            if self.element_screenshots else None
+        )
+        
+        if self.extraction_mode == 'browser':
+            html_content, dom_analysis, js_libraries, websocket_detected = self._extract_in_browser(driver)
+        else:
             # Get HTML content after JavaScript execution
             html_content = driver.page_source
             soup = BeautifulSoup(html_content, 'html.parser')
             print(f"[INFO] HTML captured: {len(html_content)} characters")
             
-            # Take screenshot
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_url = url.replace('https://', '').replace('http://', '').replace('/', '_').replace(':', '_')[:50]
-            screenshot_filename = f"{website_name}_{safe_url}_{timestamp}.png"
-            screenshot_path = os.path.join(self.screenshot_dir, screenshot_filename)
-            driver.save_screenshot(screenshot_path)
-            print(f"[INFO] Screenshot saved: {screenshot_path}")
-            
             # Analisis DOM
             dom_analysis = self._analyze_dom(soup, html_content, driver)
             
@@ -141,144 +359,271 @@ class WebScraper:
             
             # Deteksi WebSocket
             websocket_detected = self._detect_websocket(html_content)
-            
-            result = {
-                'url': url,
-                'website_name': website_name,
-                'html': html_content,
-                'screenshot_path': screenshot_path,
-                'network_requests': [],  # Could be enhanced with browser logs
-                'console_logs': [],
-                'dom_elements': dom_analysis,
-                'javascript_libraries': js_libraries,
-                'websocket_detected': websocket_detected,
-                'timestamp': timestamp
-            }
-            
-            print(f"[SUCCESS] Selesai scraping {url}")
-            return result
-            
+        
+        result = ScrapeResult(
+            url=url,
+            website_name=website_name,
+            html=html_content,
+            screenshot_path=screenshot_path,
+            network_requests=[],  # Could be enhanced with browser logs
+            console_logs=[],
+            dom_elements=dom_analysis,
+            javascript_libraries=js_libraries,
+            websocket_detected=websocket_detected,
+            timestamp=timestamp,
+            element_screenshots=element_screenshots,
+            update_rate=update_rate,
+            websocket_stats=websocket_stats,
+            performance=performance
+        )
+        
+        print(f"[SUCCESS] Selesai scraping {url}")
+        return result
+    
+    def _collect_performance(self, driver) -> Optional[Dict[str, Any]]:
+        """Navigation/Paint Timing, LCP, long task dan ukuran resource (None jika gagal)"""
+        try:
+            metrics = performance_metrics(driver)
         except Exception as e:
-            print(f"[ERROR] Gagal scraping {url}: {str(e)}")
-            return {
-                'url': url,
-                'website_name': website_name,
-                'error': str(e),
-                'screenshot_path': None,
-                'network_requests': [],
-                'console_logs': [],
-                'dom_elements': {},
-                'javascript_libraries': [],
-                'websocket_detected': False
-            }
-        finally:
-            if driver:
-                driver.quit()
+            print(f"[WARNING] Metrik performa gagal diambil: {e}")
+            return None
+        print(f"[INFO] Performa: load {metrics.get('load_ms')} ms, LCP {metrics.get('largest_contentful_paint_ms')} ms, "
+              f"{metrics.get('request_count')} request, {(metrics.get('transfer_bytes') or 0) // 1024} KB")
+        return metrics
     
-    def _handle_auth(self, driver, username='admin', password='admin123'):
-        """Handle basic auth atau login form"""
+    def _observe(self, driver):
+        """
+        Jendela observasi: update DOM/canvas dan frame WebSocket selama observe_seconds
+        
+        Returns:
+            (update_rate atau None, statistik WebSocket atau None jika performance log
+            tidak tersedia)
+        """
+        monitor = WebSocketMonitor()
+        logging = monitor.drain(driver, in_window=False)
+        started = time.monotonic()
+        update_rate = self._measure_update_rate(driver)
+        if not logging or not monitor.drain(driver, in_window=True):
+            return update_rate, None
+        
+        websocket_stats = monitor.summary(time.monotonic() - started)
+        if websocket_stats['connections']:
+            print(f"[INFO] WebSocket: {websocket_stats['connections']} koneksi, "
+                  f"{websocket_stats['frames_received']} frame diterima "
+                  f"({websocket_stats['messages_per_second']}/detik)")
+        return update_rate, websocket_stats
+    
+    def _measure_update_rate(self, driver) -> Optional[Dict[str, Any]]:
+        """Ukur frekuensi update halaman selama observe_seconds (None jika gagal)"""
+        print(f"[INFO] Mengamati update selama {self.observe_seconds:g} detik...")
         try:
-            # Check if there's a login form
-            time.sleep(2)
-            
-            # Try to find username/password fields
-            username_selectors = [
-                "input[name='username']", "input[name='user']", "input[name='email']",
-                "input[type='text']", "input[id*='user']", "input[id*='login']"
-            ]
-            password_selectors = [
-                "input[name='password']", "input[type='password']", 
-                "input[id*='pass']", "input[id*='pwd']"
-            ]
-            
-            username_field = None
-            password_field = None
-            
-            # Find username field
-            for selector in username_selectors:
-                try:
-                    username_field = driver.find_element(By.CSS_SELECTOR, selector)
-                    if username_field.is_displayed():
-                        break
-                except:
-                    continue
-            
-            # Find password field
-            for selector in password_selectors:
-                try:
-                    password_field = driver.find_element(By.CSS_SELECTOR, selector)
-                    if password_field.is_displayed():
-                        break
-                except:
-                    continue
-            
-            if username_field and password_field:
-                print(f"[INFO] Login form detected, logging in...")
-                username_field.clear()
-                username_field.send_keys(username)
-                time.sleep(0.5)
-                
-                password_field.clear()
-                password_field.send_keys(password)
-                time.sleep(0.5)
+            update_rate = measure_update_rate(driver, seconds=self.observe_seconds)
+        except Exception as e:
+            print(f"[WARNING] Observasi update gagal: {e}")
+            return None
+        latency = update_rate.get('latency_ms')
+        print(f"[INFO] {update_rate.get('updates', 0)} update "
+              f"({update_rate.get('updates_per_second', 0)}/detik, {update_rate.get('canvas_changes', 0)} "
+              f"perubahan canvas)" + (f", latensi p50 {latency['p50']} ms" if latency else ""))
+        return update_rate
+    
+    def _capture_element_screenshots(self, driver, screenshot_path: str) -> Dict[str, str]:
+        """
+        Screenshot elemen bukti per capability (Page.captureScreenshot dengan clip)
+        
+        Elemen terbesar yang cocok dengan EVIDENCE_SELECTORS di-clip dari halaman
+        (termasuk di luar viewport). Returns dict capability -> path screenshot.
+        """
+        screenshots = {}
+        base = os.path.splitext(screenshot_path)[0]
+        try:
+            regions = evidence_regions(driver, self.EVIDENCE_SELECTORS)
+            for capability, region in regions.items():
+                clip = {
+                    'x': region['x'],
+                    'y': region['y'],
+                    'width': min(region['width'], self.EVIDENCE_MAX_SIZE[0]),
+                    'height': min(region['height'], self.EVIDENCE_MAX_SIZE[1]),
+                    'scale': 1
+                }
+                data = driver.execute_cdp_cmd('Page.captureScreenshot', {
+                    'format': 'png',
+                    'clip': clip,
+                    'captureBeyondViewport': True
+                })
+                path = f"{base}_{capability}.png"
+                with open(path, 'wb') as f:
+                    f.write(base64.b64decode(data['data']))
+                screenshots[capability] = path
+        except Exception as e:
+            print(f"[INFO] Screenshot elemen tidak lengkap: {e}")
+        if screenshots:
+            print(f"[INFO] Screenshot elemen: {', '.join(screenshots)}")
+        return screenshots
+    
+    def _handle_auth(self, driver, url: str, session_applied: bool = False):
+        """
+        Handle login form dengan session reuse
+        
+        Jika session dari SessionManager sudah diinjeksi dan form login tidak muncul,
+        tidak ada login. Jika form login tetap muncul, session dianggap kadaluarsa
+        dan login ulang dilakukan (sekali per website, lalu session di-export lagi).
+        """
+        sessions = self.session_manager
+        try:
+            if not self._login_form_visible(driver, timeout=2):
+                if session_applied:
+                    print(f"[INFO] Session masih valid, login dilewati")
+                return
+            
+            if session_applied:
+                print(f"[INFO] Session kadaluarsa, login ulang...")
+                sessions.invalidate(url)
+            
+            credentials = sessions.credentials_for(url)
+            if not credentials:
+                print(f"[WARNING] Login form terdeteksi, login dilewati: credential tidak dikonfigurasi "
+                      f"(atur credentials atau WEBCOMPARE_AUTH_USERNAME/WEBCOMPARE_AUTH_PASSWORD)")
+                return
+            
+            with sessions.login_lock(url):
+                # Worker lain mungkin sudah login selama kita menunggu lock
+                if not session_applied and sessions.apply(driver, url):
+                    driver.refresh()
+                    if not self._login_form_visible(driver, timeout=2):
+                        return
                 
-                # Find and click submit button
-                submit_selectors = [
-                    "button[type='submit']", "input[type='submit']",
-                    "button:contains('Login')", "button:contains('Sign')",
-                    "button", "input[value='Login']"
-                ]
+                self._submit_login(driver, *credentials)
                 
-                for selector in submit_selectors:
-                    try:
-                        submit_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                        if submit_btn.is_displayed():
-                            submit_btn.click()
-                            print(f"[INFO] Clicked login button, waiting...")
-                            time.sleep(3)
-                            break
-                    except:
-                        continue
+                if self._login_form_visible(driver, timeout=1):
+                    raise AuthenticationError(f"Login gagal untuk {url}")
                 
-                print(f"[SUCCESS] Login attempted")
+                sessions.capture(driver, url)
+                print(f"[SUCCESS] Login berhasil")
+        except AuthenticationError:
+            raise
         except Exception as e:
             print(f"[INFO] No login form found or already logged in: {e}")
     
+    # Scroll adaptif: lama halaman harus tenang (ms) dan batas total waktu scroll (detik)
+    SCROLL_QUIET_MS = 500
+    SCROLL_MAX_SECONDS = 30
+    
+    # Pattern library JavaScript (dipakai mode 'html' dan 'browser')
+    LIBRARY_PATTERNS = {
+        'Chart.js': r'chart\.js|chartjs',
+        'Highcharts': r'highcharts',
+        'ApexCharts': r'apexcharts',
+        'ECharts': r'echarts',
+        'D3.js': r'd3\.js|d3\.min\.js',
+        'Plotly': r'plotly',
+        'Google Charts': r'google.*charts|charts\.load',
+        'DataTables': r'datatables|dataTables',
+        'AG Grid': r'ag-grid',
+        'React': r'react\.js|react\.min\.js|react-dom',
+        'Vue.js': r'vue\.js|vue\.min\.js',
+        'Angular': r'angular\.js|angular\.min\.js',
+        'jQuery': r'jquery\.js|jquery\.min\.js',
+        'Axios': r'axios\.js|axios\.min\.js'
+    }
+    
+    # Elemen bukti per capability untuk screenshot elemen (capability tanpa elemen
+    # visual memakai screenshot viewport) dan ukuran clip maksimum (px)
+    EVIDENCE_SELECTORS = {
+        'output_grafik_chart': "canvas, svg, [class*='chart'], [class*='graph'], [class*='plot'], "
+                               ".highcharts-container, .apexcharts-canvas",
+        'output_data_tabel': "table, [role='grid'], [role='table'], .ag-root, .dataTables_wrapper",
+        'output_file': "a[download], a[href*='download' i], button[data-download], "
+                       "a[href$='.csv' i], a[href$='.xlsx' i], a[href$='.xls' i], a[href$='.pdf' i]",
+        'output_interaktif': "select, input[type='range'], input[type='date'], form"
+    }
+    EVIDENCE_MAX_SIZE = (1920, 1600)
+    
+    # Selector kandidat untuk probe (dievaluasi sekaligus di browser)
+    USERNAME_SELECTORS = [
+        "input[name='username']", "input[name='user']", "input[name='email']",
+        "input[type='text']", "input[id*='user']", "input[id*='login']"
+    ]
+    PASSWORD_SELECTORS = [
+        "input[name='password']", "input[type='password']",
+        "input[id*='pass']", "input[id*='pwd']"
+    ]
+    SUBMIT_SELECTORS = [
+        "button[type='submit']", "input[type='submit']",
+        "button", "input[value='Login']"
+    ]
+    VERIFY_SELECTORS = [
+        "//button[contains(text(), 'Verify')]",
+        "//button[contains(text(), 'verify')]",
+        "//div[@class='recaptcha-checkbox-border']",
+        "//span[contains(text(), 'not a robot')]"
+    ]
+    
+    def _login_form_visible(self, driver, timeout: float) -> bool:
+        """Tunggu (maks. timeout detik) sampai field password terlihat"""
+        def password_visible(d):
+            return probe(d, first={'password': ["input[type='password']"]})['first']['password'] is not None
+        try:
+            WebDriverWait(driver, timeout).until(password_visible)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _submit_login(self, driver, username: str, password: str):
+        """Isi dan submit form login"""
+        # Satu round-trip untuk semua selector username/password/submit
+        found = probe(driver, first={
+            'username': self.USERNAME_SELECTORS,
+            'password': self.PASSWORD_SELECTORS,
+            'submit': self.SUBMIT_SELECTORS
+        })['first']
+        
+        if not (found['username'] and found['password']):
+            return
+        
+        username_field = found['username']['element']
+        password_field = found['password']['element']
+        
+        print(f"[INFO] Login form detected, logging in...")
+        username_field.clear()
+        username_field.send_keys(username)
+        
+        password_field.clear()
+        password_field.send_keys(password)
+        
+        if found['submit']:
+            found['submit']['element'].click()
+            print(f"[INFO] Clicked login button, waiting...")
+        else:
+            password_field.submit()
+        
+        # Tunggu form login hilang (bukan sleep tetap)
+        try:
+            WebDriverWait(driver, 10).until(EC.staleness_of(password_field))
+        except TimeoutException:
+            pass
+    
     def _handle_grafana_verification(self, driver):
         """Handle Grafana CAPTCHA/verification"""
         try:
             print(f"[INFO] Checking for Grafana verification...")
             time.sleep(3)
             
-            # Look for iframe with CAPTCHA
-            try:
-                iframes = driver.find_elements(By.TAG_NAME, "iframe")
-                for iframe in iframes:
-                    if 'recaptcha' in iframe.get_attribute('src').lower() or 'captcha' in iframe.get_attribute('src').lower():
-                        print(f"[INFO] CAPTCHA detected, waiting longer...")
-                        time.sleep(10)
-                        break
-            except:
-                pass
+            # Iframe CAPTCHA dan tombol verifikasi diperiksa dalam satu probe
+            found = probe(driver, first={'verify': self.VERIFY_SELECTORS}, iframes=True)
             
-            # Try to find and click any "verify" or "I'm not a robot" buttons
-            verify_selectors = [
-                "//button[contains(text(), 'Verify')]",
-                "//button[contains(text(), 'verify')]",
-                "//div[@class='recaptcha-checkbox-border']",
-                "//span[contains(text(), 'not a robot')]"
-            ]
+            if any('captcha' in src.lower() for src in found['iframes']):
+                print(f"[INFO] CAPTCHA detected, waiting longer...")
+                time.sleep(10)
             
-            for selector in verify_selectors:
+            # Try to click any "verify" or "I'm not a robot" buttons
+            if found['first']['verify']:
                 try:
-                    element = driver.find_element(By.XPATH, selector)
-                    if element.is_displayed():
-                        print(f"[INFO] Found verification element, clicking...")
-                        element.click()
-                        time.sleep(5)
-                        break
-                except:
-                    continue
+                    print(f"[INFO] Found verification element, clicking...")
+                    found['first']['verify']['element'].click()
+                    time.sleep(5)
+                except Exception:
+                    pass
             
             # Wait longer for Grafana to load
             print(f"[INFO] Waiting for Grafana dashboard to fully load...")
@@ -288,60 +633,56 @@ class WebScraper:
             print(f"[INFO] Grafana verification handling: {e}")
     
     def _scroll_and_interact(self, driver):
-        """Aggressive scrolling and interaction to trigger all content"""
+        """Scroll adaptif (sampai lazy-load selesai) lalu interaksi untuk memicu konten"""
         try:
-            # Get page height
-            page_height = driver.execute_script("return document.body.scrollHeight")
-            
-            # Scroll down in multiple steps
-            scroll_steps = 10
-            for i in range(scroll_steps):
-                scroll_position = (page_height / scroll_steps) * (i + 1)
-                driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                time.sleep(0.5)
-            
-            # Scroll back to top
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            
-            # Scroll to bottom again
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            # Scroll per viewport, tunggu halaman tenang sebelum scroll berikutnya
+            try:
+                scroll = adaptive_scroll(
+                    driver,
+                    quiet_ms=self.SCROLL_QUIET_MS,
+                    max_seconds=self.SCROLL_MAX_SECONDS
+                )
+                print(f"[INFO] Scrolled {scroll['steps']} viewport(s) in {scroll['elapsed_ms']} ms "
+                      f"(height {scroll['height']}px, {scroll['new_requests']} new requests, "
+                      f"{scroll['lazy_elements']} lazy elements)")
+            except TimeoutException:
+                print(f"[INFO] Scroll adaptif melewati batas {self.SCROLL_MAX_SECONDS}s")
+            
+            # Status tombol (visible/enabled/text) dan elemen hover dalam satu probe
+            found = probe(driver, all={
+                'buttons': ("button", 5),  # Limit to first 5 buttons
+                'hoverable': ("canvas, svg, .chart, [data-tooltip]", 3)
+            })['all']
             
             # Try to click any visible buttons (for interactive content)
-            try:
-                buttons = driver.find_elements(By.TAG_NAME, "button")
-                clickable_count = 0
-                for button in buttons[:5]:  # Limit to first 5 buttons
-                    try:
-                        if button.is_displayed() and button.is_enabled():
-                            # Skip buttons with certain texts
-                            btn_text = button.text.lower()
-                            if any(skip in btn_text for skip in ['delete', 'remove', 'logout', 'close']):
-                                continue
-                            
-                            button.click()
-                            clickable_count += 1
-                            time.sleep(1)
-                    except:
-                        continue
-                
-                if clickable_count > 0:
-                    print(f"[INFO] Clicked {clickable_count} interactive elements")
-            except:
-                pass
+            clickable_count = 0
+            for button in found['buttons']:
+                if not (button['visible'] and button['enabled']):
+                    continue
+                # Skip buttons with certain texts
+                btn_text = button['text'].lower()
+                if any(skip in btn_text for skip in ['delete', 'remove', 'logout', 'close']):
+                    continue
+                try:
+                    button['element'].click()
+                    clickable_count += 1
+                    time.sleep(1)
+                except Exception:
+                    continue
+            
+            if clickable_count > 0:
+                print(f"[INFO] Clicked {clickable_count} interactive elements")
             
             # Hover over elements to trigger tooltips/popovers
             try:
                 from selenium.webdriver.common.action_chains import ActionChains
-                hoverable_elements = driver.find_elements(By.CSS_SELECTOR, "canvas, svg, .chart, [data-tooltip]")
-                for element in hoverable_elements[:3]:
+                for element in found['hoverable']:
                     try:
-                        ActionChains(driver).move_to_element(element).perform()
+                        ActionChains(driver).move_to_element(element['element']).perform()
                         time.sleep(0.5)
-                    except:
+                    except Exception:
                         continue
-            except:
+            except Exception:
                 pass
             
             # Scroll back to top for final screenshot
@@ -351,30 +692,60 @@ class WebScraper:
         except Exception as e:
             print(f"[INFO] Scroll and interact: {e}")
     
-    def _analyze_dom(self, soup: BeautifulSoup, html_content: str, driver=None) -> Dict[str, Any]:
+    def _extract_in_browser(self, driver):
+        """
+        Ekstraksi statistik DOM, library dan WebSocket di browser (tanpa transfer/parse page_source)
+        
+        Returns:
+            (html atau None, DomStats, libraries, websocket_detected)
+        """
+        extracted = extract_dom_stats(driver)
+        dom_analysis = DomStats.from_dict(extracted['dom'])
+        dom_analysis.fingerprint = structure_fingerprint(extracted.get('structure') or {})
+        print(f"[INFO] DOM stats extracted in browser "
+              f"({dom_analysis.canvas_count} canvas, {dom_analysis.svg_count} svg, {dom_analysis.table_count} table)")
+        
+        # Library dari src script, script inline dan global window
+        script_text = '\n'.join(extracted['script_srcs']) + '\n' + extracted['inline_scripts']
+        js_libraries = [
+            lib_name for lib_name, pattern in self.LIBRARY_PATTERNS.items()
+            if re.search(pattern, script_text, re.IGNORECASE)
+        ]
+        for lib_name in extracted['global_libraries']:
+            if lib_name not in js_libraries:
+                js_libraries.append(lib_name)
+        
+        websocket_detected = self._detect_websocket(extracted['inline_scripts'])
+        
+        html_content = None
+        if self.include_html:
+            html_content = driver.page_source
+            print(f"[INFO] HTML captured: {len(html_content)} characters")
+        
+        return html_content, dom_analysis, js_libraries, websocket_detected
+    
+    def _analyze_dom(self, soup: BeautifulSoup, html_content: str, driver=None) -> DomStats:
         """Analisis elemen DOM yang relevan untuk capability detection"""
         
-        result = {
-            'canvas_count': len(soup.find_all('canvas')),
-            'svg_count': len(soup.find_all('svg')),
-            'table_count': len(soup.find_all('table')),
-            'chart_containers': [],
-            'tables': [],
-            'download_elements': [],
-            'inputs': {
+        result = DomStats(
+            canvas_count=len(soup.find_all('canvas')),
+            svg_count=len(soup.find_all('svg')),
+            table_count=len(soup.find_all('table')),
+            inputs={
                 'select': len(soup.find_all('select')),
                 'checkbox': len(soup.find_all('input', {'type': 'checkbox'})),
                 'radio': len(soup.find_all('input', {'type': 'radio'})),
                 'range': len(soup.find_all('input', {'type': 'range'})),
                 'date': len(soup.find_all('input', {'type': 'date'}))
             },
-            'form_count': len(soup.find_all('form'))
-        }
+            form_count=len(soup.find_all('form')),
+            fingerprint=structure_fingerprint(soup_shingles(soup))
+        )
         
         # Deteksi chart containers (canvas dan svg)
         for canvas in soup.find_all('canvas')[:10]:  # Limit 10
             parent = canvas.parent
-            result['chart_containers'].append({
+            result.chart_containers.append({
                 'tag': 'canvas',
                 'id': canvas.get('id', ''),
                 'class': ' '.join(canvas.get('class', [])),
@@ -384,7 +755,7 @@ class WebScraper:
             })
         
         for svg in soup.find_all('svg')[:10]:  # Limit 10
-            result['chart_containers'].append({
+            result.chart_containers.append({
                 'tag': 'svg',
                 'id': svg.get('id', ''),
                 'class': ' '.join(svg.get('class', [])),
@@ -396,7 +767,7 @@ class WebScraper:
         for table in soup.find_all('table')[:20]:  # Limit 20
             rows = table.find_all('tr')
             if len(rows) > 1:
-                result['tables'].append({
+                result.tables.append({
                     'rows': len(rows),
                     'cols': len(table.find_all(['th', 'td'])),
                     'class': ' '.join(table.get('class', [])),
@@ -416,7 +787,7 @@ class WebScraper:
             if isinstance(selector_result, list):
                 for el in selector_result[:10]:  # Limit 10
                     if hasattr(el, 'name'):
-                        result['download_elements'].append({
+                        result.download_elements.append({
                             'tag': el.name,
                             'text': el.get_text()[:50].strip(),
                             'href': el.get('href', el.get('data-url', '')),
@@ -430,22 +801,7 @@ class WebScraper:
         detected = []
         
         # Pattern matching di HTML content
-        library_patterns = {
-            'Chart.js': r'chart\.js|chartjs',
-            'Highcharts': r'highcharts',
-            'ApexCharts': r'apexcharts',
-            'ECharts': r'echarts',
-            'D3.js': r'd3\.js|d3\.min\.js',
-            'Plotly': r'plotly',
-            'Google Charts': r'google.*charts|charts\.load',
-            'DataTables': r'datatables|dataTables',
-            'AG Grid': r'ag-grid',
-            'React': r'react\.js|react\.min\.js|react-dom',
-            'Vue.js': r'vue\.js|vue\.min\.js',
-            'Angular': r'angular\.js|angular\.min\.js',
-            'jQuery': r'jquery\.js|jquery\.min\.js',
-            'Axios': r'axios\.js|axios\.min\.js'
-        }
+        library_patterns = self.LIBRARY_PATTERNS
         
         for lib_name, pattern in library_patterns.items():
             if re.search(pattern, html_content, re.IGNORECASE):
@@ -479,11 +835,68 @@ class WebScraper:
         
         return False
     
-    def scrape_multiple_urls(self, urls: List[str], website_name: str) -> List[Dict[str, Any]]:
-        """Scrape multiple URLs secara sequential"""
-        results = []
-        for url in urls:
-            result = self.scrape_url(url, website_name)
-            results.append(result)
-            time.sleep(2)  # Delay antar request
+    def scrape_multiple_urls(
+        self,
+        urls: List[str],
+        website_name: str,
+        on_result: Callable[[int, ScrapeResult], None] = None
+    ) -> List[ScrapeResult]:
+        """
+        Scrape multiple URLs (sequential, atau paralel jika resource_governor.max_workers > 1)
+        
+        Pada mode paralel, browser baru hanya dibuka jika memori yang tersedia cukup
+        (lihat ResourceGovernor.slot). Jika browser_reuse aktif, URL dikelompokkan per
+        origin dan setiap kelompok memakai satu browser. Urutan hasil tetap sama dengan
+        urutan URL.
+        
+        Args:
+            urls: List URL
+            website_name: Nama website
+            on_result: Callback (index, result) yang dipanggil setelah setiap URL selesai,
+                misalnya untuk menulis checkpoint (tidak pernah dipanggil bersamaan)
+        """
+        governor = self.resource_governor
+        results: List[ScrapeResult] = [None] * len(urls)
+        callback_lock = threading.Lock()
+        
+        # Satu task = satu browser; tanpa reuse setiap URL adalah task sendiri
+        if self.browser_reuse:
+            groups: Dict[str, List[int]] = {}
+            for index, url in enumerate(urls):
+                groups.setdefault(get_origin(url), []).append(index)
+            tasks = list(groups.values())
+        else:
+            tasks = [[index] for index in range(len(urls))]
+        
+        def scrape(indices: List[int]):
+            with governor.slot():
+                self._local.reusing = bool(self.browser_reuse)
+                self._local.driver = None
+                try:
+                    for position, index in enumerate(indices):
+                        result = self.scrape_url(urls[index], website_name)
+                        results[index] = result
+                        if on_result:
+                            with callback_lock:
+                                on_result(index, result)
+                        if result.attempts and position < len(indices) - 1:
+                            time.sleep(2)  # Delay antar request ke website yang sama
+                finally:
+                    if self._local.driver is not None:
+                        self._quit_driver(self._local.driver)
+                    self._local.reusing = False
+                    self._local.driver = None
+        
+        if governor.max_workers == 1 or len(tasks) <= 1:
+            for position, indices in enumerate(tasks):
+                scrape(indices)
+                if results[indices[-1]].attempts and position < len(tasks) - 1:
+                    time.sleep(2)  # Delay antar request (tidak perlu jika host dilewati circuit breaker)
+        else:
+            with ThreadPoolExecutor(max_workers=governor.max_workers) as executor:
+                for future in [executor.submit(scrape, indices) for indices in tasks]:
+                    future.result()
+            print(f"[INFO] Resource browser: {governor.stats()}")
+        if self.browser_cache:
+            print(f"[INFO] Browser cache: {self.browser_cache.stats()}")
         return results
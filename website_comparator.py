@@ -4,37 +4,108 @@ Script utama untuk menjalankan perbandingan website
 """
 
 
-from typing import List
+from typing import List, Dict, Tuple
 import os
 from datetime import datetime
 
 from web_scraper import WebScraper
 from capability_analyzer import CapabilityAnalyzer
-from pdf_generator import PDFGenerator
+from report_renderers import RENDERERS, PDFReportRenderer, render_reports
+from url_sampler import plan_sample, SamplingPlan
+from result_models import ScrapeResult, CapabilityVerdict
+from result_store import ResultStore
+from change_detector import ChangeDetector
+from checkpoint import CheckpointManager
+from session_manager import SessionManager
+from failure_policy import FailurePolicy
+from resource_governor import ResourceGovernor
+from browser_cache import BrowserCache
+from job_queue import JobQueue
+from scrape_worker import DistributedScraper
 
 
 class WebsiteComparator:
     """Main class untuk menjalankan perbandingan website"""
     
-    def __init__(self, screenshot_dir: str = "screenshots", output_dir: str = "output"):
+    def __init__(
+        self,
+        screenshot_dir: str = "screenshots",
+        output_dir: str = "output",
+        store_path: str = None,
+        credentials: Dict[str, Tuple[str, str]] = None,
+        extraction_mode: str = 'html',
+        max_workers: int = 1,
+        browser_reuse: str = None,
+        cache_dir: str = None,
+        job_queue_path: str = None,
+        job_queue_journal_mode: str = 'WAL',
+        cache_size_mb: float = 500.0,
+        failure_policy: FailurePolicy = None,
+        report_workers: int = 1,
+        full_evidence: bool = True,
+        cluster_pages: bool = False,
+        observe_seconds: float = 0.0
+    ):
         """
         Initialize WebsiteComparator
         
         Args:
             screenshot_dir: Directory untuk menyimpan screenshots
             output_dir: Directory untuk menyimpan output PDF
+            store_path: Path database SQLite untuk riwayat hasil (optional)
+            credentials: Credential login per host, {'host' atau '*': (username, password)}
+                (optional, default dari environment WEBCOMPARE_AUTH_USERNAME/PASSWORD)
+            extraction_mode: 'html' atau 'browser' (statistik DOM dihitung di browser,
+                HTML lengkap tidak diambil)
+            max_workers: Maksimum browser paralel per website (dibatasi memori yang tersedia)
+            browser_reuse: None, 'tab' atau 'context' - URL dengan origin sama memakai
+                satu browser (lihat WebScraper)
+            cache_dir: Directory disk cache Chrome bersama untuk asset statis (optional)
+            job_queue_path: Database JobQueue (optional). Jika diisi, scraping dikerjakan
+                oleh worker (scrape_worker.py) di satu atau banyak host
+            job_queue_journal_mode: Journal mode database JobQueue; 'DELETE' jika
+                database ada di filesystem bersama (worker di beberapa host)
+            cache_size_mb: Batas ukuran disk cache bersama (MB)
+            failure_policy: Retry dan timeout scraping (optional, lihat FailurePolicy)
+            report_workers: Worker process untuk render section PDF secara paralel
+            full_evidence: Kumpulkan semua bukti untuk laporan; False = detektor berhenti
+                begitu verdict pasti (lebih cepat, daftar bukti bisa tidak lengkap)
+            cluster_pages: Halaman dengan struktur (template) sama memakai hasil detektor
+                struktural satu representative (lihat CapabilityAnalyzer.analyze_pages)
+            observe_seconds: Lama pengukuran update per halaman (mutasi DOM, perubahan
+                canvas, latensi data); 0 = real-time hanya dideteksi dari pola kode
         """
         self.screenshot_dir = screenshot_dir
         self.output_dir = output_dir
+        self.store = ResultStore(store_path) if store_path else None
+        self.change_detector = ChangeDetector()
         
         # Create directories
         os.makedirs(screenshot_dir, exist_ok=True)
         os.makedirs(output_dir, exist_ok=True)
         
         # Initialize modules
-        self.scraper = WebScraper(screenshot_dir=screenshot_dir)
-        self.analyzer = CapabilityAnalyzer()
-        self.pdf_generator = PDFGenerator()
+        if job_queue_path:
+            # Scraping dikerjakan worker; opsi browser diatur di sisi worker
+            self.scraper = DistributedScraper(
+                JobQueue(job_queue_path, journal_mode=job_queue_journal_mode),
+                screenshot_dir=screenshot_dir
+            )
+        else:
+            self.scraper = WebScraper(
+                screenshot_dir=screenshot_dir,
+                failure_policy=failure_policy,
+                session_manager=SessionManager(credentials) if credentials else None,
+                extraction_mode=extraction_mode,
+                resource_governor=ResourceGovernor(max_workers=max_workers),
+                browser_reuse=browser_reuse,
+                browser_cache=BrowserCache(cache_dir, cache_size_mb) if cache_dir else None,
+                observe_seconds=observe_seconds
+            )
+        self.analyzer = CapabilityAnalyzer(full_evidence=full_evidence)
+        self.cluster_pages = cluster_pages
+        self.renderers = {fmt: renderer() for fmt, renderer in RENDERERS.items()}
+        self.renderers['pdf'] = PDFReportRenderer(workers=report_workers)
     
     def compare(
         self,
@@ -42,7 +113,11 @@ class WebsiteComparator:
         website_b_urls: List[str],
         website_a_name: str = "Website A",
         website_b_name: str = "Website B",
-        output_pdf: str = None
+        output_pdf: str = None,
+        incremental: bool = False,
+        checkpoint_dir: str = None,
+        formats: List[str] = ('pdf',),
+        sample_per_group: int = None
     ):
         """
         Jalankan perbandingan lengkap antara dua website
@@ -53,8 +128,22 @@ class WebsiteComparator:
             website_a_name: Nama Website A (optional)
             website_b_name: Nama Website B (optional)
             output_pdf: Path output PDF (optional, akan auto-generate jika tidak diisi)
+            incremental: Hanya scrape ulang URL yang kontennya berubah sejak run
+                sebelumnya (membutuhkan store_path)
+            checkpoint_dir: Directory checkpoint (optional). Progres ditulis setelah
+                setiap URL dan setiap stage; lanjutkan job yang terputus dengan resume()
+            formats: Format laporan ('pdf', 'json', 'html'); path format lain mengikuti
+                output_pdf dengan ekstensi berbeda. Tanpa 'pdf', PDF bisa dibuat nanti
+                dari store dengan regenerate_report()
+            sample_per_group: Mode sampling untuk daftar URL yang sangat besar (optional).
+                URL dikelompokkan per template path dan hanya sejumlah ini per grup yang
+                di-scrape; jumlah URL per capability diestimasi dengan interval 95%
         """
         
+        if incremental and not self.store:
+            raise ValueError("Mode incremental membutuhkan store_path")
+        formats = list(formats)
+        
         print("=" * 70)
         print("WEBSITE OUTPUT CAPABILITY COMPARISON")
         print("=" * 70)
@@ -62,54 +151,137 @@ class WebsiteComparator:
         print(f"{website_b_name}: {len(website_b_urls)} URLs")
         print("\n" + "=" * 70)
         
+        checkpoint = CheckpointManager(checkpoint_dir) if checkpoint_dir else None
+        job = {
+            'website_a_urls': list(website_a_urls),
+            'website_b_urls': list(website_b_urls),
+            'website_a_name': website_a_name,
+            'website_b_name': website_b_name,
+            'incremental': incremental,
+            'sample_per_group': sample_per_group
+        }
+        saved_job = checkpoint.load_job() if checkpoint else None
+        
+        if saved_job:
+            if any(saved_job.get(key) != value for key, value in job.items()):
+                raise ValueError(f"Checkpoint {checkpoint_dir} berisi job yang berbeda")
+            print(f"[INFO] Melanjutkan job dari checkpoint {checkpoint_dir}")
+            output_pdf = output_pdf or saved_job['output_pdf']
+            run_id = saved_job['run_id']
+        else:
+            if output_pdf is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_pdf = os.path.join(
+                    self.output_dir,
+                    f"comparison_{website_a_name}_{website_b_name}_{timestamp}.pdf"
+                )
+            
+            run_id = None
+            if self.store:
+                run_id = self.store.start_run(
+                    label=f"{website_a_name} vs {website_b_name}",
+                    meta={
+                        'website_a_name': website_a_name,
+                        'website_b_name': website_b_name,
+                        'website_a_urls': list(website_a_urls),
+                        'website_b_urls': list(website_b_urls)
+                    }
+                )
+            
+            if checkpoint:
+                checkpoint.save_job(dict(job, output_pdf=output_pdf, run_id=run_id, formats=formats))
+        
+        # Sampling berstrata (deterministik, sama saat resume)
+        sampling_a = sampling_b = None
+        if sample_per_group:
+            sampling_a = plan_sample(website_a_urls, sample_per_group)
+            sampling_b = plan_sample(website_b_urls, sample_per_group)
+            for name, plan in ((website_a_name, sampling_a), (website_b_name, sampling_b)):
+                print(f"[INFO] Sampling {name}: {len(plan.urls)} dari {plan.total_urls} URL "
+                      f"({len(plan.groups)} template)")
+            website_a_urls, website_b_urls = sampling_a.urls, sampling_b.urls
+            if self.store:
+                # Disimpan supaya regenerate_report tetap bisa menghitung estimasi cakupan
+                self.store.save_sampling(run_id, {
+                    website_a_name: sampling_a.to_dict(),
+                    website_b_name: sampling_b.to_dict()
+                })
+        
         # Step 1: Scrape Website A
         print(f"\n[STEP 1/5] Scraping {website_a_name}...")
         print("-" * 70)
-        website_a_data = self.scraper.scrape_multiple_urls(website_a_urls, website_a_name)
+        website_a_data, website_a_reused = self._scrape_site(
+            website_a_urls, website_a_name, incremental, checkpoint
+        )
         print(f"[DONE] Scraped {len(website_a_data)} pages from {website_a_name}")
         
         # Step 2: Scrape Website B
         print(f"\n[STEP 2/5] Scraping {website_b_name}...")
         print("-" * 70)
-        website_b_data = self.scraper.scrape_multiple_urls(website_b_urls, website_b_name)
+        website_b_data, website_b_reused = self._scrape_site(
+            website_b_urls, website_b_name, incremental, checkpoint
+        )
         print(f"[DONE] Scraped {len(website_b_data)} pages from {website_b_name}")
         
         # Step 3: Analyze capabilities for Website A
         print(f"\n[STEP 3/5] Analyzing capabilities for {website_a_name}...")
         print("-" * 70)
-        website_a_capabilities = self.analyzer.aggregate_website_capabilities(website_a_data)
+        website_a_analyses = self._analyze_site(website_a_name, website_a_data, website_a_reused, checkpoint)
+        website_a_capabilities = self.analyzer.aggregate_website_capabilities(
+            website_a_data, website_a_analyses, sampling=sampling_a
+        )
         self._print_capability_summary(website_a_name, website_a_capabilities)
         
         # Step 4: Analyze capabilities for Website B
         print(f"\n[STEP 4/5] Analyzing capabilities for {website_b_name}...")
         print("-" * 70)
-        website_b_capabilities = self.analyzer.aggregate_website_capabilities(website_b_data)
+        website_b_analyses = self._analyze_site(website_b_name, website_b_data, website_b_reused, checkpoint)
+        website_b_capabilities = self.analyzer.aggregate_website_capabilities(
+            website_b_data, website_b_analyses, sampling=sampling_b
+        )
         self._print_capability_summary(website_b_name, website_b_capabilities)
         
-        # Step 5: Generate PDF report
-        print(f"\n[STEP 5/5] Generating PDF report...")
+        if self.store:
+            self.store.save_site_results(run_id, website_a_name, website_a_data, website_a_analyses, replace=True)
+            self.store.save_site_results(run_id, website_b_name, website_b_data, website_b_analyses, replace=True)
+            print(f"[INFO] Results stored (run #{run_id})")
+        
+        # Step 5: Generate reports
+        print(f"\n[STEP 5/5] Generating reports ({', '.join(formats)})...")
         print("-" * 70)
         
-        if output_pdf is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_pdf = os.path.join(
-                self.output_dir,
-                f"comparison_{website_a_name}_{website_b_name}_{timestamp}.pdf"
+        output_base = os.path.splitext(output_pdf)[0]
+        reports = checkpoint.stage_data('report') if checkpoint else None
+        if reports and all(
+            report_format in reports and os.path.exists(reports[report_format])
+            and os.path.splitext(reports[report_format])[0] == output_base
+            for report_format in formats
+        ):
+            print("[INFO] Checkpoint: laporan sudah dibuat, render dilewati")
+            reports = {report_format: reports[report_format] for report_format in formats}
+        else:
+            performance = {
+                'website_a': self.analyzer.aggregate_performance(website_a_data),
+                'website_b': self.analyzer.aggregate_performance(website_b_data)
+            }
+            reports = render_reports(
+                formats, output_base,
+                website_a_name, website_b_name,
+                website_a_capabilities, website_b_capabilities,
+                run_id=run_id, renderers=self.renderers, performance=performance
             )
+            if checkpoint:
+                checkpoint.mark_complete('report', reports)
         
-        self.pdf_generator.generate_report(
-            website_a_name=website_a_name,
-            website_b_name=website_b_name,
-            website_a_capabilities=website_a_capabilities,
-            website_b_capabilities=website_b_capabilities,
-            output_path=output_pdf
-        )
+        if self.store:
+            self.store.finish_run(run_id)
         
         # Final summary
         print("\n" + "=" * 70)
         print("COMPARISON COMPLETE!")
         print("=" * 70)
-        print(f"\nPDF Report: {output_pdf}")
+        for report_format, path in reports.items():
+            print(f"\n{report_format.upper()} Report: {path}")
         print(f"Screenshots: {self.screenshot_dir}/")
         print("\n" + "=" * 70)
         
@@ -118,9 +290,198 @@ class WebsiteComparator:
             'website_b_name': website_b_name,
             'website_a_capabilities': website_a_capabilities,
             'website_b_capabilities': website_b_capabilities,
-            'pdf_path': output_pdf,
-            'screenshot_dir': self.screenshot_dir
+            'pdf_path': reports.get('pdf'),
+            'reports': reports,
+            'screenshot_dir': self.screenshot_dir,
+            'run_id': run_id
+        }
+    
+    def resume(self, checkpoint_dir: str):
+        """
+        Lanjutkan perbandingan yang terputus dari checkpoint
+        
+        URL yang sudah berhasil di-scrape dan stage yang sudah selesai tidak diulang.
+        
+        Args:
+            checkpoint_dir: Directory checkpoint yang dipakai saat compare()
+        """
+        job = CheckpointManager(checkpoint_dir).load_job()
+        if job is None:
+            raise ValueError(f"Checkpoint tidak ditemukan: {checkpoint_dir}")
+        
+        return self.compare(
+            website_a_urls=job['website_a_urls'],
+            website_b_urls=job['website_b_urls'],
+            website_a_name=job['website_a_name'],
+            website_b_name=job['website_b_name'],
+            output_pdf=job['output_pdf'],
+            incremental=job['incremental'],
+            checkpoint_dir=checkpoint_dir,
+            formats=job.get('formats', ['pdf']),
+            sample_per_group=job.get('sample_per_group')
+        )
+    
+    def _scrape_site(
+        self,
+        urls: List[str],
+        website_name: str,
+        incremental: bool,
+        checkpoint: CheckpointManager = None
+    ) -> Tuple[List[ScrapeResult], Dict[int, Dict[str, CapabilityVerdict]]]:
+        """
+        Scrape semua URL satu website
+        
+        URL yang sudah berhasil di checkpoint tidak di-scrape ulang. Pada mode
+        incremental, URL yang tidak berubah (menurut ChangeDetector) juga tidak
+        dibuka di browser; hasil scraping dan verdict terakhirnya diambil dari store.
+        
+        Returns:
+            (hasil scraping sesuai urutan urls, dict index -> verdict yang dipakai ulang)
+        """
+        results: List[ScrapeResult] = [None] * len(urls)
+        reused: Dict[int, Dict[str, CapabilityVerdict]] = {}
+        
+        if checkpoint:
+            for index, (result, verdicts) in checkpoint.load_pages(website_name).items():
+                results[index] = result
+                if verdicts is not None:
+                    reused[index] = verdicts
+            done = sum(1 for result in results if result is not None)
+            if done:
+                print(f"[INFO] Checkpoint: {done} URL sudah selesai, dilewati")
+        
+        to_scrape = [index for index, result in enumerate(results) if result is None]
+        validators = {}
+        
+        if checkpoint and to_scrape:
+            # Halaman baru membatalkan analisis dan laporan di checkpoint; cukup sekali,
+            # sebelum halaman pertama disimpan
+            checkpoint.invalidate(f"analysis:{website_name}", 'report')
+        
+        if incremental:
+            pending = []
+            for index in to_scrape:
+                url = urls[index]
+                changed, validators[url] = self.change_detector.check(url, self.store.get_validators(url))
+                previous = None if changed else self.store.load_latest_page(url, website_name)
+                if previous is None:
+                    pending.append(index)
+                    continue
+                results[index], reused[index] = previous
+                if checkpoint:
+                    checkpoint.save_page(website_name, index, results[index], reused[index])
+            print(f"[INFO] Incremental: {len(to_scrape) - len(pending)} URL tidak berubah, "
+                  f"{len(pending)} URL di-scrape ulang")
+            to_scrape = pending
+        
+        def on_result(position: int, result: ScrapeResult):
+            index = to_scrape[position]
+            results[index] = result
+            if checkpoint:
+                checkpoint.save_page(website_name, index, result)
+            if 'error' in result:
+                # Jangan simpan validator, supaya URL ini dicek ulang pada run berikutnya
+                validators.pop(urls[index], None)
+        
+        self.scraper.scrape_multiple_urls([urls[i] for i in to_scrape], website_name, on_result=on_result)
+        
+        if incremental:
+            self.store.save_validators(validators)
+        if checkpoint:
+            checkpoint.mark_complete(f"scrape:{website_name}")
+        return results, reused
+    
+    def _analyze_site(
+        self,
+        website_name: str,
+        data: List[ScrapeResult],
+        reused: Dict[int, Dict[str, CapabilityVerdict]],
+        checkpoint: CheckpointManager = None
+    ) -> List[Dict[str, CapabilityVerdict]]:
+        """Analisis capability per URL, kecuali URL yang verdict-nya dipakai ulang"""
+        if checkpoint:
+            analyses = checkpoint.load_analyses(website_name)
+            if analyses is not None:
+                return analyses
+        
+        pending = [index for index in range(len(data)) if index not in reused]
+        fresh = dict(zip(pending, self.analyzer.analyze_pages(
+            [data[index] for index in pending], cluster=self.cluster_pages
+        )))
+        stats = self.analyzer.cluster_stats if self.cluster_pages else None
+        if stats and stats['shared']:
+            print(f"[INFO] {stats['pages']} halaman dalam {stats['clusters']} cluster struktur "
+                  f"({stats['shared']} halaman memakai hasil detektor struktural representative)")
+        analyses = [reused[index] if index in reused else fresh[index] for index in range(len(data))]
+        
+        if checkpoint:
+            checkpoint.save_analyses(website_name, analyses)
+        return analyses
+    
+    def regenerate_report(self, run_id: int = None, output_pdf: str = None, formats: List[str] = ('pdf',)):
+        """
+        Buat ulang laporan dari hasil yang tersimpan di store (tanpa scraping ulang)
+        
+        Args:
+            run_id: Run yang dipakai (default: run terakhir yang selesai)
+            output_pdf: Path output PDF (optional, format lain memakai ekstensi berbeda)
+            formats: Format laporan ('pdf', 'json', 'html')
+        
+        Returns:
+            Dict format -> path laporan
+        """
+        if not self.store:
+            raise ValueError("regenerate_report membutuhkan store_path")
+        
+        if run_id is None:
+            run_id = self.store.latest_run_id()
+        run = self.store.get_run(run_id) if run_id is not None else None
+        if run is None:
+            raise ValueError(f"Run tidak ditemukan: {run_id}")
+        
+        website_a_name = run['meta']['website_a_name']
+        website_b_name = run['meta']['website_b_name']
+        
+        capabilities = {}
+        site_performance = {}
+        for name in (website_a_name, website_b_name):
+            verdicts, total_urls = self.store.load_verdicts(run_id, name)
+            scrape_results = self.store.load_scrape_results(run_id, name)
+            capabilities[name] = self.analyzer.aggregate_verdicts(verdicts, total_urls)
+            site_performance[name] = self.analyzer.aggregate_performance(scrape_results)
+            
+            sampling = (run['sampling'] or {}).get(name)
+            if sampling:
+                plan = SamplingPlan.from_dict(sampling)
+                if [result.url for result in scrape_results] == plan.urls:
+                    # Verdict per halaman (urutan sama dengan scrape_results) untuk estimasi cakupan
+                    page_verdicts = {}
+                    for capability, items in verdicts.items():
+                        for verdict in items:
+                            page_verdicts.setdefault(verdict.url, {})[capability] = verdict
+                    analyses = [page_verdicts.get(result.url, {}) for result in scrape_results]
+                    self.analyzer.extrapolate(capabilities[name], scrape_results, analyses, plan)
+                else:
+                    print(f"[WARNING] Halaman tersimpan {name} tidak sesuai rencana sampling, "
+                          f"estimasi cakupan dilewati")
+        performance = {
+            'website_a': site_performance[website_a_name],
+            'website_b': site_performance[website_b_name]
         }
+        
+        if output_pdf is None:
+            output_pdf = os.path.join(
+                self.output_dir,
+                f"comparison_{website_a_name}_{website_b_name}_run{run_id}.pdf"
+            )
+        
+        reports = render_reports(
+            list(formats), os.path.splitext(output_pdf)[0],
+            website_a_name, website_b_name,
+            capabilities[website_a_name], capabilities[website_b_name],
+            run_id=run_id, renderers=self.renderers, performance=performance
+        )
+        return reports
     
     def _print_capability_summary(self, website_name: str, capabilities: dict):
         """Print capability summary to console"""
@@ -148,6 +509,9 @@ class WebsiteComparator:
             
             if supported:
                 status_text += f" (Confidence: {confidence}, Found in {url_count} URL(s))"
+            if data.get('estimated_url_count') is not None:
+                low, high = data['estimated_url_range']
+                status_text += f" [estimasi {data['estimated_url_count']} dari {data['total_urls']} URL, 95%: {low}-{high}]"
             
             print(status_text)
 
@@ -158,7 +522,16 @@ def compare_websites(
     website_b_urls: List[str],
     website_a_name: str = "Website A",
     website_b_name: str = "Website B",
-    output_pdf: str = None
+    output_pdf: str = None,
+    store_path: str = None,
+    incremental: bool = False,
+    checkpoint_dir: str = None,
+    formats: List[str] = ('pdf',),
+    extraction_mode: str = 'html',
+    max_workers: int = 1,
+    browser_reuse: str = None,
+    cache_dir: str = None,
+    job_queue_path: str = None
 ):
     """
     Convenience function untuk menjalankan perbandingan
@@ -169,21 +542,56 @@ def compare_websites(
         website_a_name: Nama Website A
         website_b_name: Nama Website B
         output_pdf: Path output PDF (optional)
+        store_path: Path database SQLite untuk riwayat hasil (optional)
+        incremental: Hanya scrape ulang URL yang berubah (membutuhkan store_path)
+        checkpoint_dir: Directory checkpoint untuk resume (optional)
+        formats: Format laporan ('pdf', 'json', 'html')
+        extraction_mode: 'html' atau 'browser' (lihat WebScraper)
+        max_workers: Maksimum browser paralel (lihat ResourceGovernor)
+        browser_reuse: None, 'tab' atau 'context' (lihat WebScraper)
+        cache_dir: Directory disk cache Chrome bersama (optional, lihat BrowserCache)
+        job_queue_path: Database JobQueue untuk mode coordinator/worker (optional)
     
     Returns:
         Dict dengan hasil perbandingan dan path ke PDF
     """
     
-    comparator = WebsiteComparator()
+    comparator = WebsiteComparator(
+        store_path=store_path,
+        extraction_mode=extraction_mode,
+        max_workers=max_workers,
+        browser_reuse=browser_reuse,
+        cache_dir=cache_dir,
+        job_queue_path=job_queue_path
+    )
     return comparator.compare(
         website_a_urls=website_a_urls,
         website_b_urls=website_b_urls,
         website_a_name=website_a_name,
         website_b_name=website_b_name,
-        output_pdf=output_pdf
+        output_pdf=output_pdf,
+        incremental=incremental,
+        checkpoint_dir=checkpoint_dir,
+        formats=formats
     )
 
 
+def resume_comparison(checkpoint_dir: str, store_path: str = None):
+    """
+    Convenience function untuk melanjutkan perbandingan yang terputus
+    
+    Args:
+        checkpoint_dir: Directory checkpoint dari compare_websites(checkpoint_dir=...)
+        store_path: Path database SQLite yang dipakai job semula (optional)
+    
+    Returns:
+        Dict dengan hasil perbandingan dan path ke PDF
+    """
+    
+    comparator = WebsiteComparator(store_path=store_path)
+    return comparator.resume(checkpoint_dir)
+
+
 if __name__ == "__main__":
     # Example usage
     print("Website Comparator")
@@ -0,0 +1,143 @@
+"""
+WebSocket Monitor Module
+Statistik frame WebSocket dari event CDP Network (performance log ChromeDriver):
+jumlah koneksi, laju pesan, distribusi ukuran payload dan contoh frame
+"""
+
+from typing import Any, Dict
+from collections import deque
+import json
+
+from capability_analyzer import percentile
+
+
+# Event CDP yang diproses (event Network lain di performance log diabaikan)
+WEBSOCKET_EVENTS = (
+    'Network.webSocketCreated',
+    'Network.webSocketFrameReceived',
+    'Network.webSocketFrameSent',
+    'Network.webSocketClosed',
+)
+
+# Capability ChromeDriver untuk mengaktifkan performance log (event CDP Network)
+LOGGING_PREFS = {'performance': 'ALL'}
+
+
+def _payload_size(response: Dict[str, Any]) -> int:
+    """Ukuran payload frame (byte); frame biner (opcode 2) dikirim CDP sebagai base64"""
+    data = response.get('payloadData') or ''
+    if response.get('opcode') == 2:
+        return len(data) * 3 // 4
+    return len(data.encode('utf-8'))
+
+
+class WebSocketMonitor:
+    """
+    Kumpulkan event WebSocket dari performance log selama jendela observasi
+
+    Log dibaca (dan dikosongkan ChromeDriver) dengan ``drain``: panggilan sebelum
+    jendela mencatat koneksi yang sudah dibuka sejak halaman dimuat, panggilan
+    sesudahnya mencatat frame di dalam jendela. Semua buffer dibatasi: contoh frame
+    di ring buffer ``max_samples`` dan ukuran payload ``max_sizes`` frame terakhir.
+    """
+
+    def __init__(self, max_samples: int = 20, max_sizes: int = 10000, max_payload_chars: int = 200):
+        """
+        Args:
+            max_samples: Jumlah contoh frame terakhir yang disimpan
+            max_sizes: Jumlah ukuran payload terakhir untuk distribusi ukuran
+            max_payload_chars: Panjang maksimum payload di contoh frame
+        """
+        self.max_payload_chars = max_payload_chars
+        self.connections: Dict[str, str] = {}
+        self.closed = 0
+        self.samples = deque(maxlen=max_samples)
+        self.sizes = deque(maxlen=max_sizes)
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.bytes_received = 0
+        self.frames_before_window = 0
+
+    @staticmethod
+    def discard(driver):
+        """Buang isi performance log (event halaman sebelumnya di browser yang sama)"""
+        try:
+            driver.get_log('performance')
+        except Exception:
+            pass
+
+    def drain(self, driver, in_window: bool) -> bool:
+        """
+        Baca performance log dan proses event WebSocket
+
+        Returns:
+            False jika performance log tidak tersedia (driver tanpa LOGGING_PREFS)
+        """
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return False
+        for entry in entries:
+            message = entry.get('message', '')
+            # Filter murah sebelum parse JSON (sebagian besar event bukan WebSocket)
+            if 'Network.webSocket' not in message:
+                continue
+            try:
+                event = json.loads(message)['message']
+            except (ValueError, KeyError):
+                continue
+            self.process(event.get('method'), event.get('params', {}), in_window)
+        return True
+
+    def process(self, method: str, params: Dict[str, Any], in_window: bool = True):
+        """Proses satu event CDP"""
+        if method == 'Network.webSocketCreated':
+            self.connections[params.get('requestId')] = params.get('url', '')
+        elif method == 'Network.webSocketClosed':
+            self.closed += 1
+        elif method == 'Network.webSocketFrameReceived':
+            if not in_window:
+                self.frames_before_window += 1
+                return
+            response = params.get('response', {})
+            size = _payload_size(response)
+            self.frames_received += 1
+            self.bytes_received += size
+            self.sizes.append(size)
+            self.samples.append({
+                'url': self.connections.get(params.get('requestId'), ''),
+                'timestamp': params.get('timestamp'),
+                'opcode': response.get('opcode'),
+                'size': size,
+                'payload': (response.get('payloadData') or '')[:self.max_payload_chars]
+            })
+        elif method == 'Network.webSocketFrameSent' and in_window:
+            self.frames_sent += 1
+
+    def summary(self, window_seconds: float) -> Dict[str, Any]:
+        """
+        Statistik WebSocket jendela observasi
+
+        Returns:
+            Dict connections, urls, closed, frames_received, frames_sent,
+            messages_per_second, bytes_received, payload_bytes ({p50, p95, max} atau
+            None), frames_before_window, window_seconds, samples
+        """
+        sizes = sorted(self.sizes)
+        return {
+            'connections': len(self.connections),
+            'urls': sorted(set(self.connections.values()))[:5],
+            'closed': self.closed,
+            'frames_received': self.frames_received,
+            'frames_sent': self.frames_sent,
+            'messages_per_second': round(self.frames_received / window_seconds, 2) if window_seconds > 0 else 0,
+            'bytes_received': self.bytes_received,
+            'payload_bytes': {
+                'p50': round(percentile(sizes, 50)),
+                'p95': round(percentile(sizes, 95)),
+                'max': sizes[-1]
+            } if sizes else None,
+            'frames_before_window': self.frames_before_window,
+            'window_seconds': round(window_seconds, 1),
+            'samples': list(self.samples)
+        }